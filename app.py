@@ -1,32 +1,56 @@
-from typing import List
+import time
+from threading import Lock
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import streamlit as st
-from utils.beam import Beam
-from utils.model import Model
-from utils.support import Support, SupportTypes
-from utils.load import Load, LoadTypes
-
-
-def add_supports(model_supports: List[dict]):
-    assert "beam" in st.session_state
-    for support in model_supports:
-        st.session_state.beam.add_support(Support(
-            position=support["position"],
-            category=SupportTypes(support["type"])
-        ))
-        
-    return
-
-def add_loads(loads: List[dict]):
-    assert "beam" in st.session_state
-    for load in loads:
-        st.session_state.beam.add_load(Load(
-            magnitude=load["magnitude"],
-            category=LoadTypes(load["type"]),
-            start=load["start"],
-            end=load["end"]
-        ))
-        
-    return
+from utils.cache import get_beam_key
+from utils.jobs import solve_report
+from utils.schema import beam_from_dict
+
+WORKERS = 4
+MAX_REPORTS = 256
+
+
+@st.cache_resource
+def get_executor():
+    return ProcessPoolExecutor(max_workers=WORKERS)
+
+
+@st.cache_resource
+def get_reports():
+    """
+    Report futures shared by every session, keyed by the beam configuration.
+    """
+    return OrderedDict(), Lock()
+
+
+def get_definition():
+    return {
+        "L": st.session_state.beam_length,
+        "supports": st.session_state.supports,
+        "loads": st.session_state.loads
+    }
+
+
+def submit_report(definition: dict):
+    """
+    Returns the future of the report for `definition`; identical configurations
+    (from any session) share one solve.
+    """
+    key = get_beam_key(beam_from_dict(definition))
+    reports, lock = get_reports()
+
+    with lock:
+        future = reports.get(key)
+        if future is None or (future.done() and future.exception() is not None):
+            future = get_executor().submit(solve_report, definition)
+            reports[key] = future
+
+        reports.move_to_end(key)
+        while len(reports) > MAX_REPORTS:
+            reports.popitem(last=False)
+
+    return future
 
 def main():
     st.title("Structural Modeling by Descontinuous Functions")
@@ -43,7 +67,7 @@ def main():
         fixed_beam = st.checkbox("Is beam fixed at position 0.0?", value=True)
         beam_submit_button = st.form_submit_button(
             label="Submit",
-            on_click=lambda: st.session_state.update({"beam": Beam(L=beam_length)})
+            on_click=lambda: st.session_state.update({"beam_length": beam_length})
         )
         
     if beam_submit_button:
@@ -98,16 +122,24 @@ def main():
         report_submit_button = cols_rep[1].form_submit_button("Generate!")
         
     if report_submit_button:
-        add_supports(st.session_state.supports)
-        add_loads(st.session_state.loads)
-        model = Model(st.session_state.beam, app=True)
-        # is app=True -> mudar diretorios de imagens
-            
-        with st.spinner("Doing some math..."):
-            model.solve()
-        
-        with open(model.writer.file, "r") as f:
-            st.markdown(f.read(), unsafe_allow_html=True)
+        assert "beam_length" in st.session_state
+        try:
+            future = submit_report(get_definition())
+        except AssertionError as error:
+            st.error(str(error))
+            st.stop()
+
+        progress = st.empty()
+        start = time.time()
+        while not future.done():
+            progress.info(f"Doing some math... {time.time() - start:.1f}s")
+            time.sleep(0.2)
+        progress.empty()
+
+        if future.exception() is not None:
+            st.error(f"Could not solve the beam: {future.exception()}")
+        else:
+            st.markdown(future.result(), unsafe_allow_html=True)
             
     # st.stop()
     
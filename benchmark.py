@@ -0,0 +1,309 @@
+"""
+Benchmarks of the hot paths: `Model.__init__`, `Model.solve`, the diagrams,
+`Writer` output and `Plot.plot_model`, each scaled over beam length, number of
+loads, load-category mix and support configuration (one factor at a time
+around a base case), plus the startup time of fresh interpreters on the
+compute path.
+
+    python benchmark.py --output results.json
+    python benchmark.py --quick --compare results.json --threshold 1.25
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tempfile
+import contextlib
+from datetime import datetime
+from statistics import median
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import sympy as sym
+
+from utils.model import Model
+from utils.beam import Beam
+from utils.load import Load, LoadTypes
+from utils.support import Support, SupportTypes
+from utils.plot_beam import Plot
+from utils.write_report import FileSink
+from utils.continuous import is_end_supported
+from utils.events import EventRecorder
+
+BASE_CASE = {"L": 10.0, "n_loads": 10, "mix": "mixed", "supports": "simply_supported"}
+SWEEPS = {
+    "L": [5.0, 20.0, 100.0],
+    "n_loads": [1, 10, 100, 1000],
+    "mix": ["centered", "distributed", "varying", "mixed"],
+    "supports": ["simply_supported", "cantilever", "continuous"]
+}
+QUICK_SWEEPS = {"L": [5.0, 20.0], "n_loads": [1, 10, 100], "mix": ["centered", "mixed"],
+                "supports": ["simply_supported", "continuous"]}
+
+LOAD_MIXES = {
+    "centered": [LoadTypes.centered],
+    "distributed": [LoadTypes.uniformlyDistributed],
+    "varying": [LoadTypes.uniformlyVarying],
+    "mixed": [LoadTypes.centered, LoadTypes.uniformlyDistributed, LoadTypes.uniformlyVarying]
+}
+
+ENGINE_MAX_LOADS = {"sympy": 10, "numeric": None}  # dsolve time grows quickly with the number of loads
+PLOT_MAX_LOADS = 100
+DEFAULT_THRESHOLD = 1.25
+MIN_DELTA = 1e-3  # seconds; smaller slowdowns are timer noise, not regressions
+
+# Statements timed in a fresh interpreter; none of them should load SymPy or Matplotlib
+STARTUP_STATEMENTS = {
+    "import_model": "import utils.model",
+    "import_jobs": "import utils.jobs",
+    "numeric_solve": "from utils.jobs import solve_definition; solve_definition({'L': 10.0, 'supports': "
+                     "[{'position': 0.0, 'type': 'pinned'}, {'position': 10.0, 'type': 'roller'}], "
+                     "'loads': [{'magnitude': -1.0, 'type': 'centered', 'start': 5.0}]})"
+}
+HEAVY_MODULES = ("sympy", "matplotlib")
+
+
+def build_supports(L, configuration):
+    if configuration == "simply_supported":
+        return [Support(0.0, SupportTypes.pinned), Support(L, SupportTypes.roller)]
+    if configuration == "cantilever":
+        return [Support(0.0, SupportTypes.fixed)]
+    if configuration == "continuous":
+        return [Support(0.0, SupportTypes.pinned)] + [Support(L * k / 4, SupportTypes.roller) for k in range(1, 5)]
+
+    raise ValueError(f"Unknown support configuration {configuration}.")
+
+
+def build_beam(L, n_loads, mix, supports):
+    """
+    `n_loads` loads of the categories of `mix` (in turn), each inside its own
+    slot of length `L / n_loads`, so they never overlap.
+    """
+    beam = Beam(0.3, L, 2e-4, 2e11)
+    for support in build_supports(L, supports):
+        beam.add_support(support)
+
+    width = L / n_loads
+    loads = []
+    for i in range(n_loads):
+        category = LOAD_MIXES[mix][i % len(LOAD_MIXES[mix])]
+        start = round(i * width + 0.1 * width, 6)
+        end = round((i + 1) * width - 0.1 * width, 6)
+        magnitude = -float(1 + i % 5)
+        if category == LoadTypes.centered:
+            loads.append(Load(magnitude, category, round((start + end) / 2, 6)))
+        else:
+            loads.append(Load(magnitude, category, start, end))
+    beam.add_loads(loads)
+
+    return beam
+
+
+def get_cases(sweeps):
+    """
+    The base case plus every value of each factor with the others at their base value.
+    """
+    cases = {json.dumps(BASE_CASE, sort_keys=True): dict(BASE_CASE)}
+    for factor, values in sweeps.items():
+        for value in values:
+            case = dict(BASE_CASE, **{factor: value})
+            cases[json.dumps(case, sort_keys=True)] = case
+
+    return list(cases.values())
+
+
+def get_case_name(engine, case):
+    return f"{engine}/L={case['L']:g}/loads={case['n_loads']}/{case['mix']}/{case['supports']}"
+
+
+def time_phases(engine, case, directory, plot):
+    """
+    One run of every phase; returns `{phase: seconds}`, with the breakdown
+    reported by the model's events as `events.<phase>`.
+    """
+    beam = build_beam(**case)
+    recorder = EventRecorder()
+    timings = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        model = Model(beam, engine=engine, sink=FileSink(os.path.join(directory, "reports")), observer=recorder)
+        timings["init"] = time.perf_counter() - start
+
+        # with the report, standard layouts take the symbolic path instead of the closed form; a
+        # phase of its own, so that `compare` does not set it against a bare "solve"
+        start = time.perf_counter()
+        if engine == "sympy":
+            results = model.solve(report=True, plot=False)
+            timings["solve_report"] = time.perf_counter() - start
+        else:
+            results = model.solve(report=False, plot=False)
+            timings["solve"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results.diagrams()
+        timings["diagrams"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results.sample()
+        timings["sample"] = time.perf_counter() - start
+
+        if plot:
+            plotter = Plot(beam.L, beam.supports, beam.loads, dpi=plot, directory=os.path.join(directory, "plots"))
+            os.makedirs(os.path.dirname(plotter.beam_filename), exist_ok=True)
+            os.makedirs(os.path.dirname(plotter.strain_filename), exist_ok=True)
+
+            start = time.perf_counter()
+            plotter.plot_model(save=True)
+            plotter.plot_model(results.sample(), save=True)
+            timings["plot"] = time.perf_counter() - start
+
+    for name, total in recorder.totals().items():
+        timings[f"events.{name}"] = total["duration"]
+
+    return timings
+
+
+def time_startup(repeat):
+    """
+    Wall time of a new Python process running each of `STARTUP_STATEMENTS`, and
+    the heavy modules it ended up importing (expected to be none).
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    phases, loaded = {}, {}
+    for name, statement in STARTUP_STATEMENTS.items():
+        check = f"{statement}; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, "-c", check], cwd=directory, check=True,
+                                    capture_output=True, text=True).stdout
+            durations.append(time.perf_counter() - start)
+        phases[name] = {"min": min(durations), "median": median(durations)}
+        loaded[name] = [module for module in output.strip().split(",") if module]
+
+    return {"name": "startup", "engine": None, "params": {}, "phases": phases, "loaded": loaded}
+
+
+def run(sweeps, engines, repeat, plot):
+    entries = [time_startup(repeat)]
+    summary = ", ".join(f"{name} {values['min'] * 1e3:.0f}ms" for name, values in entries[0]["phases"].items())
+    print(f"[*] startup: {summary}", file=sys.stderr)
+    for name, modules in entries[0]["loaded"].items():
+        if modules:
+            print(f"[!] startup: {name} imported {', '.join(modules)}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for engine in engines:
+            for case in get_cases(sweeps):
+                name = get_case_name(engine, case)
+                max_loads = ENGINE_MAX_LOADS[engine]
+                skipped = None
+                if max_loads is not None and case["n_loads"] > max_loads:
+                    skipped = f"more than {max_loads} loads"
+                elif engine == "sympy" and not is_end_supported(build_beam(**dict(case, n_loads=1))):
+                    skipped = "needs the numeric engine"
+
+                if skipped is not None:
+                    entries.append({"name": name, "engine": engine, "params": case, "skipped": skipped})
+                    print(f"[-] {name}: skipped ({skipped})", file=sys.stderr)
+                    continue
+
+                case_plot = plot if case["n_loads"] <= PLOT_MAX_LOADS else None
+                runs = [time_phases(engine, case, directory, case_plot) for _ in range(repeat)]
+                phases = {phase: {"min": min(run[phase] for run in runs),
+                                  "median": median(run[phase] for run in runs)}
+                          for phase in runs[0]}
+
+                entries.append({"name": name, "engine": engine, "params": case, "phases": phases})
+                summary = ", ".join(f"{phase} {values['min'] * 1e3:.2f}ms" for phase, values in phases.items())
+                print(f"[*] {name}: {summary}", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "sympy": sym.__version__,
+            "matplotlib": matplotlib.__version__,
+            "repeat": repeat
+        },
+        "results": entries
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, min_delta=MIN_DELTA):
+    """
+    Ratios `current / baseline` of the minimum time of every phase present in
+    both; a ratio above `threshold` that is also more than `min_delta` seconds
+    slower is a regression.
+
+    * Returns:
+        [{"name", "phase", "baseline", "current", "ratio", "regression"}, ...]
+    """
+    baseline_phases = {entry["name"]: entry["phases"] for entry in baseline["results"] if "phases" in entry}
+    rows = []
+    for entry in current["results"]:
+        if "phases" not in entry or entry["name"] not in baseline_phases:
+            continue
+
+        for phase, values in entry["phases"].items():
+            reference = baseline_phases[entry["name"]].get(phase)
+            if reference is None:
+                continue
+
+            ratio = values["min"] / reference["min"] if reference["min"] > 0 else float("inf")
+            rows.append({"name": entry["name"], "phase": phase, "baseline": reference["min"],
+                         "current": values["min"], "ratio": ratio,
+                         "regression": ratio > threshold and values["min"] - reference["min"] > min_delta})
+
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write the results as JSON to this file (stdout otherwise)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON file of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: %(default)s)")
+    parser.add_argument("--min-delta", type=float, default=MIN_DELTA,
+                        help="slowdowns below this many seconds are ignored (default: %(default)s)")
+    parser.add_argument("--engines", nargs="+", default=["numeric", "sympy"], choices=["numeric", "sympy"])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the minimum is compared")
+    parser.add_argument("--quick", action="store_true", help="fewer values per factor")
+    parser.add_argument("--plot-dpi", type=int, default=100,
+                        help="dpi of the plot phase, 0 skips plotting (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    current = run(QUICK_SWEEPS if args.quick else SWEEPS, args.engines, args.repeat, args.plot_dpi or None)
+
+    output = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as file:
+        rows = compare(current, json.load(file), args.threshold, args.min_delta)
+
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else "ok"
+        print(f"{flag:>10}  {row['ratio']:6.2f}x  {row['name']} [{row['phase']}] "
+              f"{row['baseline'] * 1e3:.2f}ms -> {row['current'] * 1e3:.2f}ms", file=sys.stderr)
+
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Solves a file of beam definitions in a process pool and writes one JSON line
+per beam (reactions, extrema, optionally the diagrams) as soon as it is solved.
+
+The input is JSONL (one `schema.beam_from_dict` definition per line, `-` for
+stdin) or a JSON list of definitions; a definition may add an "id" and
+"bound_conds" (see `schema.bound_conds_from_dict`). JSONL is read lazily and
+at most `--in-flight` chunks are queued, so memory stays flat on large files.
+A beam that fails is written with its "error" and the batch goes on.
+
+    python run_jobs.py beams.jsonl --output results.jsonl
+    python run_jobs.py beams.json --workers 4 --diagrams > results.jsonl
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+from functools import partial
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from utils.jobs import solve_chunk
+
+CHUNK_SIZE = 16  # beams per task, to amortize the round trip to a worker
+IN_FLIGHT_PER_WORKER = 2
+
+
+def iter_definitions(path):
+    """
+    Yields `(index, definition)`. JSONL lines are left unparsed so that a
+    malformed line only fails its own beam (parsed in the worker).
+    """
+    if path.endswith(".json"):
+        with open(path) as file:
+            definitions = json.load(file)
+        if isinstance(definitions, dict):
+            definitions = [definitions]
+        yield from enumerate(definitions)
+        return
+
+    with (contextlib.nullcontext(sys.stdin) if path == "-" else open(path)) as file:
+        index = 0
+        for line in file:
+            if line.strip():
+                yield index, line
+                index += 1
+
+
+def iter_chunks(items, size):
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
+def solve_all(definitions, workers, chunk_size=CHUNK_SIZE, in_flight=None, diagrams=False, max_tasks_per_child=None):
+    """
+    Yields the results of each chunk in order of completion, with at most
+    `in_flight` chunks submitted at once. `workers=0` solves in this process.
+    """
+    chunks = iter_chunks(definitions, chunk_size)
+    task = partial(solve_chunk, diagrams=diagrams)
+    if workers == 0:
+        yield from map(task, chunks)
+        return
+
+    if in_flight is None:
+        in_flight = IN_FLIGHT_PER_WORKER * workers
+
+    with ProcessPoolExecutor(workers, max_tasks_per_child=max_tasks_per_child) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(task, chunk))
+            if len(pending) >= in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="JSONL or JSON file of beam definitions, - for JSONL on stdin")
+    parser.add_argument("--output", help="JSONL file of results (stdout otherwise)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes, 0 solves in this process (default: %(default)s)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="beams sent to a worker at once (default: %(default)s)")
+    parser.add_argument("--in-flight", type=int,
+                        help=f"chunks queued at once (default: {IN_FLIGHT_PER_WORKER} per worker)")
+    parser.add_argument("--max-tasks-per-child", type=int,
+                        help="chunks solved by a worker before it is replaced (default: never)")
+    parser.add_argument("--diagrams", action="store_true", help="also write x, V and M on the adaptive grid")
+    args = parser.parse_args(argv)
+
+    n_beams, n_failed = 0, 0
+    start = time.perf_counter()
+    with (open(args.output, "w") if args.output else contextlib.nullcontext(sys.stdout)) as output:
+        for results in solve_all(iter_definitions(args.input), args.workers, args.chunk_size, args.in_flight,
+                                 args.diagrams, args.max_tasks_per_child):
+            for result in results:
+                output.write(json.dumps(result) + "\n")
+                n_failed += "error" in result
+            n_beams += len(results)
+            output.flush()
+
+    print(f"[*] {n_beams} beams solved in {time.perf_counter() - start:.2f}s, {n_failed} failed", file=sys.stderr)
+    return 1 if n_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
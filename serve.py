@@ -0,0 +1,42 @@
+"""
+Serves beam solves over HTTP on this machine, with warm worker processes and
+micro-batching of concurrent requests that share a support layout (see
+`utils.server.SolveServer`).
+
+    python serve.py --port 8765 --workers 4
+
+    curl -s localhost:8765/solve -d @beam.json
+    curl -s localhost:8765/metrics
+"""
+import os
+import sys
+import argparse
+
+from utils.server import MAX_BATCH, MAX_WAIT, SolveServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="(default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8765, help="(default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes, 0 solves in the server process (default: %(default)s)")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH,
+                        help="requests batched at once (default: %(default)s)")
+    parser.add_argument("--max-wait", type=float, default=1e3 * MAX_WAIT,
+                        help="ms a batch waits for more requests (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    server = SolveServer(args.host, args.port, args.workers, args.max_batch, args.max_wait / 1e3).start()
+    print(f"[*] Serving on {server.url} with {args.workers} workers", file=sys.stderr)
+    try:
+        server.threads[0].join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
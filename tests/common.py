@@ -0,0 +1,38 @@
+import numpy as np
+
+from utils.beam import Beam
+from utils.load import Load, LoadTypes
+from utils.support import Support, SupportTypes
+
+MIXED_LOADS = [(-3.0, LoadTypes.centered, 1.5), (-2.0, LoadTypes.uniformlyDistributed, 2.0, 4.5),
+               (-4.0, LoadTypes.uniformlyVarying, 5.0, 6.0)]
+
+# layouts of a 6 m beam solved with two integration constants, and by the three-moment solver
+END_SUPPORTED = {
+    "simply_supported": [(0.0, SupportTypes.pinned), (6.0, SupportTypes.roller)],
+    "cantilever_start": [(0.0, SupportTypes.fixed)],
+    "cantilever_end": [(6.0, SupportTypes.fixed)]
+}
+CONTINUOUS = {
+    "overhang": [(1.0, SupportTypes.pinned), (5.0, SupportTypes.roller)],
+    "two_spans": [(0.0, SupportTypes.pinned), (3.0, SupportTypes.roller), (6.0, SupportTypes.roller)],
+    "propped": [(0.0, SupportTypes.fixed), (6.0, SupportTypes.roller)]
+}
+LAYOUTS = dict(END_SUPPORTED, **CONTINUOUS)
+
+# away from every breakpoint, where SymPy's left limits and the right limits of the numeric engine differ
+POINTS = np.linspace(0.0137, 5.9863, 41)
+
+
+def build_beam(L, supports, loads):
+    """
+    Beam of depth 0.3 with `supports` as `(position, category)` and `loads` as
+    the arguments of `Load`.
+    """
+    beam = Beam(0.3, L)
+    for position, category in supports:
+        beam.add_support(Support(position, category))
+    for load in loads:
+        beam.add_load(Load(*load))
+
+    return beam
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.model import Model
+from utils.batch import BeamBatch
+from utils.columnar import load_array
+
+from .common import build_beam, END_SUPPORTED, POINTS
+
+CATEGORIES = [LoadTypes.centered, LoadTypes.uniformlyDistributed, LoadTypes.uniformlyVarying]
+
+
+def random_cases(n_cases, seed=0):
+    # one load per category in its own third of the beam, so loads never overlap
+    rng = np.random.default_rng(seed)
+    magnitudes = -rng.uniform(1.0, 5.0, (n_cases, 3))
+    starts = np.column_stack([rng.uniform(0.0, 2.0, n_cases), rng.uniform(2.0, 3.0, n_cases),
+                              rng.uniform(4.0, 5.0, n_cases)])
+    ends = np.column_stack([starts[:, 0], starts[:, 1] + 1.0, np.full(n_cases, 6.0)])
+    return magnitudes, starts, ends
+
+
+@pytest.mark.parametrize("layout", sorted(END_SUPPORTED))
+def test_batch_matches_each_case(layout):
+    magnitudes, starts, ends = random_cases(6)
+    batch = BeamBatch(build_beam(6.0, END_SUPPORTED[layout], []), CATEGORIES, magnitudes, starts, ends)
+    x, shear, bending = batch.solve(POINTS)
+    assert shear.shape == bending.shape == (6, len(POINTS))
+
+    for case in range(6):
+        loads = [(magnitudes[case, j], category, starts[case, j], ends[case, j])
+                 for j, category in enumerate(CATEGORIES)]
+        expected_shear, expected_bending = Model(build_beam(6.0, END_SUPPORTED[layout], loads),
+                                                 engine="numeric").solve().piecewise
+        assert_allclose(shear[case], expected_shear(x), atol=1e-9)
+        assert_allclose(bending[case], expected_bending(x), atol=1e-9)
+
+
+def test_batch_from_arrays():
+    magnitudes, starts, ends = random_cases(4, seed=1)
+    beam = build_beam(6.0, END_SUPPORTED["simply_supported"], [])
+    loads = np.stack([load_array(magnitudes[:, j], category, starts[:, j], ends[:, j])
+                      for j, category in enumerate(CATEGORIES)], axis=1)
+
+    expected = BeamBatch(beam, CATEGORIES, magnitudes, starts, ends).solve(POINTS)
+    for values, reference in zip(BeamBatch.from_arrays(beam, loads).solve(POINTS), expected):
+        assert_allclose(values, reference)
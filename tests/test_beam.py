@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from utils.beam import Beam
+from utils.load import Load, LoadTypes
+from utils.support import SupportTypes
+
+from .common import build_beam
+
+UDL, POINT = LoadTypes.uniformlyDistributed, LoadTypes.centered
+
+
+def test_reversed_load_ranges_are_rejected():
+    beam = build_beam(10.0, [(0.0, SupportTypes.pinned), (10.0, SupportTypes.roller)], [])
+
+    with pytest.raises(AssertionError):
+        beam.add_load(Load(-2.0, LoadTypes.uniformlyDistributed, 8.0, 4.0))
+    assert beam.loads == []
+
+
+@pytest.mark.parametrize("first, second", [
+    ((-1.0, UDL, 2.0, 4.0), (-1.0, UDL, 4.0, 6.0)),  # touching ends
+    ((-1.0, POINT, 2.0), (-1.0, UDL, 2.0, 4.0)),  # a point load where a span starts
+    ((-1.0, UDL, 2.0, 4.0), (-1.0, POINT, 4.0)),  # ... or ends
+])
+def test_allowed_placements(first, second):
+    for loads in ([first, second], [second, first]):
+        beam = build_beam(10.0, [], loads)
+        assert len(beam.loads) == 2
+
+        bulk = Beam(0.3, 10.0)
+        bulk.add_loads([Load(*load) for load in loads])
+        assert sorted(bulk.taken_positions) == sorted(beam.taken_positions)
+
+
+@pytest.mark.parametrize("first, second", [
+    ((-1.0, UDL, 2.0, 5.0), (-1.0, UDL, 4.0, 6.0)),  # overlapping spans
+    ((-1.0, UDL, 2.0, 5.0), (-1.0, UDL, 3.0, 4.0)),  # a span inside another
+    ((-1.0, UDL, 2.0, 5.0), (-1.0, POINT, 3.0)),  # a point load inside a span
+    ((-1.0, POINT, 3.0), (-2.0, POINT, 3.0)),  # two point loads at the same position
+])
+def test_overlapping_placements_are_rejected(first, second):
+    for loads in ([first, second], [second, first]):
+        beam = build_beam(10.0, [], loads[:1])
+        with pytest.raises(AssertionError):
+            beam.add_load(Load(*loads[1]))
+        with pytest.raises(AssertionError):
+            beam.add_loads([Load(*loads[1])])
+        assert len(beam.loads) == 1
+
+        with pytest.raises(AssertionError):
+            Beam(0.3, 10.0).add_loads([Load(*load) for load in loads])
+
+
+def random_loads(n_loads, seed=0):
+    # disjoint spans with point loads on some of their starts
+    rng = np.random.default_rng(seed)
+    edges = np.sort(rng.choice(np.arange(1, 1000), 2 * n_loads, replace=False)) / 10.0
+    loads = []
+    for start, end in edges.reshape(-1, 2):
+        loads.append(Load(-1.0, UDL, float(start), float(end)))
+        if rng.random() < 0.5:
+            loads.append(Load(-2.0, POINT, float(start)))
+    return loads
+
+
+def test_bulk_insertion_matches_one_by_one():
+    loads = random_loads(50)
+    one_by_one, bulk = Beam(0.3, 100.0), Beam(0.3, 100.0)
+    for load in loads:
+        one_by_one.add_load(load)
+    bulk.add_loads(random_loads(50))
+
+    assert bulk.taken_positions == one_by_one.taken_positions  # insertion order
+    assert bulk._starts == one_by_one._starts and bulk._ends == one_by_one._ends
+
+    rows = Beam(0.3, 100.0)
+    rows.add_loads([[-1.0, 1.0, 2.0], [-1.0, 2.0, 3.0]], category=UDL)
+    assert rows.taken_positions == [(1.0, 2.0), (2.0, 3.0)]
+
+
+def test_loads_in_matches_a_scan():
+    beam = Beam(0.3, 100.0)
+    beam.add_loads(random_loads(50, seed=1))
+
+    ranges = np.sort(np.random.default_rng(2).uniform(0.0, 100.0, (20, 2)), axis=1).tolist()
+    ends = [(start, start) for start in beam._starts[:5]] + [(end, end) for end in beam._ends[:5]]
+    for a, b in [(0.0, 100.0), (10.0, 20.0)] + ends + ranges:
+        expected = {(load.start, load.end) for load in beam.loads if load.end >= a and load.start <= b}
+        assert {(load.start, load.end) for load in beam.loads_in(a, b)} == expected
+
+
+def test_remove_load():
+    beam = build_beam(10.0, [(0.0, SupportTypes.pinned)],
+                      [(-1.0, UDL, 2.0, 4.0), (-2.0, POINT, 2.0), (-3.0, POINT, 6.0)])
+
+    beam.remove_load((2.0, 4.0))  # the span, not the point load sharing its start
+    assert beam.taken_positions == [(2.0, 2.0), (6.0, 6.0)]
+    assert beam._starts == [2.0, 6.0] and beam._ends == [2.0, 6.0]
+
+    with pytest.raises(AssertionError):
+        beam.remove_load((2.0, 4.0))
+    beam.add_load(Load(-1.0, UDL, 3.0, 5.0))  # the freed range can be loaded again
+    assert [load.magnitude for load in beam.loads_in(2.5, 5.5)] == [-1.0]
@@ -0,0 +1,85 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.schema import bound_conds_from_dict
+from utils.cache import ModelCache, get_beam_key, parse_srepr, CACHE_VERSION
+
+from .common import build_beam, MIXED_LOADS, END_SUPPORTED
+
+
+def test_disk_cache_is_bounded(tmp_path):
+    beams = [build_beam(10.0, [(0.0, SupportTypes.fixed)], [(-float(i + 1), LoadTypes.centered, 5.0)])
+             for i in range(5)]
+    cache = ModelCache(str(tmp_path), max_disk_entries=3)
+    for beam in beams[:3]:
+        cache.solve(beam, engine="numeric")
+    ModelCache(str(tmp_path)).get(get_beam_key(beams[0], engine="numeric"))  # a disk hit keeps it recent
+    for beam in beams[3:]:
+        cache.solve(beam, engine="numeric")
+
+    assert len(list((tmp_path / f"v{CACHE_VERSION}").glob("*.npz"))) == 3
+    assert cache.cache_info()["disk_evictions"] == 2
+
+    fresh = ModelCache(str(tmp_path))
+    kept = [fresh.get(get_beam_key(beam, engine="numeric")) is not None for beam in beams]
+    assert kept == [True, False, False, True, True]
+
+
+def test_memory_cache_is_lru_and_counts():
+    beams = [build_beam(10.0, [(0.0, SupportTypes.fixed)], [(-float(i + 1), LoadTypes.centered, 5.0)])
+             for i in range(3)]
+    keys = [get_beam_key(beam, engine="numeric") for beam in beams]
+    cache = ModelCache(None, maxsize=2)
+
+    cache.solve(beams[0], engine="numeric")
+    cache.solve(beams[1], engine="numeric")
+    cache.solve(beams[0], engine="numeric")  # hit: beams[1] is now the least recently used
+    cache.solve(beams[2], engine="numeric")
+
+    info = cache.cache_info()
+    assert (info["hits"], info["misses"], info["disk_hits"], info["currsize"]) == (1, 3, 0, 2)
+    assert cache.get(keys[1]) is None and cache.get(keys[0]) is not None
+    assert cache.cache_info()["misses"] == 4
+
+    cache.clear()
+    assert cache.cache_info()["hits"] == cache.cache_info()["currsize"] == 0
+
+
+@pytest.mark.parametrize("engine", ["numeric", "sympy"])
+def test_disk_entries_round_trip(tmp_path, engine):
+    # a prescribed moment keeps the `sympy` engine off the closed form, so its expressions are cached
+    beam = build_beam(6.0, END_SUPPORTED["simply_supported"], MIXED_LOADS)
+    bound_conds = bound_conds_from_dict({"roller": {"M": 5.0, "V": "?"}})
+    x, shear, bending = ModelCache(str(tmp_path)).solve(beam, bound_conds, engine=engine)
+
+    fresh = ModelCache(str(tmp_path))
+    cached_x, cached_shear, cached_bending = fresh.solve(beam, bound_conds, engine=engine)
+    assert fresh.cache_info()["disk_hits"] == 1 and fresh.cache_info()["misses"] == 0
+    assert_allclose(cached_x, x)
+    assert_allclose(cached_shear, shear)
+    assert_allclose(cached_bending, bending)
+
+    entry, _ = fresh.get(get_beam_key(beam, bound_conds, engine))
+    assert entry["engine"] == engine and set(entry["constants"]) == {"C1", "C2"}
+
+
+def test_tampered_entries_are_not_executed(tmp_path):
+    beam = build_beam(10.0, [(0.0, SupportTypes.fixed)], [(-1.0, LoadTypes.centered, 5.0)])
+    key = get_beam_key(beam)
+    ModelCache(str(tmp_path))  # creates the versioned directory
+    path = tmp_path / f"v{CACHE_VERSION}" / f"{key}.npz"
+
+    path.write_bytes(pickle.dumps({"engine": "sympy"}))
+    assert ModelCache(str(tmp_path)).get(key) is None
+
+    np.savez(path, engine=np.array("sympy"), constant_names=np.array([], dtype=str),
+             constant_values=np.array([]), V=np.array("__import__('os').system('false')"), M=np.array("Integer(0)"))
+    assert ModelCache(str(tmp_path)).get(key) is None
+
+    with pytest.raises(AssertionError):
+        parse_srepr("Symbol('x').__class__")
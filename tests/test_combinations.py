@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.model import Model
+from utils.combinations import LoadCombinations
+
+from .common import build_beam, MIXED_LOADS, END_SUPPORTED, CONTINUOUS, LAYOUTS, POINTS
+
+
+@pytest.mark.parametrize("layout", sorted(END_SUPPORTED) + sorted(CONTINUOUS))
+def test_combinations_superpose(layout):
+    supports = LAYOUTS[layout]
+    beam = build_beam(6.0, supports, MIXED_LOADS)
+    factors = np.array([[1.0, 1.0, 1.0], [1.35, 0.0, 1.5], [0.9, 1.5, 0.0]])
+    x, shear, bending = LoadCombinations(beam, x=POINTS).combine(factors)
+
+    for row, factor in enumerate(factors):
+        loads = [(load[0] * f,) + load[1:] for load, f in zip(MIXED_LOADS, factor) if f != 0.0]
+        expected_shear, expected_bending = Model(build_beam(6.0, supports, loads), engine="numeric").solve().piecewise
+        assert_allclose(shear[row], expected_shear(x), atol=1e-9)
+        assert_allclose(bending[row], expected_bending(x), atol=1e-9)
+
+
+def test_envelope_picks_the_governing_combination():
+    beam = build_beam(6.0, END_SUPPORTED["simply_supported"], MIXED_LOADS)
+    combinations = LoadCombinations(beam, x=POINTS)
+    factors = [[1.0, 1.0, 1.0], [1.35, 0.0, 1.5], [0.9, 1.5, 0.0]]
+    _, shear, bending = combinations.combine(factors)
+    envelope = combinations.envelope(factors)
+
+    assert_allclose(envelope["M_max"], bending.max(axis=0))
+    assert_allclose(envelope["M_min"], bending.min(axis=0))
+    assert_allclose(envelope["V_max"], shear[envelope["V_max_combination"], np.arange(len(POINTS))])
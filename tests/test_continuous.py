@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.jobs import solve_definition, solve_group
+from utils.batch import BeamBatch
+from utils.combinations import LoadCombinations
+from utils.influence import InfluenceLines
+from utils.history import TimeHistory
+from utils.schema import bound_conds_from_dict
+from utils.write_report import MemorySink
+
+from .common import build_beam, CONTINUOUS
+
+
+def overhanging_beam():
+    # 2 kN/m on [0, 4] and 5 kN at 5, pinned at 2 and roller at 8 of a 10 m beam
+    return build_beam(10.0, [(2.0, SupportTypes.pinned), (8.0, SupportTypes.roller)],
+                      [(-2.0, LoadTypes.uniformlyDistributed, 0.0, 4.0), (-5.0, LoadTypes.centered, 5.0)])
+
+
+def test_overhang_reactions():
+    results = Model(overhanging_beam(), engine="numeric").solve()
+
+    # moments about the roller: 6 R = 8 * 6 + 5 * 3
+    assert_allclose(results.reactions["positions"], [2.0, 8.0])
+    assert_allclose(results.reactions["V"], [10.5, 2.5])
+    assert_allclose(results.reactions["M"], [0.0, 0.0], atol=1e-12)
+
+
+def test_overhang_diagrams():
+    shear, bending = Model(overhanging_beam(), engine="numeric").solve().piecewise
+
+    assert_allclose(bending([0.0, 2.0, 8.0, 10.0]), [0.0, -4.0, 0.0, 0.0], atol=1e-12)
+    assert_allclose(bending([5.0]), [-8.0 * 3.0 + 10.5 * 3.0])
+    assert_allclose(shear([1.0, 3.0, 9.0]), [-2.0, 4.5, 0.0], atol=1e-12)
+
+
+def test_interior_fixed_support():
+    beam = build_beam(10.0, [(4.0, SupportTypes.fixed)], [(-2.0, LoadTypes.uniformlyDistributed, 0.0, 10.0)])
+    results = Model(beam, engine="numeric").solve()
+
+    assert_allclose(results.reactions["V"], [20.0])
+    assert_allclose(results.reactions["M"], [-20.0])  # -36 on the right of the support, -16 on the left
+    assert_allclose(results.piecewise[1]([0.0, 10.0]), [0.0, 0.0], atol=1e-12)
+
+
+def test_overhang_jobs():
+    definition = {"h": 0.3, "L": 10.0,
+                  "supports": [{"type": "pinned", "position": 2.0}, {"type": "roller", "position": 8.0}],
+                  "loads": [{"type": "uniformly_distributed", "magnitude": -2.0, "start": 0.0, "end": 4.0},
+                            {"type": "centered", "magnitude": -5.0, "start": 5.0}]}
+
+    for result in [solve_definition(definition)] + solve_group([definition, definition]):
+        assert_allclose(result["reactions"]["V"], [10.5, 2.5])
+        assert_allclose(result["extrema"]["M"]["min"], -4.0)
+
+
+def two_span_beam():
+    # rollers at 0, 5 and 10 under a full UDL of 1: M = -w l^2 / 8 over the middle support
+    return build_beam(10.0, [(0.0, SupportTypes.roller), (5.0, SupportTypes.roller), (10.0, SupportTypes.roller)],
+                      [(-1.0, LoadTypes.uniformlyDistributed, 0.0, 10.0)])
+
+
+def test_continuous_combinations():
+    beam = two_span_beam()
+    _, shear, bending = LoadCombinations(beam, x=np.array([0.0, 2.5, 5.0])).combine([[1.0], [1.5]])
+
+    assert_allclose(bending[0], [0.0, 1.5625, -3.125], atol=1e-12)
+    assert_allclose(bending[1], 1.5 * bending[0])
+    assert_allclose(shear[0, 0], 3.0 * 10.0 / 16.0)
+
+
+def test_continuous_influence_lines():
+    lines = InfluenceLines(two_span_beam(), [5.0])
+
+    # UDL of 1 over the whole beam: the area under the influence line
+    assert_allclose(-np.trapezoid(lines.bending[0], lines.positions), -3.125, rtol=1e-5)
+    assert_allclose(lines.bending[0, [0, -1]], [0.0, 0.0], atol=1e-12)
+
+
+def test_batch_rejects_continuous_beams():
+    with pytest.raises(AssertionError):
+        BeamBatch(two_span_beam(), LoadTypes.centered, [[-1.0]], [[2.0]])
+
+
+def test_continuous_textbook_values():
+    q, L = 2.0, 6.0
+    uniform = [(-q, LoadTypes.uniformlyDistributed, 0.0, L)]
+
+    # two equal spans l: 3ql/8, 10ql/8, 3ql/8 and -ql^2/8 over the middle support
+    l = L / 2
+    two_spans = Model(build_beam(L, CONTINUOUS["two_spans"], uniform), engine="numeric").solve()
+    assert_allclose(two_spans.reactions["V"], [3 * q * l / 8, 10 * q * l / 8, 3 * q * l / 8])
+    assert_allclose(two_spans.extrema()["M"]["min"], -q * l ** 2 / 8)
+    assert_allclose(two_spans.extrema()["M"]["max"], 9 * q * l ** 2 / 128)
+
+    # propped cantilever: -qL^2/8 at the fixed end, 9qL^2/128 at 5L/8
+    propped = Model(build_beam(L, CONTINUOUS["propped"], uniform), engine="numeric").solve()
+    assert_allclose(propped.reactions["V"], [5 * q * L / 8, 3 * q * L / 8])
+    assert_allclose(propped.piecewise[1]([0.0]), [-q * L ** 2 / 8])
+    assert_allclose(propped.extrema()["M"]["max"], 9 * q * L ** 2 / 128)
+    assert_allclose(propped.extrema()["M"]["max_position"], 5 * L / 8)
+
+    # fixed at both ends: -qL^2/12 at the supports, qL^2/24 at midspan
+    fixed = Model(build_beam(L, [(0.0, SupportTypes.fixed), (L, SupportTypes.fixed)], uniform),
+                  engine="numeric").solve()
+    assert_allclose(fixed.piecewise[1]([0.0, L / 2, L - 1e-9]), [-q * L ** 2 / 12, q * L ** 2 / 24, -q * L ** 2 / 12])
+    assert_allclose(fixed.reactions["V"], [q * L / 2, q * L / 2])
+
+
+def test_sympy_engine_rejects_overhangs():
+    # pinned at 0 and roller at 8: R = [0.375, 0.625] for -1 at 5, not a cantilever
+    beam = build_beam(10.0, [(0.0, SupportTypes.pinned), (8.0, SupportTypes.roller)],
+                      [(-1.0, LoadTypes.centered, 5.0)])
+    assert_allclose(Model(beam, engine="numeric").solve().reactions["V"], [0.375, 0.625])
+
+    for report in (True, False):
+        with pytest.raises(AssertionError):
+            Model(beam, sink=MemorySink()).solve(report=report, plot=False)
+
+
+def test_three_moment_solver_rejects_custom_boundary_conditions():
+    beam = overhanging_beam()
+    bound_conds = bound_conds_from_dict({"roller": {"M": 80.0, "V": "?"}})
+
+    with pytest.raises(AssertionError):
+        Model(beam, bound_conds, engine="numeric").solve()
+    with pytest.raises(AssertionError):
+        LoadCombinations(beam, bound_conds=bound_conds)
+    with pytest.raises(AssertionError):
+        InfluenceLines(beam, [5.0], bound_conds=bound_conds)
+    with pytest.raises(AssertionError):
+        TimeHistory(beam, [5.0], bound_conds=bound_conds)
+
+
+@pytest.mark.parametrize("supports", [[], [(5.0, SupportTypes.pinned)]])
+def test_unsupported_beams_are_rejected(supports):
+    beam = build_beam(10.0, supports, [(-1.0, LoadTypes.centered, 5.0)])
+
+    with pytest.raises(AssertionError, match="at least two supports"):
+        Model(beam, engine="numeric").solve()
+    assert "at least two supports" in solve_group([{"L": 10.0, "loads": []}])[0]["error"]
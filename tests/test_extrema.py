@@ -0,0 +1,30 @@
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.numeric import PiecewisePolynomial
+
+from .common import build_beam
+
+
+def test_simply_supported_textbook_values():
+    q, L = 3.0, 8.0
+    beam = build_beam(L, [(0.0, SupportTypes.pinned), (L, SupportTypes.roller)],
+                      [(-q, LoadTypes.uniformlyDistributed, 0.0, L)])
+    results = Model(beam, engine="numeric").solve()
+
+    assert_allclose(results.reactions["V"], [q * L / 2, q * L / 2])
+    assert_allclose(results.extrema()["M"]["max"], q * L ** 2 / 8)
+    assert_allclose(results.extrema()["M"]["max_position"], L / 2)
+    assert_allclose(results.extrema()["V"]["abs_max"], q * L / 2)
+
+
+def test_extrema_inside_segments_and_at_jumps():
+    # x^2 - 2x on [0, 2) (minimum -1 at its vertex x = 1), then 3 - x on [2, 4]
+    polynomial = PiecewisePolynomial([0.0, 2.0, 4.0], [[0.0, -2.0, 1.0, 0.0], [3.0, -1.0, 0.0, 0.0]])
+    extrema = polynomial.extrema()
+
+    assert_allclose([extrema["min"], extrema["min_position"]], [-1.0, 1.0])
+    assert_allclose([extrema["max"], extrema["max_position"]], [3.0, 2.0])
+    assert_allclose([extrema["abs_max"], extrema["abs_max_position"]], [3.0, 2.0])
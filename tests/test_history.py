@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.model import Model
+from utils.history import TimeHistory
+
+from .common import build_beam, MIXED_LOADS, LAYOUTS
+
+
+@pytest.mark.parametrize("layout", ["cantilever_start", "two_spans"])
+def test_time_history_superposes(layout):
+    supports = LAYOUTS[layout]
+    sections = [0.5, 2.2, 5.1]
+    history = TimeHistory(build_beam(6.0, supports, MIXED_LOADS), sections)
+    frames = np.random.default_rng(0).normal(size=(4, len(MIXED_LOADS)))
+    shear, bending = history.respond(frames)
+
+    for row, frame in enumerate(frames):
+        loads = [(magnitude,) + load[1:] for magnitude, load in zip(frame, MIXED_LOADS)]
+        expected_shear, expected_bending = Model(build_beam(6.0, supports, loads), engine="numeric").solve().piecewise
+        assert_allclose(shear[row], expected_shear(sections), atol=1e-9)
+        assert_allclose(bending[row], expected_bending(sections), atol=1e-9)
+
+
+def test_time_history_stream_matches_respond():
+    history = TimeHistory(build_beam(6.0, LAYOUTS["two_spans"], MIXED_LOADS), [1.0, 4.0], n_points=7)
+    frames = np.random.default_rng(1).normal(size=(3, len(MIXED_LOADS)))
+    expected = history.respond(frames, diagrams=True)
+
+    streamed = list(history.stream(frames, diagrams=True))
+    for row, responses in enumerate(streamed):
+        for values, reference in zip(responses, expected):
+            assert_allclose(values, reference[row])
+    for values, reference in zip(next(history.stream([frames])), history.respond(frames)):
+        assert_allclose(values, reference)  # a block of frames at once
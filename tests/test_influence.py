@@ -0,0 +1,37 @@
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.influence import InfluenceLines
+
+from .common import build_beam, LAYOUTS
+
+
+@pytest.mark.parametrize("layout", ["simply_supported", "cantilever_end", "overhang", "two_spans"])
+def test_influence_lines_superpose(layout):
+    supports = LAYOUTS[layout]
+    sections = [0.77, 2.5, 4.13]
+    lines = InfluenceLines(build_beam(6.0, supports, []), sections, n_points=601)
+    sweep = lines.sweep([1.2], [-10.0, -6.0])
+
+    # 0 and 600: the lead axle on either end of the beam
+    for index in (0, 150, 333, 480, 600):
+        lead = sweep["positions"][index]
+        axles = [(-10.0, LoadTypes.centered, lead)]
+        if lead - 1.2 >= 0.0:
+            axles.append((-6.0, LoadTypes.centered, round(lead - 1.2, 10)))
+
+        shear, bending = Model(build_beam(6.0, supports, axles), engine="numeric").solve().piecewise
+        assert_allclose(sweep["V"][:, index], shear(sections), atol=1e-9)
+        assert_allclose(sweep["M"][:, index], bending(sections), atol=1e-9)
+
+
+def test_envelope_of_a_cantilever_is_governed_by_its_free_tip():
+    lines = InfluenceLines(build_beam(4.0, [(4.0, SupportTypes.fixed)], []), [3.0], n_points=5)
+    assert_allclose(lines.bending[0], [3.0, 2.0, 1.0, 0.0, 0.0])
+
+    sweep = lines.sweep([], [-10.0])
+    assert_allclose(sweep["M_min"], [-30.0])
+    assert_allclose(sweep["M_min_position"], [0.0])
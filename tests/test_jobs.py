@@ -0,0 +1,52 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from numpy.testing import assert_allclose
+
+from run_jobs import iter_definitions, solve_all
+from utils.jobs import solve_definition
+
+BEAM = {"h": 0.3, "L": 6.0, "supports": [{"type": "pinned", "position": 0.0}, {"type": "roller", "position": 6.0}],
+        "loads": [{"type": "uniformly_distributed", "magnitude": -2.0, "start": 0.0, "end": 6.0}]}
+
+
+def test_jobs_import_leaves_sympy_and_matplotlib_unloaded():
+    code = "import sys, utils.jobs; print(json.dumps([m for m in ('sympy', 'matplotlib') if m in sys.modules]))"
+    output = subprocess.run([sys.executable, "-c", "import json; " + code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).parents[1])
+
+    assert json.loads(output.stdout) == []
+
+
+def test_solve_all_goes_on_after_a_malformed_line(tmp_path):
+    path = tmp_path / "beams.jsonl"
+    path.write_text("\n".join([json.dumps(BEAM), "{not json", "", json.dumps(dict(BEAM, id="last"))]) + "\n")
+
+    results = [result for chunk in solve_all(iter_definitions(str(path)), workers=0, chunk_size=2)
+               for result in chunk]
+
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert "error" in results[1] and "error" not in results[0] and results[2]["id"] == "last"
+    expected = solve_definition(BEAM)
+    for result in (results[0], results[2]):
+        assert_allclose(result["reactions"]["V"], expected["reactions"]["V"])
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_solve_all_reads_the_input_lazily(workers):
+    read = []
+
+    def definitions():
+        for index in range(40):
+            read.append(index)
+            yield index, BEAM
+
+    results = solve_all(definitions(), workers=workers, chunk_size=2, in_flight=2)
+    first = next(results)
+
+    assert len(first) == 2
+    assert len(read) <= 2 * 2  # at most `in_flight` chunks taken before the first result
+    assert sum(len(chunk) for chunk in results) == 38
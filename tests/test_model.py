@@ -0,0 +1,56 @@
+from numpy.testing import assert_allclose
+
+from utils.load import Load, LoadTypes
+from utils.support import Support, SupportTypes
+from utils.model import Model
+from utils.write_report import MemorySink
+
+from .common import build_beam, MIXED_LOADS, POINTS
+
+
+def test_reports_do_not_accumulate():
+    beam = build_beam(4.0, [(0.0, SupportTypes.pinned), (4.0, SupportTypes.roller)],
+                      [(-5.0, LoadTypes.centered, 2.0)])
+    sink = MemorySink()
+    model = Model(beam, sink=sink)
+    first = model.solve(report=True, plot=False).report()
+
+    model.add_load(Load(-1.0, LoadTypes.uniformlyDistributed, 3.0, 4.0))
+    second = model.solve(report=True, plot=False).report()
+
+    assert second.count("Report:") == 1 and first not in second
+    assert model.write_report() == second == sink.content
+
+
+def test_report_integrates_a_lone_load_from_zero_as_powers():
+    # as `dsolve` did: a UDL over the whole beam gives V = C1 - 50 x, not C1 - 50 <x>^1
+    beam = build_beam(4.0, [(0.0, SupportTypes.pinned), (4.0, SupportTypes.roller)],
+                      [(-50.0, LoadTypes.uniformlyDistributed, 0.0, 4.0)])
+    report = Model(beam, sink=MemorySink()).solve(report=True, plot=False).report()
+
+    assert "= C_{1} - 50 x }" in report
+    assert r"M{\left(x \right)} = - 25 x^{2} + 100.0 x" in report
+    assert r"\left\langle x \right\rangle}^{1}" not in report  # q(x) keeps its <x>^0
+
+
+def test_incremental_updates_match_a_fresh_model():
+    model = Model(build_beam(6.0, [(0.0, SupportTypes.pinned), (6.0, SupportTypes.roller)], MIXED_LOADS[:2]),
+                  sink=MemorySink())
+    model.solve(report=True, plot=False)
+
+    model.add_load(Load(*MIXED_LOADS[2]))
+    model.remove_load((1.5, 1.5))
+    model.set_support(Support(6.0, SupportTypes.pinned))
+    updated = model.solve(report=True, plot=False)
+
+    fresh = Model(build_beam(6.0, [(0.0, SupportTypes.pinned), (6.0, SupportTypes.pinned)], MIXED_LOADS[1:]),
+                  sink=MemorySink()).solve(report=True, plot=False)
+    assert_allclose(updated.function_m_x(POINTS), fresh.function_m_x(POINTS))
+    assert updated.report() == fresh.report()
+
+
+def test_report_of_an_unloaded_beam():
+    results = Model(build_beam(6.0, [(0.0, SupportTypes.fixed)], []), sink=MemorySink()).solve(report=True, plot=False)
+
+    assert_allclose(results.function_m_x(POINTS), 0.0)
+    assert "Report:" in results.report()
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.write_report import MemorySink
+from utils.boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from utils.numeric import build_diagrams
+from utils.jobs import solve_definition, solve_group
+from utils.batch import BeamBatch
+from utils.combinations import LoadCombinations
+from utils.influence import InfluenceLines
+
+from .common import build_beam, MIXED_LOADS, END_SUPPORTED, POINTS
+
+
+@pytest.mark.parametrize("layout", sorted(END_SUPPORTED))
+def test_numeric_engine_matches_sympy(layout):
+    beam = build_beam(6.0, END_SUPPORTED[layout], MIXED_LOADS)
+    symbolic = Model(beam, sink=MemorySink()).solve(report=True, plot=False)  # derivation, no closed form
+    shear, bending, _ = build_diagrams(beam, get_best_pos_bounds(beam, BOUNDARY_CONDITIONS))
+
+    assert_allclose(shear(POINTS), symbolic.function_v_x(POINTS), atol=1e-9)
+    assert_allclose(bending(POINTS), symbolic.function_m_x(POINTS), atol=1e-9)
+
+
+def q3_definition():
+    # `main.py` Q3: cantilever fixed at L = 4 with its free end at 0 loaded by -2
+    return {"h": 0.3, "L": 4.0, "supports": [{"type": "fixed", "position": 4.0}],
+            "loads": [{"type": "centered", "magnitude": -2.0, "start": 0.0}]}
+
+
+def test_load_at_the_free_start_in_every_two_constant_path():
+    # the free end V(0) = M(0) = 0 holds before the load: V = -2 and M = -2 x on the whole beam
+    beam = build_beam(4.0, [(4.0, SupportTypes.fixed)], [(-2.0, LoadTypes.centered, 0.0)])
+    x = np.array([0.0, 1.0, 2.5, 3.9])
+
+    shear, bending, _ = build_diagrams(beam, get_best_pos_bounds(beam, BOUNDARY_CONDITIONS))
+    assert_allclose(shear(x), -2.0)
+    assert_allclose(bending(x), -2.0 * x)
+
+    for result in [solve_definition(q3_definition())] + solve_group([q3_definition(), q3_definition()]):
+        assert_allclose(result["reactions"]["V"], [2.0])
+        assert_allclose(result["reactions"]["M"], [8.0])
+        assert_allclose(result["extrema"]["M"]["min"], -8.0)
+
+    _, batch_shear, batch_bending = BeamBatch(beam, LoadTypes.centered, [[-2.0]], [[0.0]]).solve(x)
+    _, combined_shear, combined_bending = LoadCombinations(beam, x=x).combine([[1.0]])
+    for shear_values, bending_values in ((batch_shear, batch_bending), (combined_shear, combined_bending)):
+        assert_allclose(shear_values[0], -2.0)
+        assert_allclose(bending_values[0], -2.0 * x)
+
+    lines = InfluenceLines(beam, x, n_points=5)
+    assert_allclose(lines.bending[:, 0], x)  # a unit load at the tip, x - 0 from it
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.model import Model
+from utils import parametric
+from utils.parametric import ParametricModel
+
+from .common import build_beam, END_SUPPORTED, POINTS
+
+CATEGORIES = [LoadTypes.centered, LoadTypes.uniformlyDistributed]
+
+
+@pytest.mark.parametrize("layout", sorted(END_SUPPORTED))
+def test_parametric_matches_the_numeric_engine(layout):
+    model = ParametricModel(build_beam(6.0, END_SUPPORTED[layout], []), CATEGORIES)
+    # the first case has its point load at x = 0, on the free end of "cantilever_end"
+    magnitudes = np.array([[-2.0, -1.0], [-5.0, -0.5], [3.0, -2.0]])
+    starts = np.array([[0.0, 2.0], [1.5, 3.0], [5.5, 0.5]])
+    ends = np.array([[0.0, 4.0], [1.5, 6.0], [5.5, 2.5]])
+    x, shear, bending = model.evaluate(magnitudes, starts, ends, x=POINTS)
+
+    for case in range(len(magnitudes)):
+        loads = [(magnitudes[case, j], category, starts[case, j], ends[case, j])
+                 for j, category in enumerate(CATEGORIES)]
+        expected_shear, expected_bending = Model(build_beam(6.0, END_SUPPORTED[layout], loads),
+                                                 engine="numeric").solve().piecewise
+        assert_allclose(shear[case], expected_shear(x), atol=1e-9)
+        assert_allclose(bending[case], expected_bending(x), atol=1e-9)
+
+
+def test_solutions_are_bounded(monkeypatch):
+    monkeypatch.setattr(parametric, "MAX_SOLUTIONS", 2)
+    monkeypatch.setattr(ParametricModel, "_solutions", type(ParametricModel._solutions)())
+    beams = [build_beam(L, END_SUPPORTED["cantilever_start"], []) for L in (2.0, 3.0, 4.0)]
+
+    first = ParametricModel(beams[0], [LoadTypes.centered])
+    ParametricModel(beams[1], [LoadTypes.centered])
+    assert ParametricModel(beams[0], [LoadTypes.centered]).evaluator is first.evaluator  # reused, now most recent
+    ParametricModel(beams[2], [LoadTypes.centered])
+
+    assert len(ParametricModel._solutions) == 2
+    assert ParametricModel(beams[0], [LoadTypes.centered]).evaluator is first.evaluator
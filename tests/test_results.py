@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.model import Model
+from utils.results import ModelResults
+
+from .common import build_beam, MIXED_LOADS, LAYOUTS, POINTS
+
+
+@pytest.mark.parametrize("layout", ["simply_supported", "two_spans"])  # two constants, three-moment (none)
+def test_to_arrays(layout):
+    results = Model(build_beam(6.0, LAYOUTS[layout], MIXED_LOADS), engine="numeric").solve()
+    arrays = results.to_arrays()
+
+    assert all(array.flags.c_contiguous for array in arrays.values())
+    assert arrays["constant_names"].tolist() == list(results.constants)
+    assert_allclose(arrays["constant_values"], list(results.constants.values()))
+    assert_allclose(arrays["reaction_V"], results.reactions["V"])
+    for name, values in zip(("x", "V", "M"), results.diagrams()):
+        assert_allclose(arrays[name], values)
+    assert "x" not in results.to_arrays(diagrams=False)
+
+
+def assert_same_results(loaded, results):
+    assert loaded.model is None and loaded.constants == results.constants
+    for function, reference in zip(loaded.piecewise, results.piecewise):
+        assert_allclose(function(POINTS), reference(POINTS))
+    for name in ("positions", "V", "M"):
+        assert_allclose(loaded.reactions[name], results.reactions[name])
+    for values, reference in zip(loaded.diagrams(), results.diagrams()):
+        assert_allclose(values, reference)
+    assert loaded.extrema() == results.extrema()
+
+
+@pytest.mark.parametrize("layout", ["simply_supported", "two_spans"])
+def test_save_and_load(tmp_path, layout):
+    results = Model(build_beam(6.0, LAYOUTS[layout], MIXED_LOADS), engine="numeric").solve()
+    assert (len(results.constants) == 0) == (layout == "two_spans")
+
+    results.save(tmp_path / "results")
+    loaded = ModelResults.load(str(tmp_path / "results"))
+    assert all(isinstance(values, np.memmap) for values in loaded.diagrams())
+    assert not loaded.piecewise[1].coefs.flags.writeable  # a view of the read-only map
+    assert_same_results(loaded, results)
+
+    for compressed in (False, True):
+        results.save_npz(tmp_path / "results.npz", compressed=compressed)
+        assert_same_results(ModelResults.load(str(tmp_path / "results.npz")), results)
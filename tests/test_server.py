@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy.testing import assert_allclose
+
+from utils.jobs import solve_definition
+from utils.server import SolveServer, SolveClient
+
+
+def definitions():
+    # two layouts: `main.py` Q3 (cantilever fixed at L) and an overhang (three-moment solver)
+    cantilever = [{"L": 4.0, "supports": [{"type": "fixed", "position": 4.0}],
+                   "loads": [{"type": "centered", "magnitude": -float(i + 1), "start": 0.5 * i}]} for i in range(8)]
+    overhang = [{"L": 10.0, "supports": [{"type": "pinned", "position": 2.0}, {"type": "roller", "position": 8.0}],
+                 "loads": [{"type": "uniformly_distributed", "magnitude": -float(i + 1), "start": 0.0, "end": 4.0}]}
+                for i in range(4)]
+    return cantilever + overhang
+
+
+def assert_same_results(result, expected):
+    for name in ("V", "M"):
+        assert_allclose(result["reactions"][name], expected["reactions"][name], atol=1e-9)
+        for key in ("max", "min"):
+            assert_allclose(result["extrema"][name][key], expected["extrema"][name][key], atol=1e-9)
+
+
+def test_concurrent_requests_are_batched():
+    with SolveServer(workers=0, port=0, max_wait=0.05) as server:
+        client = SolveClient(server.url)
+        with ThreadPoolExecutor(12) as executor:
+            results = list(executor.map(client.solve, definitions()))
+        metrics = client.metrics()
+
+    assert max(result["metrics"]["batch_size"] for result in results) > 1
+    assert metrics["requests"] == 12 and metrics["failed"] == 0 and metrics["in_flight"] == 0
+    for result, definition in zip(results, definitions()):
+        assert "error" not in result
+        assert_same_results(result, solve_definition(definition))
+
+
+def test_list_requests_and_errors():
+    with SolveServer(workers=0, port=0) as server:
+        client = SolveClient(server.url)
+        results = client.solve(definitions()[:3] + [{"L": 4.0, "loads": []}])
+
+    assert len(results) == 4 and "error" in results[3]
+    for result, definition in zip(results[:3], definitions()):
+        assert_same_results(result, solve_definition(definition))
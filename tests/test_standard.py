@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.standard import get_topology
+from utils.write_report import MemorySink
+
+from .common import build_beam, MIXED_LOADS, END_SUPPORTED, POINTS
+
+
+@pytest.mark.parametrize("layout", sorted(END_SUPPORTED))
+def test_closed_form_matches_sympy(layout):
+    beam = build_beam(6.0, END_SUPPORTED[layout], MIXED_LOADS)
+    symbolic = Model(beam, sink=MemorySink()).solve(report=True, plot=False)  # derivation, no closed form
+    assert get_topology(beam) == layout
+
+    for engine in ("sympy", "numeric"):
+        shear, bending = Model(beam, engine=engine).solve(report=False, plot=False).piecewise
+        assert_allclose(shear(POINTS), symbolic.function_v_x(POINTS), atol=1e-9)
+        assert_allclose(bending(POINTS), symbolic.function_m_x(POINTS), atol=1e-9)
+
+
+def test_sympy_results_do_not_depend_on_the_report():
+    # `main.py` Q3: the free end at 0 carries the load, V = -2 and M = -2 x
+    beam = build_beam(4.0, [(4.0, SupportTypes.fixed)], [(-2.0, LoadTypes.centered, 0.0)])
+    x = np.array([0.5, 2.0, 3.5])
+
+    derived = Model(beam, sink=MemorySink()).solve(report=True, plot=False)
+    closed_form = Model(beam).solve(report=False, plot=False)
+
+    assert_allclose(derived.function_v_x(x), -2.0)
+    assert_allclose(derived.function_m_x(x), -2.0 * x)
+    assert_allclose(closed_form.piecewise[0](x), -2.0)
+    assert_allclose(closed_form.piecewise[1](x), -2.0 * x)
+    assert_allclose(derived.reactions["V"], closed_form.reactions["V"])
+    assert_allclose(derived.reactions["M"], closed_form.reactions["M"])
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from utils.support import SupportTypes
+from utils.model import Model
+
+from .common import build_beam, MIXED_LOADS
+
+
+def solved_beam():
+    beam = build_beam(6.0, [(0.0, SupportTypes.fixed)], MIXED_LOADS)
+    beam.I = 2e-4
+    return Model(beam, engine="numeric").solve()
+
+
+def test_chunked_compute_matches_one_shot(tmp_path):
+    results = solved_beam()
+    one_shot = results.stress(n_points=301, n_depth=11, chunk_size=301 * 11).compute()
+
+    moments = results.piecewise[1](np.linspace(0.0, 6.0, 301))
+    assert_allclose(one_shot, moments[:, None] * np.linspace(-0.15, 0.15, 11) / 2e-4)
+
+    for chunk_size in (1, 11, 50, 1000, 3300):
+        field = results.stress(n_points=301, n_depth=11, chunk_size=chunk_size)
+        assert_allclose(field.compute(), one_shot)
+
+        out = np.full(field.shape, np.nan)
+        assert field.compute(out=out) is out
+        assert_allclose(out, one_shot)
+
+    mapped = results.stress(n_points=301, n_depth=11, chunk_size=50).compute(filename=str(tmp_path / "sigma.npy"))
+    assert_allclose(np.load(tmp_path / "sigma.npy", mmap_mode="r"), one_shot)
+    assert isinstance(mapped, np.memmap)
+
+
+def test_envelope_is_the_extreme_fiber_stress():
+    results = solved_beam()
+    envelope = results.stress(n_points=101).envelope()
+    extrema = results.extrema()["M"]
+
+    assert_allclose(envelope["abs_max"], extrema["abs_max"] * 0.3 / (2 * 2e-4))
+    assert envelope["abs_max_position"] == extrema["abs_max_position"]
+    assert_allclose(envelope["top"], -envelope["bottom"])
+    assert_allclose(envelope["top"], results.piecewise[1](envelope["x"]) * 0.15 / 2e-4)
+
+
+def test_stress_needs_the_section():
+    with pytest.raises(AssertionError):
+        Model(build_beam(6.0, [(0.0, SupportTypes.fixed)], MIXED_LOADS), engine="numeric").solve().stress()
@@ -0,0 +1,26 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from utils.load import LoadTypes
+from utils.support import SupportTypes
+from utils.model import Model
+from utils.tabulated import TabulatedLoad
+
+from .common import build_beam
+
+def test_tabulated_loads_match_closed_form_loads():
+    x = np.linspace(2.0, 6.0, 100001)
+    discrete = build_beam(8.0, [(0.0, SupportTypes.pinned), (3.0, SupportTypes.roller), (8.0, SupportTypes.roller)],
+                          [(-2.0, LoadTypes.uniformlyDistributed, 2.0, 6.0), (-4.0, LoadTypes.centered, 7.0)])
+    tabulated = build_beam(8.0, [(0.0, SupportTypes.pinned), (3.0, SupportTypes.roller), (8.0, SupportTypes.roller)],
+                           [(-4.0, LoadTypes.centered, 7.0)])
+    tabulated.add_tabulated_load(TabulatedLoad(x, np.full_like(x, -2.0), chunk_size=4096, max_segments=64))
+
+    expected = Model(discrete, engine="numeric").solve()
+    results = Model(tabulated, engine="numeric").solve()
+    points = np.linspace(0.0, 8.0, 97)
+
+    assert len(results.piecewise[0].breaks) < 80
+    assert_allclose(results.reactions["V"], expected.reactions["V"])
+    for function, reference in zip(results.piecewise, expected.piecewise):
+        assert_allclose(function(points), reference(points), atol=1e-9)
@@ -0,0 +1,101 @@
+import numpy as np
+
+from .load import LoadTypes
+from .columnar import LOAD_CATEGORIES, LOAD_DTYPE
+from .boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from .numeric import LOAD_RESPONSES, get_boundary_system, get_loads_at_bounds
+from .continuous import is_end_supported
+
+
+class BeamBatch:
+    """
+    Many load cases on the support layout of one `Beam`.
+
+    Loads are given column-wise: column `j` of `magnitudes`, `starts` and `ends`
+    (shape `(n_cases, n_loads)`) holds load `j` of every case, and `categories[j]`
+    its `LoadTypes`. The loads already added to `beam` are ignored.
+    """
+
+    def __init__(self, beam, categories, magnitudes, starts, ends=None, bound_conds=None):
+        if bound_conds is None:
+            bound_conds = BOUNDARY_CONDITIONS
+
+        self.beam = beam
+        self.bound_conds = bound_conds
+        self.magnitudes = np.atleast_2d(np.asarray(magnitudes, dtype=float))
+        self.starts = np.broadcast_to(np.asarray(starts, dtype=float), self.magnitudes.shape)
+        self.ends = self.starts if ends is None else np.broadcast_to(np.asarray(ends, dtype=float),
+                                                                     self.magnitudes.shape)
+
+        if isinstance(categories, LoadTypes):
+            categories = [categories] * self.n_loads
+        self.categories = [LoadTypes(category) for category in categories]
+
+        self._handle_invalid_inputs()
+
+    @classmethod
+    def from_arrays(cls, beam, loads, bound_conds=None):
+        """
+        `loads` is a `LOAD_DTYPE` array of shape `(n_cases, n_loads)`; every case
+        must have the same category in a given column.
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=LOAD_DTYPE))
+        codes = loads["category"]
+        assert np.all(codes == codes[:1]), "Every case must have the same load category in a column."
+
+        return cls(beam, [LOAD_CATEGORIES[code] for code in codes[0].tolist()], loads["magnitude"],
+                   loads["start"], loads["end"], bound_conds)
+
+    @property
+    def n_cases(self):
+        return self.magnitudes.shape[0]
+
+    @property
+    def n_loads(self):
+        return self.magnitudes.shape[1]
+
+    def _handle_invalid_inputs(self):
+        assert is_end_supported(self.beam), \
+            "`BeamBatch` needs supports at both ends or a fixed end; use `LoadCombinations` for other layouts."
+        assert len(self.categories) == self.n_loads, "`categories` must have one entry per load column."
+        assert np.all((self.starts >= 0.0) & (self.starts <= self.beam.L)), \
+            "Load positions must be within the limits of the beam."
+        assert np.all((self.ends >= self.starts) & (self.ends <= self.beam.L)), \
+            "Load ends must be within the limits of the beam and after the load starts."
+
+    def _load_responses(self, x):
+        """
+        Sum of the load contributions to V and M, shape `(n_cases,) + x.shape[1:]`.
+        """
+        shear = np.zeros((self.n_cases,) + x.shape[1:])
+        bending = np.zeros_like(shear)
+
+        for j, category in enumerate(self.categories):
+            load_shear, load_bending = LOAD_RESPONSES[category](self.magnitudes[:, j, None],
+                                                                self.starts[:, j, None],
+                                                                self.ends[:, j, None], x)
+            shear += load_shear
+            bending += load_bending
+
+        return shear, bending
+
+    def solve(self, x=None):
+        """
+        Returns `(x, V, M)` with V and M of shape `(n_cases, n_points)`.
+        """
+        if x is None:
+            x = np.linspace(0, self.beam.L, int(self.beam.L * 100))
+        x = np.asarray(x, dtype=float)
+
+        forces, positions, matrix, values = get_boundary_system(get_best_pos_bounds(self.beam, self.bound_conds))
+        shear_at_bounds, bending_at_bounds = self._load_responses(positions[None, :])
+        loads_at_bounds = get_loads_at_bounds(forces, positions, shear_at_bounds, bending_at_bounds)
+
+        c1, c2 = np.linalg.solve(matrix, (values - loads_at_bounds).T)
+        self.constants = {"C1": c1, "C2": c2}
+
+        shear, bending = self._load_responses(x[None, :])
+        shear += c1[:, None]
+        bending += c1[:, None] * x + c2[:, None]
+
+        return x, shear, bending
@@ -1,56 +1,145 @@
+from bisect import bisect_left, bisect_right
 from typing import Tuple
 
+import numpy as np
+
 from .load import Load, LoadTypes
 from .support import Support, SupportTypes
 
 
+def _overlaps(start_a, end_a, start_b, end_b):
+    """
+    Two loads overlap when their lengths share more than a point, when a point
+    load sits strictly inside the other load or when two point loads coincide.
+    Loads that only touch at an end are allowed. Works on scalars and arrays.
+    """
+    point_a = start_a == end_a
+    point_b = start_b == end_b
+
+    interiors = np.maximum(start_a, start_b) < np.minimum(end_a, end_b)
+    a_inside_b = point_a & (start_b < start_a) & (start_a < end_b)
+    b_inside_a = point_b & (start_a < start_b) & (start_b < end_a)
+    same_point = point_a & point_b & (start_a == start_b)
+
+    return interiors | a_inside_b | b_inside_a | same_point
+
+
 class Beam:
     """
+    `loads` keeps insertion order; a sorted index of `(start, end)` backs placement,
+    removal and range queries. Since loads cannot overlap, the ends in the index
+    are sorted as well, so all of them are bisections.
     """
 
-    def __init__(self, h: float, L: float, I: float = 0.0):
+    def __init__(self, h: float, L: float, I: float = 0.0, E: float = 0.0):
         self.h = float(h)
         self.L = float(L)
         self.I = float(I)
+        self.E = float(E)  # modulus of elasticity, with `I` gives the flexural rigidity E*I
         self.supports = {}#{0.0: Support(0.0, SupportTypes.fixed)}
-        self.loads = list()
-        self.taken_positions = list()
+        self._loads = dict()  # (start, end) -> Load, in insertion order
+        self._starts = list()
+        self._ends = list()
+        self.tabulated_loads = []  # `TabulatedLoad`, superposed on the loads above
 
-    def _is_intersection(self, a: Tuple[float, float], b: Tuple[float, float]):
-        """
-
-        reference: https://www.youtube.com/watch?v=bbTqI0oqL5U
-        """
-        p1, p2 = a
-        p3, p4 = b
+    @property
+    def loads(self):
+        return list(self._loads.values())
 
-        return ((p3 >= p1) and (p3 <= p2)) or ((p4 >= p1) and (p4 <= p2))
+    @property
+    def taken_positions(self):
+        return list(self._loads.keys())
 
     def _validate_load_input(self, start: float, end: float):
-        if self.taken_positions == []:
-            return True
-        
         end = end if end else start
+        index = self._bisect(start, end)
 
-        for position in self.taken_positions:
-            if self._is_intersection((start, end), position):
+        for neighbor in (index - 1, index):
+            if 0 <= neighbor < len(self._starts) and \
+                    _overlaps(start, end, self._starts[neighbor], self._ends[neighbor]):
                 return False
 
         return True
 
+    def _bisect(self, start: float, end: float) -> int:
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] == start and self._ends[index] < end:
+            index += 1
+
+        return index
+
     def add_load(self, load: Load) -> None:
         """
         """
         assert 0.0 <= load.start <= self.L, f"{load} position must be within the limits of the beam."
         if load.end:
             assert 0.0 <= load.end <= self.L, f"{load} position must be within the limits of the beam."
-        
+
         if not load.end:
             load.end = load.start
-        self.taken_positions.append((load.start, load.end))
-        self.loads.append(load)
+        assert load.start <= load.end, f"{load} must end after its start."
+        assert self._validate_load_input(load.start, load.end), f"{load} overlaps a load already on the beam."
+
+        index = self._bisect(load.start, load.end)
+        self._starts.insert(index, load.start)
+        self._ends.insert(index, load.end)
+        self._loads[(load.start, load.end)] = load
+
+    def add_tabulated_load(self, load) -> None:
+        """
+        Adds a `tabulated.TabulatedLoad`; it may overlap the other loads.
+        """
+        assert 0.0 <= load.start and load.end <= self.L, f"{load} position must be within the limits of the beam."
+        self.tabulated_loads.append(load)
+
+    def add_loads(self, loads, category: LoadTypes = None) -> None:
+        """
+        Bulk insertion: `loads` is an iterable of `Load` or an array of rows
+        `(magnitude, start, end)` of one `category`. Validated and merged with a
+        single sort instead of one insertion per load.
+        """
+        if category is not None:
+            rows = np.atleast_2d(np.asarray(loads, dtype=float))
+            loads = [Load(magnitude, category, start, end) for magnitude, start, end in rows]
+        loads = list(loads)
+        if not loads:
+            return
+
+        for load in loads:
+            if not load.end:
+                load.end = load.start
+        starts = np.array([load.start for load in loads])
+        ends = np.array([load.end for load in loads])
+
+        assert np.all((starts >= 0.0) & (ends <= self.L) & (starts <= ends)), \
+            "Load positions must be within the limits of the beam."
+
+        order = np.lexsort((ends, starts))
+        starts, ends = starts[order], ends[order]
+        assert not np.any(_overlaps(starts[:-1], ends[:-1], starts[1:], ends[1:])), "New loads overlap each other."
+
+        if self._starts:
+            current_starts, current_ends = np.array(self._starts), np.array(self._ends)
+            index = np.searchsorted(current_starts, starts)
+            # at most two current loads share a start (a point load and the load beginning there)
+            for neighbor in (np.clip(index + shift, 0, len(current_starts) - 1) for shift in (-1, 0, 1)):
+                assert not np.any(_overlaps(starts, ends, current_starts[neighbor], current_ends[neighbor])), \
+                    "New loads overlap loads already on the beam."
+
+        merged = sorted(zip(self._starts + starts.tolist(), self._ends + ends.tolist()))
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._loads.update(((load.start, load.end), load) for load in loads)
+
+    def loads_in(self, a: float, b: float):
+        """
+        Loads acting somewhere in [a, b].
+        """
+        first = bisect_left(self._ends, a)
+        last = bisect_right(self._starts, b)
+        return [self._loads[position] for position in zip(self._starts[first:last], self._ends[first:last])]
 
-    def add_support(self, support: Support) -> None:        
+    def add_support(self, support: Support) -> None:
         """
         """
         assert 0 <= support.position <= self.L, f"{support} position must be within the limits of the beam."
@@ -60,14 +149,17 @@ class Beam:
     def remove_load(self, position: Tuple) -> None:
         """
         """
-        assert position in self.taken_positions, "Beam does not have a Load in position {position}."
-        index = self.taken_positions.index(position)
-        del self.loads[index]
-        del self.taken_positions[index]
+        start, end = position
+        index = self._bisect(start, end)
+        assert index < len(self._starts) and (self._starts[index], self._ends[index]) == (start, end), \
+            f"Beam does not have a Load in position {position}."
+        del self._loads[(start, end)]
+        del self._starts[index]
+        del self._ends[index]
 
     def remove_support(self, position: float) -> None:
         """
         """
         assert self.supports.__contains__(position), "Beam does not have a Support in position {position}."
         support = self.supports.pop(position)
-        print(f"[*] {support} removed from Beam.")
\ No newline at end of file
+        print(f"[*] {support} removed from Beam.")
@@ -0,0 +1,98 @@
+import numpy as np
+
+from .support import SupportTypes
+from .columnar import BeamArrays, SUPPORT_CATEGORIES
+
+BOUNDARY_CONDITIONS = {
+    SupportTypes.fixed: {
+        "M": "?",
+        "V": "?"
+    },
+    SupportTypes.roller: {
+        "M": 0.0,
+        "V": "?"
+    },
+    SupportTypes.pinned: {
+        "M": 0.0,
+        "V": "?"
+    },
+    "free": {
+        "M": 0.0,
+        "V": 0.0
+    }
+}
+
+
+def get_position_conditions(beam, bound_conds):
+    if isinstance(beam, BeamArrays):
+        supports = {position: SUPPORT_CATEGORIES[code] for position, code in beam.supports.tolist()}
+    else:
+        supports = {position: support.category for position, support in beam.supports.items()}
+
+    position_conditions = [(position, bound_conds[category]) for position, category in supports.items()]
+
+    if not supports.__contains__(beam.L):
+        position_conditions.append((beam.L, bound_conds["free"]))
+
+    if not supports.__contains__(0.0):
+        position_conditions.append((0.0, bound_conds["free"]))
+
+    return position_conditions
+
+
+def get_best_position(dict_values):
+    """
+    [(position, {'M': 'Value', 'V': 'Value'}), ...]
+
+    * Conditions:
+        1) Two equal forces equals zero at different positions.
+            - [M(x->0):0; M(x->L):0] or [V(x->0):0; V(x->L):0]
+        2) Two different forces equals zero at the same position
+            - [M(x->0):0; V(x->L):0] or [M(x->L):0; V(x->0):0]
+
+    * Returns:
+        [position, [[force: 0.0], [force: 0.0], ...]]
+    """
+
+    dict_conditions = [condition[1] for condition in dict_values]
+    values = np.array([list(value.values()) for value in dict_conditions])
+    main_condition = (values != "?")
+
+    valid_values = np.sum(main_condition)
+    if valid_values <= 1:
+        return [None, None]
+
+    # 1st CASE: TWO VALUES IN ONE POSITION
+    indices = np.argwhere(main_condition.all(axis=1)).flatten()
+    if len(indices) > 0:
+        return np.array(dict_values)[indices[0]]
+
+    # 2nd CASE: VALUES IN DIFFERENT POSITIONS
+    column_split = np.hsplit(main_condition, 2)
+
+    if not any(column_split[0]):
+        indices = np.where(column_split[1] == np.amax(column_split[1]))[0][:2]
+
+    elif not any(column_split[1]):
+        indices = np.where(column_split[0] == np.amax(column_split[0]))[0][:2]
+
+    else:
+        indices = [np.argmax(column_split[0]), np.argmax(column_split[1])]
+
+    if len(indices) <= 1:
+        return [None, None]
+
+    return np.array(dict_values)[indices[:2]]
+
+
+def get_best_pos_bounds(beam, bound_conds):
+    """
+    Boundary conditions used to solve the integration constants, always as
+    rows of `(position, bounds)`.
+    """
+    best_pos_bounds = get_best_position(get_position_conditions(beam, bound_conds))
+    assert isinstance(best_pos_bounds, np.ndarray), "Not enough boundary conditions to solve the beam."
+    if best_pos_bounds.size == best_pos_bounds.shape[0]:
+        best_pos_bounds = best_pos_bounds[None, :]
+
+    return best_pos_bounds
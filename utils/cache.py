@@ -0,0 +1,241 @@
+import os
+import re
+import json
+import hashlib
+import zipfile
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+import sympy as sym
+
+from .support import SupportTypes
+from .columnar import LOAD_CATEGORIES, SUPPORT_CATEGORIES, as_arrays
+from .boundary import BOUNDARY_CONDITIONS
+from .model import Model, LAMBDIFY_MODULES
+from .numeric import PiecewisePolynomial
+
+CACHE_VERSION = 2
+MAX_DISK_ENTRIES = 4096
+
+# The only names an `sym.srepr` of V(x)/M(x) may contain; anything else is not evaluated
+SREPR_NAMES = ("Add", "Mul", "Pow", "Symbol", "Integer", "Rational", "Float", "SingularityFunction")
+
+
+def get_beam_key(beam, bound_conds=None, engine="sympy"):
+    """
+    Canonical hash of everything the solution depends on. Loads are sorted, so
+    the order in which they were added does not change the key.
+    """
+    if bound_conds is None:
+        bound_conds = BOUNDARY_CONDITIONS
+
+    arrays = as_arrays(beam)
+    description = {
+        "L": beam.L,
+        "supports": sorted([position, SUPPORT_CATEGORIES[code].value] for position, code in arrays.supports.tolist()),
+        "loads": sorted([LOAD_CATEGORIES[code].value, magnitude, start, end]
+                        for magnitude, code, start, end in arrays.loads.tolist()),
+        "bound_conds": {(key.value if isinstance(key, SupportTypes) else key): conditions
+                        for key, conditions in bound_conds.items()},
+        "engine": engine
+    }
+    if arrays.tabulated_loads:
+        description["tabulated_loads"] = sorted(load.digest() for load in arrays.tabulated_loads)
+    canonical = json.dumps(description, sort_keys=True, default=repr)
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def parse_srepr(text):
+    """
+    Expression written by `sym.srepr`, evaluated with SymPy constructors from
+    `SREPR_NAMES` only (strings such as 'x' aside), so a tampered cache file
+    cannot run code.
+    """
+    names = set(re.findall(r"[A-Za-z_]\w*", re.sub(r"'[^']*'", "", text))) - {"precision"}
+    assert names <= set(SREPR_NAMES) and "__" not in text, f"Unexpected names in a cached expression: {names}."
+
+    return eval(text, {"__builtins__": {}}, {name: getattr(sym, name) for name in SREPR_NAMES})
+
+
+def entry_to_arrays(entry):
+    """
+    A cache entry as plain arrays for `np.savez`: piecewise polynomials as
+    breaks and coefficients, SymPy expressions as their `sym.srepr`.
+    """
+    arrays = {"engine": np.array(entry["engine"]),
+              "constant_names": np.array(list(entry["constants"]), dtype=str),
+              "constant_values": np.array(list(entry["constants"].values()), dtype=float)}
+    if entry["engine"] == "numeric":
+        arrays.update(breaks=entry["V"].breaks, V=entry["V"].coefs, M=entry["M"].coefs)
+    else:
+        arrays.update(V=np.array(sym.srepr(entry["V"])), M=np.array(sym.srepr(entry["M"])))
+
+    return arrays
+
+
+def entry_from_arrays(arrays):
+    entry = {"engine": str(arrays["engine"]),
+             "constants": dict(zip(arrays["constant_names"].tolist(), arrays["constant_values"].tolist()))}
+    if entry["engine"] == "numeric":
+        entry["V"] = PiecewisePolynomial(arrays["breaks"], arrays["V"])
+        entry["M"] = PiecewisePolynomial(arrays["breaks"], arrays["M"])
+    else:
+        entry["V"], entry["M"] = parse_srepr(str(arrays["V"])), parse_srepr(str(arrays["M"]))
+
+    return entry
+
+
+class ModelCache:
+    """
+    Solved V(x)/M(x) and constants of `Model`, kept in memory (LRU, at most
+    `maxsize` entries) and on disk under `<directory>/v<CACHE_VERSION>/` (LRU
+    by file modification time, at most `max_disk_entries` files and, if given,
+    `max_disk_bytes`). `directory=None` keeps the cache in memory only.
+
+    Files are `.npz` archives of plain arrays and strings (see `entry_to_arrays`),
+    read without pickle, so the directory can be shared across runs and users.
+    """
+
+    def __init__(self, directory="cache", maxsize=128, max_disk_entries=MAX_DISK_ENTRIES, max_disk_bytes=None):
+        self.directory = None if directory is None else os.path.join(directory, f"v{CACHE_VERSION}")
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+        self._entries = OrderedDict()
+
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def cache_info(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "maxsize": self.maxsize, "currsize": len(self._entries), "disk_evictions": self.disk_evictions,
+                "max_disk_entries": self.max_disk_entries, "max_disk_bytes": self.max_disk_bytes}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = self.disk_evictions = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _read(self, key):
+        if self.directory is None:
+            return None
+
+        try:
+            with np.load(self._path(key), allow_pickle=False) as arrays:
+                entry = entry_from_arrays(arrays)
+            os.utime(self._path(key))  # recently used, evicted last
+        except FileNotFoundError:  # never written, or evicted meanwhile
+            return None
+        except (AssertionError, KeyError, ValueError, zipfile.BadZipFile):  # not an entry of this version
+            return None
+
+        return entry
+
+    def _write(self, key, entry):
+        if self.directory is None:
+            return
+
+        # write-then-rename so concurrent readers never see a partial file
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            np.savez(file, **entry_to_arrays(entry))
+        os.replace(temporary, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        """
+        Removes the least recently used files beyond `max_disk_entries` or
+        `max_disk_bytes`. Scans the directory, so processes sharing it are
+        bounded together.
+        """
+        files = []
+        for item in os.scandir(self.directory):
+            if item.name.endswith(".npz"):
+                try:
+                    status = item.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((status.st_mtime, status.st_size, item.path))
+
+        files.sort(reverse=True)
+        n_bytes = 0
+        for count, (_, size, path) in enumerate(files, 1):
+            n_bytes += size
+            over_bytes = self.max_disk_bytes is not None and n_bytes > self.max_disk_bytes
+            if count > self.max_disk_entries or (over_bytes and count > 1):
+                try:
+                    os.remove(path)
+                    self.disk_evictions += 1
+                except FileNotFoundError:
+                    pass
+
+    def _remember(self, key, entry):
+        self._entries[key] = (entry, self._get_functions(entry))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _get_functions(self, entry):
+        if entry["engine"] == "numeric":
+            return entry["V"], entry["M"]
+
+        x = sym.Symbol("x")
+        return (sym.lambdify(x, expr=entry["V"], modules=LAMBDIFY_MODULES),
+                sym.lambdify(x, expr=entry["M"], modules=LAMBDIFY_MODULES))
+
+    def get(self, key):
+        """
+        Returns `(entry, (V, M))` or None; `V` and `M` are callables of x.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        entry = self._read(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._remember(key, entry)
+        return self._entries[key]
+
+    def put(self, key, results):
+        model = results.model
+        if model.shear_equation is None:  # numeric engine or closed form
+            shear, bending = results.piecewise
+            entry = {"engine": "numeric", "V": shear, "M": bending}
+        else:
+            entry = {"engine": "sympy", "V": model.shear_equation.args[1], "M": model.bending_equation.args[1]}
+        entry["constants"] = dict(results.constants)
+
+        self._write(key, entry)
+        self._remember(key, entry)
+        return self._entries[key]
+
+    def solve(self, beam, bound_conds=None, engine="sympy", app=False):
+        """
+        Same `(x, V, M)` as `Model(beam, bound_conds, app, engine).solve()`; the
+        model is only built on a miss, without rendering its report or plots.
+        """
+        key = get_beam_key(beam, bound_conds, engine)
+        cached = self.get(key)
+        if cached is None:
+            model = Model(beam, bound_conds, app, engine=engine)
+            cached = self.put(key, model.solve(report=False, plot=False))
+
+        _, (function_v_x, function_m_x) = cached
+        x_points = np.linspace(0, beam.L, int(beam.L * 100))
+        shear = np.broadcast_to(function_v_x(x_points), x_points.shape).astype(float)
+        bending = np.broadcast_to(function_m_x(x_points), x_points.shape).astype(float)
+
+        return x_points, shear, bending
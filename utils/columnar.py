@@ -0,0 +1,130 @@
+import numpy as np
+
+from .beam import Beam, _overlaps
+from .load import Load, LoadTypes
+from .support import Support, SupportTypes
+
+# Category codes stored in the arrays: the position of the category in its Enum
+LOAD_CATEGORIES = tuple(LoadTypes)
+SUPPORT_CATEGORIES = tuple(SupportTypes)
+LOAD_CODES = {category: code for code, category in enumerate(LOAD_CATEGORIES)}
+SUPPORT_CODES = {category: code for code, category in enumerate(SUPPORT_CATEGORIES)}
+
+# Point loads keep `end == start`, as on a `Beam`
+LOAD_DTYPE = np.dtype([("magnitude", "f8"), ("category", "u1"), ("start", "f8"), ("end", "f8")])
+SUPPORT_DTYPE = np.dtype([("position", "f8"), ("category", "u1")])
+
+
+def load_array(magnitudes, categories, starts, ends=None):
+    """
+    Builds a `LOAD_DTYPE` array from columns; `categories` are `LoadTypes`, their
+    values or codes. As with `Load`, a distributed load without length becomes
+    a centered one (silently).
+    """
+    starts = np.asarray(starts, dtype=float)
+    loads = np.zeros(starts.shape, dtype=LOAD_DTYPE)
+    loads["magnitude"] = magnitudes
+    loads["category"] = _codes(categories, LoadTypes, LOAD_CODES)
+    loads["start"] = starts
+    loads["end"] = starts if ends is None else ends
+
+    centered = (loads["category"] == LOAD_CODES[LoadTypes.centered]) | (loads["end"] == loads["start"])
+    loads["category"][centered] = LOAD_CODES[LoadTypes.centered]
+    loads["end"][centered] = loads["start"][centered]
+
+    return loads
+
+
+def support_array(positions, categories):
+    supports = np.zeros(np.shape(positions), dtype=SUPPORT_DTYPE)
+    supports["position"] = positions
+    supports["category"] = _codes(categories, SupportTypes, SUPPORT_CODES)
+
+    return supports
+
+
+def loads_to_array(loads):
+    return np.array([(load.magnitude, LOAD_CODES[load.category], load.start,
+                      load.start if load.end is None else load.end) for load in loads], dtype=LOAD_DTYPE)
+
+
+def supports_to_array(supports):
+    return np.array([(support.position, SUPPORT_CODES[support.category]) for support in supports],
+                    dtype=SUPPORT_DTYPE)
+
+
+def _codes(categories, enum, codes):
+    categories = np.asarray(categories)
+    if categories.dtype.kind in "iu":
+        return categories
+
+    return np.vectorize(lambda category: codes[enum(category)], otypes=[np.uint8])(categories)
+
+
+class BeamArrays:
+    """
+    Columnar description of a `Beam`: `loads` is a `LOAD_DTYPE` array and
+    `supports` a `SUPPORT_DTYPE` array, both in the order of the beam. Accepted
+    by the numeric solvers and `Plot` as is; `to_beam`/`from_beam` convert
+    to and from the object model without loss. `tabulated_loads` is kept as a
+    list of `TabulatedLoad`, shared with the beam.
+    """
+
+    def __init__(self, h: float, L: float, I: float = 0.0, loads=None, supports=None, E: float = 0.0,
+                 tabulated_loads=None):
+        self.h = float(h)
+        self.L = float(L)
+        self.I = float(I)
+        self.E = float(E)
+        self.loads = np.zeros(0, dtype=LOAD_DTYPE) if loads is None else np.asarray(loads, dtype=LOAD_DTYPE)
+        self.supports = np.zeros(0, dtype=SUPPORT_DTYPE) if supports is None else \
+            np.asarray(supports, dtype=SUPPORT_DTYPE)
+        self.tabulated_loads = [] if tabulated_loads is None else list(tabulated_loads)
+
+        self._handle_invalid_inputs()
+
+    def _handle_invalid_inputs(self):
+        starts, ends = self.loads["start"], self.loads["end"]
+        assert np.all((starts >= 0.0) & (starts <= ends) & (ends <= self.L)), \
+            "Load positions must be within the limits of the beam."
+        assert np.all(self.loads["category"] < len(LOAD_CATEGORIES)), "Unknown load category code."
+
+        order = np.lexsort((ends, starts))
+        starts, ends = starts[order], ends[order]
+        assert not np.any(_overlaps(starts[:-1], ends[:-1], starts[1:], ends[1:])), "Loads overlap each other."
+
+        positions = self.supports["position"]
+        assert np.all((positions >= 0.0) & (positions <= self.L)), \
+            "Support positions must be within the limits of the beam."
+        assert len(np.unique(positions)) == len(positions), "Two supports share a position."
+        assert np.all(self.supports["category"] < len(SUPPORT_CATEGORIES)), "Unknown support category code."
+        assert all(0.0 <= load.start and load.end <= self.L for load in self.tabulated_loads), \
+            "Tabulated loads must be within the limits of the beam."
+
+    @classmethod
+    def from_beam(cls, beam: Beam):
+        return cls(beam.h, beam.L, beam.I, loads_to_array(beam.loads), supports_to_array(beam.supports.values()),
+                   beam.E, beam.tabulated_loads)
+
+    def to_beam(self) -> Beam:
+        beam = Beam(self.h, self.L, self.I, self.E)
+        for position, code in self.supports.tolist():
+            beam.add_support(Support(position, SUPPORT_CATEGORIES[code]))
+
+        beam.add_loads(Load(magnitude, LOAD_CATEGORIES[code], start, end)
+                       for magnitude, code, start, end in self.loads.tolist())
+        for load in self.tabulated_loads:
+            beam.add_tabulated_load(load)
+
+        return beam
+
+    def load_categories(self):
+        """
+        `LoadTypes` present in `loads`, with a boolean mask of their rows.
+        """
+        for code in np.unique(self.loads["category"]):
+            yield LOAD_CATEGORIES[code], self.loads["category"] == code
+
+
+def as_arrays(beam):
+    return beam if isinstance(beam, BeamArrays) else BeamArrays.from_beam(beam)
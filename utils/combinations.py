@@ -0,0 +1,99 @@
+import numpy as np
+
+from .boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from .numeric import LOAD_RESPONSES, get_boundary_system, get_loads_at_bounds
+from .columnar import loads_to_array
+from .continuous import is_end_supported, solve_load_cases
+
+
+class LoadCombinations:
+    """
+    Factored combinations of the basic loads of a `Beam` by superposition.
+
+    Each basic `Load` is solved once on the shared grid `x`; a combination is then
+    `base + factors @ unit`, where `base` carries the prescribed (non-zero) boundary
+    values and `unit[i]` the response of load `i` with homogeneous boundary values.
+    Layouts other than `continuous.is_end_supported` ones (overhangs, continuous
+    beams) get their unit responses from the three-moment solver.
+    """
+
+    def __init__(self, beam, loads=None, bound_conds=None, x=None):
+        if bound_conds is None:
+            bound_conds = BOUNDARY_CONDITIONS
+        if loads is None:
+            loads = beam.loads
+        if x is None:
+            x = np.linspace(0, beam.L, int(beam.L * 100))
+
+        self.beam = beam
+        self.loads = list(loads)
+        self.bound_conds = bound_conds
+        self.x = np.asarray(x, dtype=float)
+        self.base, self.unit = self._solve_basic_cases()
+
+    @property
+    def n_loads(self):
+        return len(self.loads)
+
+    def _solve_basic_cases(self):
+        if not is_end_supported(self.beam):
+            assert self.bound_conds == BOUNDARY_CONDITIONS, \
+                "Custom boundary conditions need supports at both ends or a fixed end (`continuous.is_end_supported`)."
+            return (np.zeros_like(self.x), np.zeros_like(self.x)), \
+                solve_load_cases(self.beam, loads_to_array(self.loads), self.x)
+
+        forces, positions, matrix, values = get_boundary_system(get_best_pos_bounds(self.beam, self.bound_conds))
+
+        unit_shear = np.zeros((self.n_loads, len(self.x)))
+        unit_bending = np.zeros_like(unit_shear)
+        loads_at_bounds = np.zeros((self.n_loads, len(positions)))
+
+        for i, load in enumerate(self.loads):
+            end = load.start if load.end is None else load.end
+            response = LOAD_RESPONSES[load.category]
+            unit_shear[i], unit_bending[i] = response(load.magnitude, load.start, end, self.x)
+
+            shear_at_bounds, bending_at_bounds = response(load.magnitude, load.start, end, positions)
+            loads_at_bounds[i] = get_loads_at_bounds(forces, positions, shear_at_bounds, bending_at_bounds)
+
+        # column 0 are the constants of the unloaded beam, the others one per basic load
+        c1, c2 = np.linalg.solve(matrix, np.column_stack([values, -loads_at_bounds.T]))
+
+        unit_shear += c1[1:, None]
+        unit_bending += c1[1:, None] * self.x + c2[1:, None]
+        base = (np.full_like(self.x, c1[0]), c1[0] * self.x + c2[0])
+
+        return base, (unit_shear, unit_bending)
+
+    def combine(self, factors):
+        """
+        `factors` has shape `(n_combinations, n_loads)`; returns `(x, V, M)` with
+        V and M of shape `(n_combinations, n_points)`.
+        """
+        factors = np.atleast_2d(np.asarray(factors, dtype=float))
+        assert factors.shape[1] == self.n_loads, f"`factors` must have {self.n_loads} columns (one per basic load)."
+
+        shear = self.base[0] + factors @ self.unit[0]
+        bending = self.base[1] + factors @ self.unit[1]
+
+        return self.x, shear, bending
+
+    def envelope(self, factors):
+        """
+        Max/min V and M at every x over the combinations, with the index of the
+        governing combination.
+        """
+        _, shear, bending = self.combine(factors)
+        envelope = {"x": self.x}
+
+        for name, values in (("V", shear), ("M", bending)):
+            index_max = np.argmax(values, axis=0)
+            index_min = np.argmin(values, axis=0)
+            columns = np.arange(values.shape[1])
+
+            envelope[f"{name}_max"] = values[index_max, columns]
+            envelope[f"{name}_max_combination"] = index_max
+            envelope[f"{name}_min"] = values[index_min, columns]
+            envelope[f"{name}_min_combination"] = index_min
+
+        return envelope
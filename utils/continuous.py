@@ -0,0 +1,243 @@
+import numpy as np
+
+from .support import SupportTypes
+from .columnar import BeamArrays, SUPPORT_CODES, supports_to_array, as_arrays
+from .numeric import PiecewisePolynomial, get_breakpoints, get_load_coefs, get_load_responses
+
+
+def get_supports(beam):
+    """
+    Support positions in increasing order and whether each one is fixed.
+    """
+    if isinstance(beam, BeamArrays):
+        positions = beam.supports["position"]
+        fixed = beam.supports["category"] == SUPPORT_CODES[SupportTypes.fixed]
+    else:
+        positions = np.array(list(beam.supports.keys()), dtype=float)
+        fixed = np.array([support.category == SupportTypes.fixed for support in beam.supports.values()], dtype=bool)
+
+    order = np.argsort(positions)
+    return positions[order], fixed[order]
+
+
+def count_reactions(beam):
+    """
+    Unknown support reactions: V and M at fixed supports, V at the others.
+    """
+    _, fixed = get_supports(beam)
+    return len(fixed) + int(np.sum(fixed))
+
+
+def is_determinate(beam):
+    return count_reactions(beam) <= 2
+
+
+def is_end_supported(beam):
+    """
+    Whether the reactions only act at the ends of the beam: pinned/roller
+    supports at 0 and L, or a single fixed support at either end. Only then do
+    V = C1 + V_loads and M = C1 x + C2 + M_loads hold on the whole beam, so two
+    boundary conditions give C1 and C2; any other layout (overhangs, interior
+    supports, continuous beams) is solved by `build_continuous_diagrams`.
+    """
+    positions, fixed = get_supports(beam)
+    if len(positions) == 1:
+        return bool(fixed[0]) and positions[0] in (0.0, beam.L)
+
+    return len(positions) == 2 and not np.any(fixed) and positions[0] == 0.0 and positions[1] == beam.L
+
+
+def solve_tridiagonal(lower, diagonal, upper, rhs):
+    """
+    Thomas algorithm for `lower[i] * u[i - 1] + diagonal[i] * u[i] + upper[i] * u[i + 1] = rhs[i]`
+    (`lower[0]` and `upper[-1]` are ignored). No pivoting: the system must be
+    diagonally dominant. `rhs` may have extra columns, solved together.
+    """
+    n = len(diagonal)
+    upper_prime = np.zeros(n)
+    rhs_prime = np.array(rhs, dtype=float)
+
+    upper_prime[0] = upper[0] / diagonal[0]
+    rhs_prime[0] = rhs_prime[0] / diagonal[0]
+    for i in range(1, n):
+        pivot = diagonal[i] - lower[i] * upper_prime[i - 1]
+        upper_prime[i] = upper[i] / pivot
+        rhs_prime[i] = (rhs_prime[i] - lower[i] * rhs_prime[i - 1]) / pivot
+
+    for i in range(n - 2, -1, -1):
+        rhs_prime[i] -= upper_prime[i] * rhs_prime[i + 1]
+
+    return rhs_prime
+
+
+def get_support_moments(positions, fixed, bending_free, total_shear, L):
+    """
+    Bending moment on each side of every support from the three-moment equation
+    (slope continuity over supports, zero slope at fixed ones), with the moments
+    at the outer supports given by the overhangs. `bending_free` is M(x) of the
+    loads alone, free at x = 0, and `total_shear` the sum of all loads.
+
+    * Returns:
+        moments just left and just right of each support (equal unless fixed)
+    """
+    lengths = np.diff(positions)
+    first_integral = bending_free.antiderivative()
+    second_integral = first_integral.antiderivative()
+
+    a, b = positions[:-1], positions[1:]
+    moment_a, moment_b = bending_free(a), bending_free(b)
+    first_a, first_b = first_integral(a), first_integral(b)
+    second_difference = second_integral(b) - second_integral(a)
+
+    # (1 / l) * integral of (x - a) * M0 and (b - x) * M0 over each span, where M0 is the
+    # simply supported moment: `bending_free` minus the chord between the supports
+    right_terms = (lengths * first_b - second_difference) / lengths - (moment_a / 6 + moment_b / 3) * lengths
+    left_terms = (second_difference - lengths * first_a) / lengths - (moment_a / 3 + moment_b / 6) * lengths
+
+    # one unknown per support, two at fixed ones (moment on each side)
+    left_var = np.cumsum(1 + fixed) - (1 + fixed)
+    right_var = left_var + fixed
+    n_vars = right_var[-1] + 1
+
+    lower, diagonal, upper, rhs = np.zeros(n_vars), np.zeros(n_vars), np.zeros(n_vars), np.zeros(n_vars)
+    spans_left, spans_right = right_var[:-1], left_var[1:]
+    diagonal[spans_left] += 2 * lengths
+    upper[spans_left] += lengths
+    rhs[spans_left] -= 6 * left_terms
+    diagonal[spans_right] += 2 * lengths
+    lower[spans_right] += lengths
+    rhs[spans_right] -= 6 * right_terms
+
+    # overhangs: free beyond the outer supports
+    outer = [(left_var[0], bending_free(positions[0])),
+             (right_var[-1], bending_free(positions[-1]) - bending_free(L) - total_shear * (positions[-1] - L))]
+    for var, moment in outer:
+        lower[var], diagonal[var], upper[var], rhs[var] = 0.0, 1.0, 0.0, moment
+
+    moments = solve_tridiagonal(lower, diagonal, upper, rhs)
+    return moments[left_var], moments[right_var]
+
+
+def build_continuous_diagrams(beam):
+    """
+    V(x) and M(x) of a beam on any number of supports (continuous, propped or
+    fixed-ended) as `PiecewisePolynomial`, for constant E*I. M is the moment of
+    the loads alone plus, on every span, the chord between the support moments;
+    the overhangs are statically determined.
+    """
+    beam = as_arrays(beam)
+    positions, fixed = get_supports(beam)
+    assert len(positions) > 1 or (len(positions) == 1 and fixed[0]), \
+        "A beam needs at least two supports, or a single fixed one."
+
+    breaks = get_breakpoints(beam)
+    shear_coefs, bending_coefs = get_load_coefs(beam, breaks)
+    bending_free = PiecewisePolynomial(breaks, bending_coefs.copy())
+    total_shear = get_load_responses(beam, [beam.L])[0][0]
+
+    left_moments, right_moments = get_support_moments(positions, fixed, bending_free, total_shear, beam.L)
+
+    # linear correction `intercept + slope * x` on [left overhang, spans..., right overhang]
+    lengths = np.diff(positions)
+    start_offsets = right_moments[:-1] - bending_free(positions[:-1])
+    end_offsets = left_moments[1:] - bending_free(positions[1:])
+    span_slopes = (end_offsets - start_offsets) / lengths
+
+    slopes = np.concatenate([[0.0], span_slopes, [-total_shear]])
+    intercepts = np.concatenate([[0.0], start_offsets - span_slopes * positions[:-1],
+                                 [total_shear * beam.L - bending_free(beam.L)]])
+
+    origins = breaks[:-1]
+    region = np.searchsorted(positions, origins, side="right")
+    shear_coefs[:, 0] += slopes[region]
+    bending_coefs[:, 0] += intercepts[region] + slopes[region] * origins
+    bending_coefs[:, 1] += slopes[region]
+
+    return PiecewisePolynomial(breaks, shear_coefs), PiecewisePolynomial(breaks, bending_coefs)
+
+
+def solve_load_cases(beam, loads, x):
+    """
+    V and M on `x` of the support layout of `beam` under each row of `loads`
+    (a `LOAD_DTYPE` array) on its own; the loads of `beam` are ignored.
+
+    * Returns:
+        V, M of shape `(len(loads), len(x))`
+    """
+    supports = beam.supports if isinstance(beam, BeamArrays) else supports_to_array(beam.supports.values())
+    shear, bending = np.zeros((len(loads), len(x))), np.zeros((len(loads), len(x)))
+    for i in range(len(loads)):
+        case = BeamArrays(beam.h, beam.L, beam.I, loads[i:i + 1], supports, beam.E)
+        case_shear, case_bending = build_continuous_diagrams(case)
+        shear[i], bending[i] = case_shear(x), case_bending(x)
+
+    return shear, bending
+
+
+def get_reactions(beam, shear, bending):
+    """
+    Support reactions as the jumps of V and M at each support, after removing the
+    jumps caused by the loads (V and M vanish outside the beam).
+
+    * Returns:
+        {"positions": ..., "V": forces, "M": moments (zero unless fixed)}
+    """
+    beam = as_arrays(beam)
+    positions, _ = get_supports(beam)
+    breaks = shear.breaks
+    shear_free, bending_free = (PiecewisePolynomial(breaks, coefs) for coefs in get_load_coefs(beam, breaks))
+    total_shear = get_load_responses(beam, [beam.L])[0][0]
+
+    def offsets(polynomial, free, x, index):
+        return polynomial.evaluate(x, index) - free.evaluate(x, index)
+
+    n_segments = len(breaks) - 1
+    left = np.searchsorted(breaks, positions, side="left") - 1
+    right = np.searchsorted(breaks, positions, side="right") - 1
+    at_start, at_end = left < 0, right >= n_segments
+    left, right = np.clip(left, 0, n_segments - 1), np.clip(right, 0, n_segments - 1)
+
+    reactions = {"positions": positions}
+    for name, polynomial, free, outside in (("V", shear, shear_free, -total_shear),
+                                           ("M", bending, bending_free, -bending_free(beam.L))):
+        before = np.where(at_start, 0.0, offsets(polynomial, free, positions, left))
+        after = np.where(at_end, outside, offsets(polynomial, free, positions, right))
+        reactions[name] = after - before
+
+    return reactions
+
+
+def build_deflection(beam, bending):
+    """
+    Slope and deflection from E*I w'' = M, with w = 0 at the supports (and w' = 0
+    at a fixed one); the first support and either its slope or the next support
+    fix the integration constants.
+
+    * Returns:
+        slope, deflection as `PiecewisePolynomial`
+    """
+    rigidity = beam.E * beam.I
+    assert rigidity > 0, "Deflections need the beam modulus `E` and inertia `I`."
+
+    positions, fixed = get_supports(beam)
+    assert len(positions) > 1 or (len(positions) == 1 and fixed[0]), \
+        "A beam needs at least two supports, or a single fixed one."
+    slope = bending.antiderivative()
+    deflection = slope.antiderivative()
+
+    # E*I w = deflection(x) + C3 * x + C4
+    if fixed[0]:
+        matrix = np.array([[positions[0], 1.0], [1.0, 0.0]])
+        values = -np.array([deflection(positions[0]), slope(positions[0])])
+    else:
+        matrix = np.column_stack([positions[:2], np.ones(2)])
+        values = -deflection(positions[:2])
+    c3, c4 = np.linalg.solve(matrix, values)
+
+    origins = slope.breaks[:-1]
+    slope.coefs[:, 0] += c3
+    deflection.coefs[:, 0] += c3 * origins + c4
+    deflection.coefs[:, 1] += c3
+
+    return (PiecewisePolynomial(slope.breaks, slope.coefs / rigidity),
+            PiecewisePolynomial(deflection.breaks, deflection.coefs / rigidity))
@@ -0,0 +1,100 @@
+import time
+import logging
+from collections import defaultdict
+
+# Phases reported by `Model` and `ModelResults`
+PHASES = ("derive_equations", "select_boundary_conditions", "solve_for_force", "substitute", "lambdify",
+          "build_diagrams", "evaluate", "plot", "write_report", "solve")
+
+
+class _Phase:
+    """
+    Times a `with` block and sends `{"phase", "duration", **info}` to the
+    observer when it ends (also when it raises, with `"error"` set). The event
+    returned by `__enter__` can be filled with sizes computed inside the block.
+    """
+
+    __slots__ = ("observer", "event", "start")
+
+    def __init__(self, observer, name, info):
+        self.observer = observer
+        self.event = {"phase": name, **info}
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.event["duration"] = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.event["error"] = exc_type.__name__
+        self.observer(self.event)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(observer, name, **info):
+    """
+    `with phase(observer, "lambdify", n_loads=3) as event: ...`; without an
+    observer it only costs a function call.
+    """
+    if observer is None:
+        return _NULL_PHASE
+
+    return _Phase(observer, name, info)
+
+
+class EventRecorder:
+    """
+    Observer that keeps every event, e.g. to find the slow phase of a beam.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def totals(self):
+        """
+        `{phase: {"count", "duration"}}` summed over the recorded events.
+        """
+        totals = defaultdict(lambda: {"count": 0, "duration": 0.0})
+        for event in self.events:
+            totals[event["phase"]]["count"] += 1
+            totals[event["phase"]]["duration"] += event["duration"]
+
+        return dict(totals)
+
+    def clear(self):
+        self.events.clear()
+
+
+class LoggingObserver:
+    """
+    Observer that logs one line per event; the event itself goes in the record's
+    `event` attribute for structured handlers.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger if logger is not None else logging.getLogger("beam")
+        self.level = level
+
+    def __call__(self, event):
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        details = " ".join(f"{key}={value}" for key, value in event.items() if key not in ("phase", "duration"))
+        self.logger.log(self.level, "%s %.6fs %s", event["phase"], event["duration"], details,
+                        extra={"event": event})
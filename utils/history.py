@@ -0,0 +1,104 @@
+import numpy as np
+
+from .model import Model
+from .columnar import BeamArrays, as_arrays
+from .boundary import BOUNDARY_CONDITIONS
+
+
+class TimeHistory:
+    """
+    V and M of a fixed beam layout under a stream of load frames. A frame holds
+    the magnitudes of the loads of `beam`, in the order of `beam.loads` (their
+    positions and categories stay fixed). Responses are linear in the
+    magnitudes, so they come from one precomputed operator:
+    `[V; M] = operator @ frame + offset`. The offset is the response to the
+    tabulated loads and to any non-zero value in `bound_conds`.
+
+    `sections` are the monitored positions (right limits at a jump); with
+    `n_points`, the diagrams on `x = linspace(0, L, n_points)` are available too.
+    """
+
+    def __init__(self, beam, sections, bound_conds=None, n_points=None):
+        if bound_conds is None:
+            bound_conds = BOUNDARY_CONDITIONS
+
+        self.arrays = as_arrays(beam)
+        self.bound_conds = bound_conds
+        self.sections = np.atleast_1d(np.asarray(sections, dtype=float))
+        self.x = None if n_points is None else np.linspace(0, self.arrays.L, n_points)
+        self.n_loads = len(self.arrays.loads)
+        self.operator, self.offset = self._build_operator()
+
+    def _solve(self, loads, tabulated_loads=None):
+        """
+        V and M at the sections, then on `x` when there is a grid.
+        """
+        arrays = BeamArrays(self.arrays.h, self.arrays.L, self.arrays.I, loads, self.arrays.supports, self.arrays.E,
+                            tabulated_loads)
+        shear, bending = Model(arrays, self.bound_conds, engine="numeric").solve().piecewise
+        grids = [self.sections] if self.x is None else [self.sections, self.x]
+
+        return np.concatenate([function(points) for points in grids for function in (shear, bending)])
+
+    def _build_operator(self):
+        """
+        Column `j` is the response to load `j` with unit magnitude, minus the
+        response to no load at all (not zero when `bound_conds` prescribes values).
+        """
+        unloaded = self._solve(self.arrays.loads[:0])
+        offset = self._solve(self.arrays.loads[:0], self.arrays.tabulated_loads)
+
+        operator = np.empty((len(offset), self.n_loads))
+        for j in range(self.n_loads):
+            unit = self.arrays.loads[j:j + 1].copy()
+            unit["magnitude"] = 1.0
+            operator[:, j] = self._solve(unit) - unloaded
+
+        return operator, offset
+
+    def respond(self, frames, diagrams=False):
+        """
+        Responses to one frame (shape `(n_loads,)`) or a block of frames (shape
+        `(n_frames, n_loads)`).
+
+        * Returns:
+            V, M at the sections and, with `diagrams`, V, M on `x`; each with the
+            leading shape of `frames`
+        """
+        frames = np.asarray(frames, dtype=float)
+        assert frames.shape[-1] == self.n_loads, f"A frame must have {self.n_loads} magnitudes."
+        assert not diagrams or self.x is not None, "Diagrams need `n_points`."
+
+        rows = len(self.offset) if diagrams else 2 * len(self.sections)
+        responses = frames @ self.operator[:rows].T + self.offset[:rows]
+        return self._split(responses)
+
+    def _split(self, responses):
+        n_sections = len(self.sections)
+        values = (responses[..., :n_sections], responses[..., n_sections:2 * n_sections])
+        if responses.shape[-1] == 2 * n_sections:
+            return values
+
+        n_grid = len(self.x)
+        return values + (responses[..., 2 * n_sections:2 * n_sections + n_grid],
+                         responses[..., 2 * n_sections + n_grid:])
+
+    def stream(self, frames, diagrams=False):
+        """
+        Yields `respond(item, diagrams)` for each item of `frames`, lazily, so
+        memory does not grow with the stream. Items can be single frames (lowest
+        latency) or blocks of frames (highest throughput).
+        """
+        assert not diagrams or self.x is not None, "Diagrams need `n_points`."
+
+        rows = len(self.offset) if diagrams else 2 * len(self.sections)
+        operator, offset = np.ascontiguousarray(self.operator[:rows].T), self.offset[:rows]
+        for item in frames:
+            yield self._split(np.asarray(item, dtype=float) @ operator + offset)
+
+    async def astream(self, frames, diagrams=False):
+        """
+        `stream` for an async iterable of frames, e.g. a sensor feed.
+        """
+        async for item in frames:
+            yield self.respond(item, diagrams)
@@ -0,0 +1,90 @@
+import numpy as np
+
+from .load import LoadTypes
+from .boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from .numeric import LOAD_RESPONSES, get_boundary_system, get_loads_at_bounds
+from .columnar import load_array
+from .continuous import is_end_supported, solve_load_cases
+
+
+class InfluenceLines:
+    """
+    Influence lines of V and M at `sections` for the support layout of a `Beam`:
+    `shear[s, i]` is V at `sections[s]` due to a unit point load at `positions[i]`.
+    The loads already added to `beam` are ignored. Layouts other than
+    `continuous.is_end_supported` ones (overhangs, continuous beams) are solved
+    by the three-moment solver, one unit load at a time.
+    """
+
+    def __init__(self, beam, sections, bound_conds=None, n_points=None):
+        if bound_conds is None:
+            bound_conds = BOUNDARY_CONDITIONS
+        if n_points is None:
+            n_points = int(beam.L * 100) + 1  # step of 0.01 for integer lengths, so axle spacings fall on the grid
+
+        self.beam = beam
+        self.bound_conds = bound_conds
+        self.sections = np.atleast_1d(np.asarray(sections, dtype=float))
+        self.positions = np.linspace(0, beam.L, n_points)
+        self.step = self.positions[1] - self.positions[0]
+        self.shear, self.bending = self._solve_unit_loads()
+
+    def _solve_unit_loads(self):
+        if not is_end_supported(self.beam):
+            assert self.bound_conds == BOUNDARY_CONDITIONS, \
+                "Custom boundary conditions need supports at both ends or a fixed end (`continuous.is_end_supported`)."
+            shear, bending = solve_load_cases(self.beam, load_array(1.0, LoadTypes.centered, self.positions),
+                                              self.sections)
+            return shear.T, bending.T
+
+        forces, positions, matrix, _ = get_boundary_system(get_best_pos_bounds(self.beam, self.bound_conds))
+        response = LOAD_RESPONSES[LoadTypes.centered]
+        unit_positions = self.positions[:, None]
+
+        shear_at_bounds, bending_at_bounds = response(1.0, unit_positions, unit_positions, positions)
+        loads_at_bounds = get_loads_at_bounds(forces, positions, shear_at_bounds, bending_at_bounds)
+        c1, c2 = np.linalg.solve(matrix, -loads_at_bounds.T)
+
+        shear, bending = response(1.0, unit_positions, unit_positions, self.sections)
+        shear += c1[:, None]
+        bending += c1[:, None] * self.sections + c2[:, None]
+
+        return shear.T, bending.T
+
+    def sweep(self, spacings, magnitudes):
+        """
+        Rolls a train of point loads across the beam. `spacings` are the distances
+        between consecutive axles (rounded to the influence-line step) and
+        `magnitudes` the axle loads, lead axle first.
+
+        * Returns:
+            dict with the lead-axle positions, V and M of shape (n_sections, n_positions)
+            and, per section, the max/min values with the lead-axle position causing them.
+        """
+        magnitudes = np.atleast_1d(np.asarray(magnitudes, dtype=float))
+        offsets = np.concatenate([[0.0], np.cumsum(spacings)])
+        assert len(offsets) == len(magnitudes), "`spacings` must have one entry less than `magnitudes`."
+
+        shifts = np.rint(offsets / self.step).astype(int)
+        n_positions = len(self.positions) + shifts.max()
+        lead_positions = np.arange(n_positions) * self.step
+
+        # discrete convolution of the influence lines with the axle train
+        shear = np.zeros((len(self.sections), n_positions))
+        bending = np.zeros_like(shear)
+        for shift, magnitude in zip(shifts, magnitudes):
+            shear[:, shift:shift + len(self.positions)] += magnitude * self.shear
+            bending[:, shift:shift + len(self.positions)] += magnitude * self.bending
+
+        result = {"sections": self.sections, "positions": lead_positions, "V": shear, "M": bending}
+        for name, values in (("V", shear), ("M", bending)):
+            index_max = np.argmax(values, axis=1)
+            index_min = np.argmin(values, axis=1)
+            rows = np.arange(values.shape[0])
+
+            result[f"{name}_max"] = values[rows, index_max]
+            result[f"{name}_max_position"] = lead_positions[index_max]
+            result[f"{name}_min"] = values[rows, index_min]
+            result[f"{name}_min_position"] = lead_positions[index_min]
+
+        return result
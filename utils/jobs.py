@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+
+from .model import Model
+from .results import ModelResults
+from .schema import beam_from_dict, bound_conds_from_dict
+from .write_report import MemorySink, NullSink
+from .continuous import is_end_supported
+from .boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from .numeric import get_boundary_system, get_load_responses, get_loads_at_bounds
+
+
+def solve_report(definition: dict) -> str:
+    """
+    Solves a beam definition (see `schema.beam_from_dict`) symbolically and
+    returns its Markdown report.
+    """
+    model = Model(beam_from_dict(definition), sink=MemorySink())
+    results = model.solve(report=True, plot=False)
+
+    return results.report()
+
+
+def solve_definition(definition: dict, diagrams: bool = False) -> dict:
+    """
+    Solves a beam definition with the numeric engine. An optional "bound_conds"
+    entry is read with `schema.bound_conds_from_dict`.
+
+    * Returns:
+        {"reactions": {"positions", "V", "M"}, "extrema": {"V", "M"}, "constants": {...},
+         "diagrams": {"x", "V", "M"} on the adaptive grid, only with `diagrams`}
+    """
+    model = Model(beam_from_dict(definition), _get_bound_conds(definition), engine="numeric", sink=NullSink())
+    return _format_results(model.solve(report=False, plot=False), diagrams)
+
+
+def _get_bound_conds(definition):
+    bound_conds = definition.get("bound_conds")
+    return BOUNDARY_CONDITIONS if bound_conds is None else bound_conds_from_dict(bound_conds)
+
+
+def _format_results(results, diagrams):
+    result = {"reactions": {name: values.tolist() for name, values in results.reactions.items()},
+              "extrema": results.extrema(),
+              "constants": results.constants}
+    if diagrams:
+        x, shear, bending = results.sample()
+        result["diagrams"] = {"x": x.tolist(), "V": shear.tolist(), "M": bending.tolist()}
+
+    return result
+
+
+def solve_chunk(chunk: list, diagrams: bool = False) -> list:
+    """
+    Solves `(index, definition)` pairs, where a definition may still be a JSON
+    line. A beam that fails gives `{"index", "id", "error"}` and the others go on.
+    """
+    results = []
+    for index, definition in chunk:
+        result = {"index": index}
+        try:
+            if isinstance(definition, str):
+                definition = json.loads(definition)
+            if "id" in definition:
+                result["id"] = definition["id"]
+            result.update(solve_definition(definition, diagrams))
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        results.append(result)
+
+    return results
+
+
+def get_layout_key(definition: dict) -> str:
+    """
+    What beams must share to be solved together: length, supports and
+    boundary conditions.
+    """
+    supports = sorted((support["position"], support["type"]) for support in definition.get("supports", []))
+    return json.dumps([definition["L"], supports, definition.get("bound_conds")], sort_keys=True)
+
+
+def solve_group(definitions: list, diagrams: bool = False) -> list:
+    """
+    `solve_definition` for beams with the same `get_layout_key`. When the
+    supports are at the ends (`continuous.is_end_supported`), the boundary
+    conditions are selected once and the integration constants of every beam
+    come from one linear solve; each beam only adds its load responses at the
+    boundary positions. Other layouts are solved beam by beam. A beam that fails
+    gives `{"error"}`; with `"report": true` its Markdown report is added.
+    """
+    results = [None] * len(definitions)
+    models = []
+    for index, definition in enumerate(definitions):
+        try:
+            models.append((index, Model(beam_from_dict(definition), _get_bound_conds(definition), engine="numeric",
+                                        sink=NullSink())))
+        except Exception as error:
+            results[index] = {"error": f"{type(error).__name__}: {error}"}
+
+    constants = [None] * len(models)
+    if models and is_end_supported(models[0][1].beam):
+        layout = models[0][1]
+        try:
+            forces, positions, matrix, values = get_boundary_system(get_best_pos_bounds(layout.beam,
+                                                                                        layout.bound_conds))
+            loads_at_bounds = np.array([get_loads_at_bounds(forces, positions,
+                                                            *get_load_responses(model.beam, positions))
+                                        for _, model in models])
+            c1, c2 = np.linalg.solve(matrix, (values - loads_at_bounds).T)
+            constants = [{"C1": c1[k], "C2": c2[k]} for k in range(len(models))]
+        except Exception:
+            pass  # each beam is solved (and fails) on its own below
+
+    for (index, model), model_constants in zip(models, constants):
+        try:
+            if model_constants is None:
+                model_results = model.solve(report=False, plot=False)
+            else:
+                model_results = ModelResults(model, model_constants)
+            results[index] = _format_results(model_results, diagrams)
+            if definitions[index].get("report"):
+                results[index]["report"] = solve_report(definitions[index])
+        except Exception as error:
+            results[index] = {"error": f"{type(error).__name__}: {error}"}
+
+    return results
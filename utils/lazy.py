@@ -0,0 +1,24 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stands for a module that is only imported on first attribute access, e.g.
+    `sym = LazyModule("sympy")`, so that the numeric path never loads it.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"LazyModule({self._name!r}, {state})"
@@ -14,6 +14,8 @@ class Load:
     """
     """
 
+    __slots__ = ("magnitude", "category", "start", "end")
+
     def __init__(self, magnitude: float, category: LoadTypes, start: float, end: float = None):
         self.magnitude = float(magnitude)
         self.category = category
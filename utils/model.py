@@ -1,30 +1,17 @@
-from .support import SupportTypes
 from .load import LoadTypes
-from .write_report import Writer
-from .plot_beam import Plot
+from .boundary import BOUNDARY_CONDITIONS, get_position_conditions, get_best_position, get_best_pos_bounds
+from .results import ModelResults
+from .columnar import BeamArrays
+from . import numeric, continuous, standard
+from .events import phase
+from .lazy import LazyModule
 
 import numpy as np
-import sympy as sym
 from collections import ChainMap
 
-BOUNDARY_CONDITIONS = {
-    SupportTypes.fixed: {
-        "M": "?",
-        "V": "?"
-    },
-    SupportTypes.roller: {
-        "M": 0.0,
-        "V": "?"
-    },
-    SupportTypes.pinned: {
-        "M": 0.0,
-        "V": "?"
-    },
-    "free": {
-        "M": 0.0,
-        "V": 0.0
-    }
-}
+# SymPy (and Matplotlib, through `Plot`) only load when the `sympy` engine, the
+# report or the plots are used
+sym = LazyModule("sympy")
 
 LOAD_STEP_EQUATIONS = {
     LoadTypes.centered: lambda p, _, a: p * sym.SingularityFunction(sym.Symbol('x'), a, -1),
@@ -32,86 +19,207 @@ LOAD_STEP_EQUATIONS = {
     LoadTypes.uniformlyVarying: lambda p, b, a: (p / b) * sym.SingularityFunction(sym.Symbol('x'), a, 1)
 }
 
+# Terms that cancel a distributed load after its end position (only needed when it ends before L)
+LOAD_END_EQUATIONS = {
+    LoadTypes.uniformlyDistributed: lambda p, _, e: -p * sym.SingularityFunction(sym.Symbol('x'), e, 0),
+    LoadTypes.uniformlyVarying: lambda p, b, e: -(p / b) * sym.SingularityFunction(sym.Symbol('x'), e, 1)
+                                                - p * sym.SingularityFunction(sym.Symbol('x'), e, 0)
+}
+
+LAMBDIFY_MODULES = [{"SingularityFunction": lambda x, a, e: (x - a) ** e * (x > a)}, "numpy"]
+
+ENGINES = ("sympy", "numeric")
+
+
+def _as_powers(expression):
+    """
+    <x - 0>^n as x^n, as `dsolve` integrates q(x) when it is a single term
+    starting at 0 (e.g. a uniform load over the whole beam).
+    """
+    return expression.replace(lambda term: isinstance(term, sym.SingularityFunction) and term.args[1] == 0,
+                              lambda term: term.args[0] ** term.args[2])
+
+
+def left_limit_at_start(expression):
+    """
+    Steps and impulses of the loads that may start at 0 replaced by 0, so that
+    `expression` at x = 0 is taken before them (left limit) and a free end at 0
+    does not cancel its own load, as `standard._cantilever_end`. Other terms are
+    kept, so the report shows them as before.
+    """
+    return expression.replace(lambda term: isinstance(term, sym.SingularityFunction) and term.args[2] <= 0
+                              and not term.args[1].is_positive, lambda term: sym.S.Zero)
+
 
 class Model:
-    def __init__(self, beam, bound_conds=None, app=False):
+    def __init__(self, beam, bound_conds=None, app=False, engine="sympy", sink=None, observer=None):
+        """
+        `engine="sympy"` derives the equations symbolically and writes the report;
+        `engine="numeric"` builds V(x) and M(x) as piecewise polynomials instead and
+        also solves overhangs, interior supports and statically indeterminate beams
+        (see `continuous.is_end_supported`); those only take the default `bound_conds`.
+        `sink` receives the report (see `write_report`), a new file in `reports/` by default.
+        `beam` may also be a `BeamArrays`; the `sympy` engine converts it to a `Beam`.
+        `observer` is called with a timing event per phase (see `events.phase`).
+        The `Writer` and the `Plot` are only built when a report or a plot is rendered,
+        and the equations (q, V, M) when first used.
+        """
+        assert engine in ENGINES, f"Engine must be one of {ENGINES}."
         if bound_conds is None:
             bound_conds = BOUNDARY_CONDITIONS
+        if engine == "sympy" and isinstance(beam, BeamArrays):
+            beam = beam.to_beam()
+        assert engine == "numeric" or not beam.tabulated_loads, "Tabulated loads need the `numeric` engine."
 
-        self.writer = Writer()
+        self.sink = sink
+        self._writer = None
+        self._plotter = None
         self.beam = beam
         self.bound_conds = bound_conds
-        self.plotter = Plot(self.beam.L, self.beam.supports, self.beam.loads, app)
-        self.q, self.M, self.V = self._define_equations()
+        self.engine = engine
+        self.observer = observer
+        self.app = app
+        self._derivation = None
+        self._equations = None
+        self._load_terms = {}  # (start, end) -> terms of the load in q(x), V(x), M(x)
+        self.shear_equation, self.bending_equation = None, None
+
+    @property
+    def writer(self):
+        if self._writer is None:
+            from .write_report import Writer
+            self._writer = Writer(self.sink)
+
+        return self._writer
+
+    @property
+    def plotter(self):
+        if self._plotter is None:
+            from .plot_beam import Plot
+            self._plotter = Plot(self.beam.L, self.beam.supports, self.beam.loads, self.app)
+
+        return self._plotter
+
+    @property
+    def q(self):
+        return self._get_equations()[0]
+
+    @property
+    def M(self):
+        return self._get_equations()[1]
+
+    @property
+    def V(self):
+        return self._get_equations()[2]
+
+    def _get_equations(self):
+        """
+        Integrates the loads that have no terms yet (see `_get_load_terms`) and
+        sums the terms of every load.
+        """
+        if self._equations is None:
+            loads = [load for load in self.beam.loads if (load.start, load.end) not in self._load_terms]
+            with phase(self.observer, "derive_equations", stage="load_function", n_loads=len(loads)) as event:
+                for load in loads:
+                    self._load_terms[(load.start, load.end)] = self._get_load_terms(load)
+                self._equations = self._define_equations()
+                event["n_terms"] = len(sym.Add.make_args(self._equations[0].args[1]))
 
-    def _define_equations(self):
+        return self._equations
+
+    def _get_load_terms(self, load):
+        """
+        Singularity terms of one load in q(x) and their integrals in V(x) and M(x)
+        (without integration constants). Integrals are linear, so the equations
+        of the beam are the sums of these terms.
+        """
+        x = sym.Symbol("x")
+        end = 0.0 if load.end is None else load.end
 
+        functions = LOAD_STEP_EQUATIONS[load.category](sym.Rational(str(load.magnitude)),
+                                                       sym.Rational(str(np.abs(end - load.start))),
+                                                       sym.Rational(str(load.start)))
+        if load.category in LOAD_END_EQUATIONS and end < self.beam.L:
+            functions += LOAD_END_EQUATIONS[load.category](sym.Rational(str(load.magnitude)),
+                                                           sym.Rational(str(np.abs(end - load.start))),
+                                                           sym.Rational(str(end)))
+
+        shear = sym.integrate(functions, x)
+        return functions, shear, sym.integrate(shear, x)
+
+    def _define_equations(self):
+        """
+        q(x), M(x) and V(x) of the current loads, with M = C1 x + C2 + ... and
+        V = C1 + ... as `dsolve` would give them (see `_as_powers`).
+        """
         x = sym.Symbol("x")
+        c1, c2 = sym.symbols("C1 C2")
         q = sym.Function("q")(x)
         V = sym.Function("V")(x)
         M = sym.Function("M")(x)
 
-        functions = 0.0
-        for load in self.beam.loads:
-            end = 0.0 if load.end is None else load.end
-            functions += LOAD_STEP_EQUATIONS[load.category](sym.Rational(str(load.magnitude)),
-                                                            sym.Rational(str(np.abs(end - load.start))),
-                                                            sym.Rational(str(load.start)))
+        terms = [self._load_terms[(load.start, load.end)] for load in self.beam.loads]
+        functions = sym.sympify(sum((load_terms[0] for load_terms in terms), 0.0))  # 0.0 without loads
+        shear = sum((load_terms[1] for load_terms in terms), 0.0)
+        bending = sum((load_terms[2] for load_terms in terms), 0.0)
 
-        q = sym.Eq(q, functions)
-        V = sym.dsolve(sym.Eq(V.diff(x), functions))
-        M = sym.dsolve(sym.Eq(M.diff(x, x), functions))
+        # keeps the report as `dsolve` wrote it: a lone term from 0 is integrated as powers of x
+        singularities = functions.atoms(sym.SingularityFunction) if len(sym.Add.make_args(functions)) == 1 else ()
+        if len(singularities) == 1 and all(term.args[1] == 0 and term.args[2] >= 0 for term in singularities):
+            shear, bending = _as_powers(shear), _as_powers(bending)
 
-        return q, M, V
+        return sym.Eq(q, functions), sym.Eq(M, c1 * x + c2 + bending), sym.Eq(V, c1 + shear)
 
-    def _get_best_position(self, dict_values):
+    def _changed(self):
         """
-        [(position, {'M': 'Value', 'V': 'Value'}), ...]
-
-        * Conditions:
-            1) Two equal forces equals zero at different positions.
-                - [M(x->0):0; M(x->L):0] or [V(x->0):0; V(x->L):0]
-            2) Two different forces equals zero at the same position
-                - [M(x->0):0; V(x->L):0] or [M(x->L):0; V(x->0):0]
-
-        * Returns:
-            [position, [[force: 0.0], [force: 0.0], ...]]
+        Drops what depends on the previous beam; the equations are re-summed from
+        the cached load terms when next used.
         """
+        self._derivation = None
+        self._plotter = None
+        self._equations = None
+        self.shear_equation, self.bending_equation = None, None
 
-        dict_conditions = [condition[1] for condition in dict_values]
-        values = np.array([list(value.values()) for value in dict_conditions])
-        print("VALUES:\n", values)
-        main_condition = (values != "?")
-
-        valid_values = np.sum(main_condition)
-        if valid_values <= 1:
-            return [None, None]
-
-        # 1st CASE: TWO VALUES IN ONE POSITION
-        indices = np.argwhere(main_condition.all(axis=1)).flatten()
-        if len(indices) > 0:
-            return np.array(dict_values)[indices[0]]
-
-        # 2nd CASE: VALUES IN DIFFERENT POSITIONS
-        column_split = np.hsplit(main_condition, 2)
+    def add_load(self, load):
+        """
+        Adds `load` to the beam. Only its own terms are integrated (when the
+        equations are next used); the next `solve` re-solves the integration constants.
+        """
+        assert not isinstance(self.beam, BeamArrays), "Incremental updates need a `Beam`."
+        self.beam.add_load(load)
+        self._changed()
 
-        if not any(column_split[0]):
-            indices = np.where(column_split[1] == np.amax(column_split[1]))[0][:2]
+    def remove_load(self, position):
+        assert not isinstance(self.beam, BeamArrays), "Incremental updates need a `Beam`."
+        self.beam.remove_load(position)
+        self._load_terms.pop(tuple(position), None)
+        self._changed()
 
-        elif not any(column_split[1]):
-            indices = np.where(column_split[0] == np.amax(column_split[0]))[0][:2]
+    def set_support(self, support):
+        """
+        Adds `support`, replacing the one at its position if any. The equations do
+        not depend on the supports, only the boundary conditions do.
+        """
+        assert not isinstance(self.beam, BeamArrays), "Incremental updates need a `Beam`."
+        if self.beam.supports.__contains__(support.position):
+            self.beam.supports.pop(support.position)
+        self.beam.add_support(support)
+        self._changed()
 
-        else:
-            indices = [np.argmax(column_split[0]), np.argmax(column_split[1])]
+    def remove_support(self, position):
+        assert not isinstance(self.beam, BeamArrays), "Incremental updates need a `Beam`."
+        self.beam.remove_support(position)
+        self._changed()
 
-        if len(indices) <= 1:
-            return [None, None]
+    def _get_position_conditions(self):
+        return get_position_conditions(self.beam, self.bound_conds)
 
-        return np.array(dict_values)[indices[:2]]
+    def _get_best_position(self, dict_values):
+        return get_best_position(dict_values)
 
     def solve_for_force(self, force: str, equations: dict, position: int, value_force: int, subs={}):
         x = sym.Symbol("x")
-        equation = equations[force]
+        equation = left_limit_at_start(equations[force]) if position == 0 else equations[force]
         result = {}
 
         force_at_pos = equation.subs(dict(ChainMap({x: position}, subs)))
@@ -121,25 +229,127 @@ class Model:
         for var in variables:
             result[var] = sym.solve(force_at_pos.args[1], var, rational=False)[0]
 
-        if len(result) > 0:
-            with sym.evaluate(False):
-                self.writer.write_equation([
-                    f"{sym.latex(equation.subs(dict(ChainMap({x: position}, subs))))} = {sym.latex(value_force)}"
-                ])
-                
-                if value_force != 0.0:
-                    self.writer.write_equation([
-                        f"{sym.latex(equation.subs(dict(ChainMap({x: position}, subs))))} = {sym.latex(value_force)}"
-                    ])
-                    
-            self.writer.write_equation([f"{sym.latex(force_at_pos.args[1])} = {value_force}"])
-
-            for var, value in result.items():
-                self.writer.write_equation([f"{sym.latex(sym.Eq(var, value))}"], box=True)
-
         return result
 
-    def solve(self):
+    def _write_force_solution(self, force: str, equations: dict, position: int, value_force: int, subs: dict,
+                              result: dict):
+        if len(result) == 0:
+            return
+
+        x = sym.Symbol("x")
+        equation = left_limit_at_start(equations[force]) if position == 0 else equations[force]
+
+        with sym.evaluate(False):
+            self.writer.write_equation([
+                f"{sym.latex(equation.subs(dict(ChainMap({x: position}, subs))))} = {sym.latex(value_force)}"
+            ])
+
+        force_at_pos = equation.subs(dict(ChainMap({x: position}, subs)))
+        force_at_pos = sym.Eq(force_at_pos.lhs, force_at_pos.rhs - value_force)
+        self.writer.write_equation([f"{sym.latex(force_at_pos.args[1])} = {value_force}"])
+
+        for var, value in result.items():
+            self.writer.write_equation([f"{sym.latex(sym.Eq(var, value))}"], box=True)
+
+    def _solve_closed_form(self, topology):
+        """
+        Constants and reactions from `standard.solve_standard`, without selecting
+        nor solving boundary conditions; the diagrams are built when first used.
+        """
+        self.constants, reactions = standard.solve_standard(self.beam, topology)
+
+        results = ModelResults(self, self.constants)
+        results._reactions = reactions
+        return results
+
+    def _solve_numeric(self):
+        if continuous.is_end_supported(self.beam):
+            with phase(self.observer, "select_boundary_conditions") as event:
+                best_pos_bounds = get_best_pos_bounds(self.beam, self.bound_conds)
+                event["n_selected"] = len(best_pos_bounds)
+
+            with phase(self.observer, "build_diagrams", method="end_supported") as event:
+                self.shear, self.bending, self.constants = numeric.build_diagrams(self.beam, best_pos_bounds)
+                event["n_segments"] = len(self.shear.breaks) - 1
+        else:
+            assert self.bound_conds == BOUNDARY_CONDITIONS, \
+                "Custom boundary conditions need supports at both ends or a fixed end (`continuous.is_end_supported`)."
+            with phase(self.observer, "build_diagrams", method="three_moment") as event:
+                self.shear, self.bending = continuous.build_continuous_diagrams(self.beam)
+                self.constants = {}
+                event["n_segments"] = len(self.shear.breaks) - 1
+
+        return ModelResults(self, self.constants, self.shear, self.bending, piecewise=(self.shear, self.bending))
+
+    def _solve_symbolic(self):
+        assert continuous.is_end_supported(self.beam), \
+            "Overhangs, interior supports and statically indeterminate beams are only solved by the `numeric` engine."
+        x = sym.Symbol("x")
+        symbolic_V, symbolic_M = sym.symbols("V M", cls=sym.Function)
+
+        v_x, m_x = self.V, self.M  # integrated load by load, see `_get_load_terms`
+        equations = {"M": m_x, "V": v_x}
+
+        with phase(self.observer, "select_boundary_conditions") as event:
+            position_conditions = self._get_position_conditions()
+            best_pos_bounds = self._get_best_position(position_conditions)
+            if best_pos_bounds.size == best_pos_bounds.shape[0]:
+                best_pos_bounds = best_pos_bounds[None, :]
+            event["n_conditions"] = len(position_conditions)
+            event["n_selected"] = len(best_pos_bounds)
+
+        constants = {}
+        steps = []  # replayed by `write_report`
+
+        for position, bounds in best_pos_bounds:
+            bounds = dict(reversed(list(bounds.items())))
+            solutions = []
+
+            for force in bounds.keys():
+                if bounds[force] != "?":
+                    subs = dict(constants)
+                    with phase(self.observer, "solve_for_force", force=force, position=float(position)) as event:
+                        result = self.solve_for_force(force, equations, position, bounds[force], subs)
+                        event["n_unknowns"] = len(result)
+                    solutions.append((force, bounds[force], subs, result))
+                    constants.update(result)
+
+            steps.append((position, bounds, solutions))
+
+        with phase(self.observer, "substitute", n_constants=len(constants)):
+            final_v_x = v_x.subs(constants)
+            final_m_x = m_x.subs(constants)
+
+        with phase(self.observer, "lambdify") as event:
+            function_v_x = sym.lambdify(x, expr=final_v_x.args[1], modules=LAMBDIFY_MODULES)
+            function_m_x = sym.lambdify(x, expr=final_m_x.args[1], modules=LAMBDIFY_MODULES)
+            event["n_terms"] = len(sym.Add.make_args(final_m_x.args[1]))
+
+        self.constants = constants
+        self.shear_equation, self.bending_equation = final_v_x, final_m_x
+        self._derivation = (equations, steps)
+
+        return ModelResults(self, constants, function_v_x, function_m_x)
+
+    def write_report(self):
+        """
+        Renders the derivation of the last symbolic `solve` into a new `Writer`
+        and flushes it to the sink. Returns the report content.
+        """
+        assert self.engine == "sympy", "Reports are only available for the `sympy` engine."
+        if self._derivation is None:
+            self._solve_symbolic()  # skipped by `solve` for standard layouts without a report
+
+        self._writer = None  # each report starts from its own header
+        with phase(self.observer, "write_report") as event:
+            content = self._write_report()
+            event["n_characters"] = len(content)
+
+        return content
+
+    def _write_report(self):
+        equations, steps = self._derivation
+        m_x, v_x = equations["M"], equations["V"]
 
         # Variables & Functions
         x, c1, c2 = sym.symbols("x C(1:3)")
@@ -148,7 +358,6 @@ class Model:
         symbolic_V = symbolic_V(x)
         symbolic_M = symbolic_M(x)
 
-        self.plotter.plot_model(save=True)
         # self.writer.add_image(self.plotter.beam_filename, scale_width="90%")
         # self.writer.write_content(" ")
 
@@ -165,25 +374,16 @@ class Model:
 
         self.writer.add_section("2. Boundary conditions", level=2)
 
-        position_conditions = []
         for index, support in enumerate(self.beam.supports.values()):
             self.writer.add_section(f"2.{index + 1}. {support.category.value.upper()}({support.position})", level=4)
 
             conditions = self.bound_conds[support.category]
-            position_conditions.append((support.position, conditions))
             self.writer.write_dict_boundaries(conditions, support.position if support.position != self.beam.L else "L")
 
-        if not self.beam.supports.__contains__(self.beam.L):
-            position_conditions.append((self.beam.L, self.bound_conds["free"]))
-            
-        if not self.beam.supports.__contains__(0.0):
-            position_conditions.append((0.0, self.bound_conds["free"]))
-
         self.writer.add_section("3. Apply boundary conditions", level=2)
 
         m_diff = symbolic_M.diff(x, x)
         m_diff_2 = symbolic_M.diff(x)
-        v_diff = symbolic_V.diff(x)
         arrow = " \longrightarrow "
 
         self.writer.write_equation([
@@ -192,7 +392,6 @@ class Model:
             f"\Rightarrow {sym.latex(sym.Eq(sym.Integral(m_diff, x), sym.Integral(self.q.args[1], x)))}"
         ])
 
-        v_x = sym.dsolve(sym.Eq(v_diff, self.q.args[1]), rational=False)  # V(x)
         self.writer.write_equation([f"{sym.latex(symbolic_M.diff(x))} = {sym.latex(v_x)}"], box=True)
         self.writer.write_content("---")
 
@@ -202,45 +401,53 @@ class Model:
             f"\Rightarrow {sym.latex(sym.Eq(sym.Integral(m_diff_2, x), sym.expand(sym.Integral(v_x.args[1], x))))}"
         ])
 
-        m_x = sym.dsolve(sym.Eq(symbolic_M.diff(x), v_x.args[1]), rational=False)  # M(x)
         self.writer.write_equation([sym.latex(m_x)], box=True)
         self.writer.write_content("---")
 
-        equations = {"M": m_x, "V": v_x}
-
-        print("POSITION CONDITIONS")
-        print(position_conditions)
-
-        best_pos_bounds = self._get_best_position(position_conditions)
-        if best_pos_bounds.size == best_pos_bounds.shape[0]:
-            best_pos_bounds = best_pos_bounds[None, :]
-
-        print("best_positions 02\n", best_pos_bounds)
-        constants = {}
-
-        for position, bounds in best_pos_bounds:
-            bounds = dict(reversed(list(bounds.items())))
+        for position, bounds, solutions in steps:
             self.writer.write_dict_boundaries(bounds, "L" if position == self.beam.L else position)
 
-            for force in bounds.keys():
-                if bounds[force] != "?":
-                    constants.update(self.solve_for_force(force, equations, position, bounds[force], constants))
-
-        print(constants)
+            for force, value_force, subs, result in solutions:
+                self._write_force_solution(force, equations, position, value_force, subs, result)
 
         self.writer.add_section("4. Model plot", level=2)
+        self.writer.write_equation([sym.latex(self.bending_equation) + "; \qquad " + sym.latex(self.shear_equation)],
+                                   box=True)
 
-        modules = [{"SingularityFunction": lambda x, a, e: (x - a) ** e * (x > a)}, "numpy"]
-        final_v_x = v_x.subs(constants)
-        final_m_x = m_x.subs(constants)
-        function_v_x = sym.lambdify(x, expr=final_v_x.args[1], modules=modules)
-        function_m_x = sym.lambdify(x, expr=final_m_x.args[1], modules=modules)
-
-        self.writer.write_equation([sym.latex(final_m_x) + "; \qquad " + sym.latex(final_v_x)], box=True)
-
-        x_points = np.linspace(0, self.beam.L, int(self.beam.L * 100))
-        internal_strain = (x_points, function_v_x(x_points), function_m_x(x_points))
-
-        self.plotter.plot_model(internal_strain, save=True)
         # self.writer.add_image(self.plotter.strain_filename)
         # self.writer.write_content(" ")
+
+        self.writer.flush()
+        return self.writer.getvalue()
+
+    def solve(self, report=None, plot=None):
+        """
+        Returns a `ModelResults`, which still unpacks as the `(x, V, M)` arrays
+        consumed by `Plot.plot_model`. `report`/`plot` default to True for the
+        `sympy` engine and False for the `numeric` one; when skipped, they can be
+        produced later with `ModelResults.report()` and `ModelResults.plot()`.
+        Standard layouts (see `standard.get_topology`) are solved in closed form,
+        also by the `sympy` engine when the report is not written right away.
+        """
+        if report is None:
+            report = self.engine == "sympy"
+        if plot is None:
+            plot = self.engine == "sympy"
+
+        with phase(self.observer, "solve", engine=self.engine, n_loads=len(self.beam.loads),
+                   n_supports=len(self.beam.supports)):
+            # standard layouts skip the general solvers, unless the derivation is reported
+            topology = None if report and self.engine == "sympy" else standard.get_topology(self.beam, self.bound_conds)
+            if topology is not None:
+                results = self._solve_closed_form(topology)
+            elif self.engine == "numeric":
+                results = self._solve_numeric()
+            else:
+                results = self._solve_symbolic()
+
+        if plot:
+            results.plot(save=True)
+        if report:
+            results.report()
+
+        return results
@@ -0,0 +1,387 @@
+from math import comb
+
+import numpy as np
+
+from .load import LoadTypes
+from .columnar import BeamArrays, as_arrays
+
+ORDER = 4  # cubic is the highest degree reached by M(x) (uniformly varying load)
+
+
+def _centered_terms(p, a, e):
+    shear = [(p, a, 0, a, np.inf)]
+    bending = [(p, a, 1, a, np.inf)]
+    return shear, bending
+
+
+def _uniformly_distributed_terms(p, a, e):
+    resultant = p * (e - a)
+    shear = [(p, a, 1, a, e), (resultant, a, 0, e, np.inf)]
+    bending = [(p / 2, a, 2, a, e), (resultant, (a + e) / 2, 1, e, np.inf)]
+    return shear, bending
+
+
+def _uniformly_varying_terms(p, a, e):
+    slope = p / (e - a)
+    resultant = p * (e - a) / 2
+    shear = [(slope / 2, a, 2, a, e), (resultant, a, 0, e, np.inf)]
+    bending = [(slope / 6, a, 3, a, e), (resultant, a + 2 * (e - a) / 3, 1, e, np.inf)]
+    return shear, bending
+
+
+# Each load contributes terms `(coefficient, anchor, power, lo, hi)` to V(x) and M(x),
+# meaning `coefficient * (x - anchor) ** power` for `lo <= x < hi`.
+LOAD_PIECEWISE_TERMS = {
+    LoadTypes.centered: _centered_terms,
+    LoadTypes.uniformlyDistributed: _uniformly_distributed_terms,
+    LoadTypes.uniformlyVarying: _uniformly_varying_terms
+}
+
+
+def _centered_response(p, a, e, x):
+    loaded = x >= a
+    return p * loaded, p * (x - a) * loaded
+
+
+def _uniformly_distributed_response(p, a, e, x):
+    r = np.clip(x, a, e) - a  # loaded length up to x
+    return p * r, p * r * (x - a - r / 2)
+
+
+def _uniformly_varying_response(p, a, e, x):
+    r = np.clip(x, a, e) - a
+    resultant = p / (e - a) * r ** 2 / 2
+    return resultant, resultant * (x - a - 2 * r / 3)
+
+
+# Closed-form contribution of one load to V(x) and M(x); every argument broadcasts,
+# so one call evaluates a load column for many cases and many points at once.
+LOAD_RESPONSES = {
+    LoadTypes.centered: _centered_response,
+    LoadTypes.uniformlyDistributed: _uniformly_distributed_response,
+    LoadTypes.uniformlyVarying: _uniformly_varying_response
+}
+
+
+class PiecewisePolynomial:
+    """
+    Polynomial by segments: on `[breaks[k], breaks[k + 1])` the value is
+    `sum(coefs[k, j] * (x - breaks[k]) ** j)`.
+    """
+
+    def __init__(self, breaks, coefs):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coefs = np.asarray(coefs, dtype=float)
+
+    @property
+    def degree(self):
+        return self.coefs.shape[-1] - 1
+
+    def segment(self, x):
+        index = np.searchsorted(self.breaks, x, side="right") - 1
+        return np.clip(index, 0, len(self.breaks) - 2)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        return self.evaluate(x, self.segment(x))
+
+    def evaluate(self, x, index):
+        """
+        Evaluates segment `index` at `x`; lets a breakpoint be evaluated with the
+        segment on its left (left limit) as well as on its right.
+        """
+        x = np.asarray(x, dtype=float)
+        t = x - self.breaks[index]
+        coefs = self.coefs[index]
+
+        result = np.zeros_like(t)
+        for j in range(self.degree, -1, -1):
+            result = result * t + coefs[..., j]
+
+        return result
+
+    def derivative(self):
+        powers = np.arange(1, self.degree + 1)
+        return PiecewisePolynomial(self.breaks, self.coefs[..., 1:] * powers)
+
+    def antiderivative(self):
+        """
+        Continuous antiderivative, zero at `breaks[0]`.
+        """
+        powers = np.arange(1, self.degree + 2)
+        coefs = np.zeros(self.coefs.shape[:-1] + (self.degree + 2,))
+        coefs[..., 1:] = self.coefs / powers
+
+        # value of each segment at its end is the start value of the next one
+        lengths = np.diff(self.breaks)
+        increments = np.sum(coefs[..., 1:] * lengths[:, None] ** powers, axis=-1)
+        coefs[..., 0] = np.cumsum(increments) - increments
+
+        return PiecewisePolynomial(self.breaks, coefs)
+
+    def curvature_bound(self):
+        """
+        Upper bound of |f''(x)| on every segment.
+        """
+        lengths = np.diff(self.breaks)
+        powers = np.arange(self.degree + 1)
+        factors = powers * (powers - 1) * lengths[:, None] ** np.clip(powers - 2, 0, None)
+        return np.sum(np.abs(self.coefs) * factors, axis=-1)
+
+    def _critical_points(self):
+        """
+        Local coordinates `t` of the roots of f'(x) inside each segment, NaN where
+        there is none; shape `(n_segments, 2)` since f' is at most quadratic.
+        """
+        assert self.degree <= 3, "Critical points are only implemented up to cubic segments."
+        coefs = np.zeros((len(self.breaks) - 1, 3))
+        derivative = self.derivative().coefs
+        coefs[:, :derivative.shape[-1]] = derivative
+        a, b, c = coefs.T
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discriminant = b ** 2 - 4 * a * c
+            q = -0.5 * (b + np.copysign(np.sqrt(discriminant), b))
+            quadratic = np.stack([q / c, a / q], axis=-1)
+            linear = np.stack([-a / b, np.full_like(a, np.nan)], axis=-1)
+
+        roots = np.where((c != 0)[:, None], quadratic, linear)
+        roots[(c != 0) & (discriminant < 0)] = np.nan
+
+        lengths = np.diff(self.breaks)[:, None]
+        roots[~((roots > 0) & (roots < lengths))] = np.nan
+        return roots
+
+    def extrema(self):
+        """
+        Exact max/min of the function and where they occur, checking both ends of
+        every segment and the roots of its derivative.
+        """
+        n_segments = len(self.breaks) - 1
+        lengths = np.diff(self.breaks)
+        t = np.column_stack([np.zeros(n_segments), lengths, self._critical_points()])
+        valid = ~np.isnan(t)
+
+        index = np.repeat(np.arange(n_segments), t.shape[1])
+        x = (self.breaks[:-1, None] + np.where(valid, t, 0.0)).ravel()
+        values = self.evaluate(x, index)
+        valid = valid.ravel()
+
+        i_max = np.argmax(np.where(valid, values, -np.inf))
+        i_min = np.argmin(np.where(valid, values, np.inf))
+        i_abs = i_max if abs(values[i_max]) >= abs(values[i_min]) else i_min
+
+        return {"max": float(values[i_max]), "max_position": float(x[i_max]),
+                "min": float(values[i_min]), "min_position": float(x[i_min]),
+                "abs_max": float(abs(values[i_abs])), "abs_max_position": float(x[i_abs])}
+
+
+def get_adaptive_grid(polynomials, tolerance=1e-3):
+    """
+    Sample points for piecewise polynomials sharing the same breakpoints. Every
+    segment is sampled on its closed interval, so each inner breakpoint appears
+    twice (left and right limit) and jumps are drawn exactly. Segments get just
+    enough points for the chord error of a linear interpolation,
+    `h ** 2 / 8 * max|f''|`, to stay below `tolerance * max|f|`.
+
+    * Returns:
+        x, segment index of every point
+    """
+    breaks = polynomials[0].breaks
+    lengths = np.diff(breaks)
+    segments = np.arange(len(lengths))
+    n_intervals = np.ones(len(lengths), dtype=int)
+
+    for polynomial in polynomials:
+        ends = np.concatenate([polynomial.evaluate(breaks[:-1], segments), polynomial.evaluate(breaks[1:], segments)])
+        allowed = tolerance * np.max(np.abs(ends), initial=0.0)
+        curvature = polynomial.curvature_bound()
+        if allowed == 0.0:
+            continue
+
+        needed = np.ceil(lengths * np.sqrt(curvature / (8 * allowed))).astype(int)
+        n_intervals = np.maximum(n_intervals, needed)
+
+    counts = n_intervals + 1
+    index = np.repeat(segments, counts)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    step = np.arange(counts.sum()) - offsets
+    x = breaks[index] + lengths[index] * step / n_intervals[index]
+
+    return x, index
+
+
+def get_breakpoints(beam):
+    """
+    Every position where V or M changes expression, and the knots of the
+    tabulated loads (see `TabulatedLoad.coefs`).
+    """
+    if isinstance(beam, BeamArrays):
+        positions = np.concatenate([[0.0, beam.L], beam.supports["position"], beam.loads["start"], beam.loads["end"]])
+    else:
+        positions = [0.0, beam.L] + list(beam.supports.keys())
+        for load in beam.loads:
+            positions.extend([load.start, load.start if load.end is None else load.end])
+
+    if not beam.tabulated_loads:
+        return np.unique(positions)
+
+    return np.unique(np.concatenate([positions] + [load.knots() for load in beam.tabulated_loads]))
+
+
+def get_array_coefs(arrays, breaks):
+    """
+    Coefficients of V_loads and M_loads of a `BeamArrays` around each origin of
+    `breaks`, i.e. the polynomial in `t = x - origin` that holds up to the next
+    breakpoint; one vectorized pass per load category. Terms that stop at the end of their load only cover a few segments
+    and are expanded there directly; those that run to the end of the beam (degree
+    <= 1) are added as monomials of x where they start, so one cumulative sum
+    carries them over every later segment.
+
+    * Returns:
+        shear and bending coefficients, shape `(len(breaks) - 1, ORDER)`
+    """
+    n_segments = len(breaks) - 1
+    coefs = np.zeros((2, n_segments + 1, ORDER))
+    monomials = np.zeros((2, n_segments + 1, ORDER))
+
+    for category, rows in arrays.load_categories():
+        loads = arrays.loads[rows]
+        terms = LOAD_PIECEWISE_TERMS[category](loads["magnitude"], loads["start"], loads["end"])
+
+        for target, running, load_terms in zip(coefs, monomials, terms):
+            for coefficient, anchor, power, lo, hi in load_terms:
+                first = np.searchsorted(breaks, lo)
+                if np.all(np.isinf(hi)):
+                    for j in range(power + 1):
+                        np.add.at(running[:, j], first, coefficient * comb(power, j) * (-anchor) ** (power - j))
+                    continue
+
+                spans = np.searchsorted(breaks, hi) - first
+                segment = np.repeat(first, spans) + np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+                coefficient, distance = np.repeat(coefficient, spans), breaks[segment] - np.repeat(anchor, spans)
+                for j in range(power + 1):
+                    np.add.at(target[:, j], segment, coefficient * comb(power, j) * distance ** (power - j))
+
+    # sum(g_k x ** k) around the origin o: c_j = sum(comb(k, j) * g_k * o ** (k - j))
+    monomials = np.cumsum(monomials, axis=1)
+    origins = breaks[:-1]
+    for k in range(ORDER):
+        for j in range(k + 1):
+            coefs[:, :n_segments, j] += comb(k, j) * monomials[:, :n_segments, k] * origins ** (k - j)
+
+    return coefs[0, :n_segments], coefs[1, :n_segments]
+
+
+def get_array_responses(arrays, x):
+    """
+    V and M of the loads of a `BeamArrays` at the points `x` (closed form).
+    """
+    x = np.asarray(x, dtype=float)
+    shear, bending = np.zeros(x.shape), np.zeros(x.shape)
+
+    for category, rows in arrays.load_categories():
+        loads = arrays.loads[rows]
+        load_shear, load_bending = LOAD_RESPONSES[category](loads["magnitude"][:, None], loads["start"][:, None],
+                                                             loads["end"][:, None], x)
+        shear += load_shear.sum(axis=0)
+        bending += load_bending.sum(axis=0)
+
+    return shear, bending
+
+
+def get_boundary_system(best_pos_bounds):
+    """
+    V(x) = C1 + V_loads(x) and M(x) = C1 x + C2 + M_loads(x); every known
+    value in `best_pos_bounds` is one row of a 2x2 linear system in (C1, C2).
+
+    * Returns:
+        forces, positions, matrix, values (before subtracting the loads)
+    """
+    forces, positions, rows, values = [], [], [], []
+    for position, bounds in best_pos_bounds:
+        for force, value in bounds.items():
+            if value == "?":
+                continue
+
+            forces.append(force)
+            positions.append(position)
+            rows.append([1.0, 0.0] if force == "V" else [position, 1.0])
+            values.append(value)
+
+    assert len(rows) == 2, f"Expected 2 boundary conditions to solve the beam, found {len(rows)}."
+
+    return forces, np.array(positions, dtype=float), np.array(rows), np.array(values, dtype=float)
+
+
+def get_loads_at_bounds(forces, positions, shear, bending):
+    """
+    Load terms of the rows of `get_boundary_system`: V_loads or M_loads at each
+    position (the last axis of `shear` and `bending`). A condition at x = 0 holds
+    before any load (left limit), so a load sitting at 0 is not cancelled by it,
+    as for the free end of `standard._cantilever_end`.
+    """
+    loads_at_bounds = np.where(np.array(forces) == "V", shear, bending)
+    return np.where(positions == 0.0, 0.0, loads_at_bounds)
+
+
+def get_load_coefs(beam, breaks):
+    """
+    Coefficients of V_loads and M_loads (the loads alone, no constants) on every
+    segment of `breaks`; a `Beam` is converted to a `BeamArrays` first.
+    """
+    beam = as_arrays(beam)
+    shear, bending = get_array_coefs(beam, breaks)
+
+    for load in beam.tabulated_loads:
+        load_shear, load_bending = load.coefs(breaks, ORDER)
+        shear += load_shear
+        bending += load_bending
+
+    return shear, bending
+
+
+def get_load_responses(beam, x):
+    """
+    V_loads and M_loads at the points `x` (right limits, as the diagrams).
+    """
+    beam = as_arrays(beam)
+    shear, bending = get_array_responses(beam, x)
+
+    for load in beam.tabulated_loads:
+        load_shear, load_bending = load.responses(x)
+        shear += load_shear
+        bending += load_bending
+
+    return shear, bending
+
+
+def solve_load_constants(beam, best_pos_bounds):
+    forces, positions, matrix, values = get_boundary_system(best_pos_bounds)
+    values -= get_loads_at_bounds(forces, positions, *get_load_responses(beam, positions))
+
+    c1, c2 = np.linalg.solve(matrix, values)
+
+    return {"C1": c1, "C2": c2}
+
+
+def build_diagrams(beam, best_pos_bounds=None, constants=None):
+    """
+    Returns V(x), M(x) as `PiecewisePolynomial` and the integration constants,
+    solved from `best_pos_bounds` unless already known. `beam` is a `Beam` or a
+    `BeamArrays`.
+    """
+    beam = as_arrays(beam)
+    breaks = get_breakpoints(beam)
+    shear_coefs, bending_coefs = get_load_coefs(beam, breaks)
+    if constants is None:
+        constants = solve_load_constants(beam, best_pos_bounds)
+
+    shear_coefs[:, 0] += constants["C1"]
+    bending_coefs[:, 0] += constants["C1"] * breaks[:-1] + constants["C2"]
+    bending_coefs[:, 1] += constants["C1"]
+
+    shear = PiecewisePolynomial(breaks, shear_coefs)
+    bending = PiecewisePolynomial(breaks, bending_coefs)
+
+    return shear, bending, constants
@@ -0,0 +1,114 @@
+import json
+from collections import OrderedDict
+
+import numpy as np
+import sympy as sym
+
+from .load import LoadTypes
+from .support import SupportTypes
+from .boundary import BOUNDARY_CONDITIONS, get_best_pos_bounds
+from .model import LOAD_STEP_EQUATIONS, LOAD_END_EQUATIONS, left_limit_at_start
+from .continuous import is_end_supported
+
+# Right-continuous like the `numeric` engine; a condition at x = 0 is taken before the loads (`left_limit_at_start`)
+PARAMETRIC_MODULES = [{"SingularityFunction": lambda x, a, e: (x - a) ** e * (x >= a)}, "numpy"]
+MAX_SOLUTIONS = 64  # derived topologies kept, least recently used dropped first
+
+
+def get_topology_key(beam, categories, bound_conds):
+    description = {
+        "L": beam.L,
+        "supports": sorted([support.position, support.category.value] for support in beam.supports.values()),
+        "categories": [category.value for category in categories],
+        "bound_conds": {(key.value if isinstance(key, SupportTypes) else key): conditions
+                        for key, conditions in bound_conds.items()}
+    }
+
+    return json.dumps(description, sort_keys=True, default=repr)
+
+
+class ParametricModel:
+    """
+    Symbolic solve of a topology (support layout of `beam` plus the ordered load
+    `categories`) with load magnitudes `p_i`, starts `a_i` and ends `e_i` kept as
+    symbols. The derivation runs once per topology; `evaluate` only calls the
+    compiled function. The last `MAX_SOLUTIONS` derivations are shared by
+    every instance.
+    """
+
+    _solutions = OrderedDict()  # topology key -> (shear, bending, evaluator)
+
+    def __init__(self, beam, categories, bound_conds=None):
+        if bound_conds is None:
+            bound_conds = BOUNDARY_CONDITIONS
+
+        self.beam = beam
+        self.bound_conds = bound_conds
+        self.categories = [LoadTypes(category) for category in categories]
+        assert len(self.categories) > 0, "At least one load category is required."
+        assert is_end_supported(beam), "`ParametricModel` needs supports at both ends or a fixed end."
+
+        key = get_topology_key(beam, self.categories, bound_conds)
+        solutions = ParametricModel._solutions
+        if key not in solutions:
+            solutions[key] = self._derive()
+            while len(solutions) > MAX_SOLUTIONS:
+                solutions.popitem(last=False)
+        solutions.move_to_end(key)
+        self.shear, self.bending, self.evaluator = solutions[key]
+
+    @property
+    def n_loads(self):
+        return len(self.categories)
+
+    def _derive(self):
+        x = sym.Symbol("x")
+        V = sym.Function("V")(x)
+        M = sym.Function("M")(x)
+        magnitudes = sym.symbols(f"p_1:{self.n_loads + 1}")
+        starts = sym.symbols(f"a_1:{self.n_loads + 1}")
+        ends = sym.symbols(f"e_1:{self.n_loads + 1}")
+
+        functions = 0
+        for category, p, a, e in zip(self.categories, magnitudes, starts, ends):
+            functions += LOAD_STEP_EQUATIONS[category](p, e - a, a)
+            if category in LOAD_END_EQUATIONS:
+                functions += LOAD_END_EQUATIONS[category](p, e - a, e)
+
+        v_x = sym.dsolve(sym.Eq(V.diff(x), functions))
+        m_x = sym.dsolve(sym.Eq(M.diff(x), v_x.args[1]))
+        equations = {"V": v_x.args[1], "M": m_x.args[1]}
+
+        conditions = []
+        for position, bounds in get_best_pos_bounds(self.beam, self.bound_conds):
+            for force, value in bounds.items():
+                if value != "?":
+                    equation = left_limit_at_start(equations[force]) if position == 0 else equations[force]
+                    conditions.append(equation.subs(x, sym.Rational(str(position))) - sym.Rational(str(value)))
+
+        constants = sym.solve(conditions, sym.symbols("C1 C2"), dict=True)[0]
+        shear = equations["V"].subs(constants)
+        bending = equations["M"].subs(constants)
+        evaluator = sym.lambdify([x, magnitudes, starts, ends], [shear, bending], modules=PARAMETRIC_MODULES)
+
+        return shear, bending, evaluator
+
+    def evaluate(self, magnitudes, starts, ends=None, x=None):
+        """
+        Loads are given column-wise with shape `(n_cases, n_loads)`, as in `BeamBatch`.
+        Returns `(x, V, M)` with V and M of shape `(n_cases, n_points)`.
+        """
+        if x is None:
+            x = np.linspace(0, self.beam.L, int(self.beam.L * 100))
+        x = np.asarray(x, dtype=float)
+
+        magnitudes = np.atleast_2d(np.asarray(magnitudes, dtype=float))
+        starts = np.broadcast_to(np.asarray(starts, dtype=float), magnitudes.shape)
+        ends = starts if ends is None else np.broadcast_to(np.asarray(ends, dtype=float), magnitudes.shape)
+        assert magnitudes.shape[1] == self.n_loads, f"Expected {self.n_loads} load columns."
+
+        # one (n_cases, 1) column per load symbol, broadcast against x
+        shear, bending = self.evaluator(x, magnitudes.T[..., None], starts.T[..., None], ends.T[..., None])
+        shape = (magnitudes.shape[0], len(x))
+
+        return x, np.broadcast_to(shear, shape).astype(float), np.broadcast_to(bending, shape).astype(float)
@@ -1,12 +1,18 @@
+import os
+import uuid
 import numpy as np
 from typing import List
 from matplotlib import patches
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
 import matplotlib.pyplot as plt
 from datetime import datetime
 from itertools import cycle
+from concurrent.futures import ProcessPoolExecutor
 
 from .support import Support, SupportTypes
 from .load import Load, LoadTypes
+from .columnar import LOAD_CODES, SUPPORT_CATEGORIES, loads_to_array, supports_to_array
 
 
 # Hyperparameters
@@ -27,21 +33,66 @@ TEXT_SPACE = 0.06 * HEIGHT
 Y_DISTANCE = 0.20 * HEIGHT
 
 N_ARROWS_SCALE = 2
+MAX_ARROWS = 100  # per distributed load
 ARROW_WIDTH_PERCENT = 0.04
 UNIF_VAR_SLOPE = 0.2
 
+# Outline of `patches.Arrow` along its axis (u) and across it (v, scaled by the width)
+ARROW_SHAPE = np.array([[0.0, 0.1], [0.0, -0.1], [0.8, -0.1], [0.8, -0.3], [1.0, 0.0], [0.8, 0.3], [0.8, 0.1]])
+
+DPI = 800
+FORMAT = "jpg"  # any format supported by `savefig`, e.g. "png", "svg" or "pdf" for vector output
+
+# Figures reused across beams when saving, keyed by the number of rows
+_FIGURE_TEMPLATES = {}
+
+
+def _use_non_interactive_backend():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def _render(plot_and_strain):
+    plot, internal_strain = plot_and_strain
+    plot.plot_model(save=True)
+    if internal_strain is not None:
+        plot.plot_model(internal_strain, save=True)
+
+    return plot.beam_filename, plot.strain_filename
+
+
+def render_batch(plots, processes=None):
+    """
+    Saves the figures of many beams in a process pool.
+
+    * Parameters:
+        plots: iterable of `(Plot, internal_strain)`, `internal_strain` may be None
+
+    * Returns:
+        [(beam_filename, strain_filename), ...] in input order
+    """
+    with ProcessPoolExecutor(max_workers=processes, initializer=_use_non_interactive_backend) as pool:
+        return list(pool.map(_render, plots))
+
 
 class Plot:
-    def __init__(self, L: float, supports: List[Support], loads: List[Load], app: bool = False):
+    def __init__(self, L: float, supports: List[Support], loads: List[Load], app: bool = False,
+                 dpi: int = DPI, fmt: str = FORMAT, directory: str = "../plots"):
+        """
+        `supports` and `loads` are the `Beam` containers or the `BeamArrays` ones
+        (`SUPPORT_DTYPE`/`LOAD_DTYPE` arrays); they are kept as arrays.
+        """
         self.L = L
-        self.supports = supports.values()
-        self.loads = loads
-        self.x_positions = np.unique([l.start for l in self.loads] + [l.end for l in self.loads])
+        self.supports = supports if isinstance(supports, np.ndarray) else supports_to_array(supports.values())
+        self.loads = loads if isinstance(loads, np.ndarray) else loads_to_array(loads)
+        self.x_positions = np.unique(np.concatenate([self.loads["start"], self.loads["end"]]))
         self.ax_beam = None
+        self.dpi = dpi
+        self.fmt = fmt
         
-        now = datetime.now().strftime('%Y%d%d%H%M')
-        self.beam_filename = f"../plots/beam/plot_{now}.jpg"
-        self.strain_filename = f"../plots/strain/plot_{now}.jpg"
+        name = f"plot_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}.{fmt}"
+        self.beam_filename = os.path.join(directory, "beam", name)
+        self.strain_filename = os.path.join(directory, "strain", name)
         
         # if app:
         #     self.beam_filename = self.beam_filename[3:]
@@ -62,18 +113,17 @@ class Plot:
             nrows, ncols = 1, 1
             gridspec_kw = {}
             
-        fig, axes = plt.subplots(nrows, ncols, figsize=figsize, sharex=True, squeeze=False,
-                                 constrained_layout=True, gridspec_kw=gridspec_kw)
-        axes = axes.flatten()
+        fig, axes = self._get_figure(nrows, ncols, figsize, gridspec_kw, save)
         
         axes[0].set_ylim(FIG_YLIM)
         axes[0].plot([0, self.L], [0, 0], color="black", linewidth=5)
         axes[0].set_xticks(list(axes[0].get_xticks()) + self.x_positions.tolist())
 
         support_patches = self._plot_supports(axes[0])
-        load_patches = self._plot_loads(axes[0])
-        for patch in support_patches + load_patches:
+        load_arrows = self._plot_loads(axes[0])
+        for patch in support_patches:
             axes[0].add_patch(patch)
+        axes[0].add_collection(load_arrows)
             
         if plot_complete_model:
             axes[1].plot(x, shear, color="royalblue")
@@ -88,18 +138,37 @@ class Plot:
                 axes[2].axvline(position, linestyle="--", color="dimgrey")
             
             if save:
-                plt.savefig(self.strain_filename, dpi=800)
-                plt.close(fig)
+                fig.savefig(self.strain_filename, dpi=self.dpi, format=self.fmt)
             else:
                 plt.show()
         else:
             # axes[0].set_yticks([])
             if save:
-                plt.savefig(self.beam_filename, dpi=800)
-                plt.close(fig)
+                fig.savefig(self.beam_filename, dpi=self.dpi, format=self.fmt)
             else:
                 plt.show()
 
+    def _get_figure(self, nrows, ncols, figsize, gridspec_kw, save):
+        """
+        Saved figures are drawn on a cached `Figure` (no pyplot state, no GUI
+        backend) that is cleared and reused by the next beam.
+        """
+        if not save:
+            fig, axes = plt.subplots(nrows, ncols, figsize=figsize, sharex=True, squeeze=False,
+                                     constrained_layout=True, gridspec_kw=gridspec_kw)
+            return fig, axes.flatten()
+
+        if nrows not in _FIGURE_TEMPLATES:
+            fig = Figure(figsize=figsize, constrained_layout=True)
+            axes = fig.subplots(nrows, ncols, sharex=True, squeeze=False, gridspec_kw=gridspec_kw)
+            _FIGURE_TEMPLATES[nrows] = (fig, axes.flatten())
+
+        fig, axes = _FIGURE_TEMPLATES[nrows]
+        for ax in axes:
+            ax.cla()
+
+        return fig, axes
+
     def _get_coordinates(self, center, L):
         x, y = center
         scale_x = COORD_X_SCALE * L
@@ -108,16 +177,17 @@ class Plot:
 
     def _draw_triangle(self, center, L, ax):
         scale, coords = self._get_coordinates(center, L)
-        triangle = plt.Polygon(coords, fill=False, hatch=HATCH_SUPPORTS)
+        triangle = patches.Polygon(coords, fill=False, hatch=HATCH_SUPPORTS)
         ax.add_patch(triangle)
 
         return scale, coords
 
     def _plot_supports(self, ax: plt.Axes):
         patch_elements = []
-        for support in self.supports:
-            if support.category == SupportTypes.roller:
-                (scale_x, scale_y), coords = self._draw_triangle((support.position, -0.025),
+        for position, code in self.supports.tolist():
+            category = SUPPORT_CATEGORIES[code]
+            if category == SupportTypes.roller:
+                (scale_x, scale_y), coords = self._draw_triangle((position, -0.025),
                                                                  self.L, ax)
                 penalty = cycle([scale_x/2.5, -scale_x/2])
                 del coords[1]
@@ -126,15 +196,15 @@ class Plot:
                 y = [value[1] - scale_y/5 for value in coords]
                 ax.scatter(x, y, s=65, color=SECONDARY_COLOR)
 
-            elif support.category == SupportTypes.pinned:
-                _ = self._draw_triangle((support.position, -0.025), self.L, ax)
+            elif category == SupportTypes.pinned:
+                _ = self._draw_triangle((position, -0.025), self.L, ax)
 
-            elif support.category == SupportTypes.fixed:
+            elif category == SupportTypes.fixed:
                 alpha = 0.0
-                if support.position == self.L:
+                if position == self.L:
                     alpha = SUPP_FIXED_WIDTH_SCALE * self.L
 
-                patch = patches.Rectangle((support.position + alpha, -HEIGHT * 0.2),
+                patch = patches.Rectangle((position + alpha, -HEIGHT * 0.2),
                                           width=-SUPP_FIXED_WIDTH_SCALE * self.L,
                                           height=HEIGHT * 0.45, hatch=HATCH_SUPPORTS,
                                           fill=False)
@@ -142,58 +212,47 @@ class Plot:
 
         return patch_elements
 
-    def _plot_loads(self, ax):
-        patch_elements = []
-        for load in self.loads:
-            text = f"{load.magnitude}N"
-            if load.magnitude < 0:
-                y, dy = Y_DISTANCE, -Y_DISTANCE
-            else:
-                y, dy = 0, Y_DISTANCE
-
-            if load.category == LoadTypes.centered:
-                arrow = patches.Arrow(x=load.start, y=y, dx=0, dy=dy, color=ARROW_COLOR,
-                                      width=ARROW_WIDTH_PERCENT * self.L)
-
-                ax.text(load.start, Y_DISTANCE + TEXT_SPACE, s=text, ha='center', va='top',
-                        weight='normal', fontfamily='monospace', fontsize='large')
-                patch_elements.append(arrow)
-
-            elif load.category == LoadTypes.uniformlyDistributed:
-                n_arrows = int(N_ARROWS_SCALE * np.abs(load.end - load.start))
-                arrow_positions = np.linspace(load.start, load.end, n_arrows)
-
-                arrows = [patches.Arrow(x=position, y=Y_DISTANCE, dx=0, dy=-Y_DISTANCE,
-                                        color=ARROW_COLOR, width=ARROW_WIDTH_PERCENT * self.L)
-                          for position in arrow_positions]
-
-                ax.text((load.end + load.start)/2, Y_DISTANCE + TEXT_SPACE, s=text, ha='center', va='top',
-                        weight='normal', fontfamily='monospace', fontsize='large')
+    def _n_arrows(self, distance):
+        return np.minimum((N_ARROWS_SCALE * distance).astype(int), MAX_ARROWS)
 
-                ax.plot([load.start, load.end],
-                        [Y_DISTANCE, Y_DISTANCE],
-                        color=ARROW_COLOR, lw=3)
-
-                patch_elements.extend(arrows)
-
-            elif load.category == LoadTypes.uniformlyVarying:
-                distance = np.abs(load.end - load.start)
-                n_arrows = int(N_ARROWS_SCALE * distance)
-                arrow_positions = np.linspace(load.start, load.end, n_arrows)
-
-                ax.plot([load.start, load.end],
-                        [0, Y_DISTANCE+UNIF_VAR_SLOPE],
-                        color=ARROW_COLOR, lw=3)
-                
-                lengths = np.linspace(0, Y_DISTANCE+UNIF_VAR_SLOPE, n_arrows)
-
-                arrows = [patches.Arrow(x=position, y=length, dx=0, dy=-length,
-                                        color=ARROW_COLOR, width=ARROW_WIDTH_PERCENT * self.L)
-                          for position, length in zip(arrow_positions, lengths)]
-
-                ax.text((load.end + load.start)/2, Y_DISTANCE + TEXT_SPACE + UNIF_VAR_SLOPE/2, s=text, ha='center', va='top',
-                        weight='normal', fontfamily='monospace', fontsize='large')
-                
-                patch_elements.extend(arrows)
-
-        return patch_elements
+    def _plot_loads(self, ax):
+        """
+        Draws the text of every load, the lines of the distributed ones as one
+        `LineCollection` and returns all arrows as a single `PolyCollection` (same
+        outline as `patches.Arrow`). Works on the load columns, not per load.
+        """
+        magnitudes, codes = self.loads["magnitude"], self.loads["category"]
+        starts, ends = self.loads["start"], self.loads["end"]
+        centered = codes == LOAD_CODES[LoadTypes.centered]
+        varying = codes == LOAD_CODES[LoadTypes.uniformlyVarying]
+
+        # arrows: one per point load, spread along the distributed ones
+        n_arrows = np.where(centered, 1, self._n_arrows(np.abs(ends - starts)))
+        load_index = np.repeat(np.arange(len(self.loads)), n_arrows)
+        step = np.arange(n_arrows.sum()) - np.repeat(np.cumsum(n_arrows) - n_arrows, n_arrows)
+        fraction = step / np.maximum(n_arrows[load_index] - 1, 1)
+
+        xs = starts[load_index] + (ends - starts)[load_index] * fraction
+        lengths = (Y_DISTANCE + UNIF_VAR_SLOPE) * fraction
+        point_y = np.where(magnitudes < 0, Y_DISTANCE, 0)[load_index]
+        point_dy = np.where(magnitudes < 0, -Y_DISTANCE, Y_DISTANCE)[load_index]
+
+        ys = np.select([centered[load_index], varying[load_index]], [point_y, lengths], Y_DISTANCE)
+        dys = np.select([centered[load_index], varying[load_index]], [point_dy, -lengths], -Y_DISTANCE)
+
+        lines = np.stack([np.column_stack([starts, np.where(varying, 0, Y_DISTANCE)]),
+                          np.column_stack([ends, np.full(len(self.loads), Y_DISTANCE) + varying * UNIF_VAR_SLOPE])],
+                         axis=1)
+        ax.add_collection(LineCollection(lines[~centered], color=ARROW_COLOR, lw=3))
+
+        text_x = np.where(centered, starts, (starts + ends) / 2)
+        text_y = Y_DISTANCE + TEXT_SPACE + varying * UNIF_VAR_SLOPE / 2
+        for x, y, magnitude in zip(text_x.tolist(), text_y.tolist(), magnitudes.tolist()):
+            ax.text(x, y, s=f"{magnitude}N", ha='center', va='top',
+                    weight='normal', fontfamily='monospace', fontsize='large')
+
+        width = ARROW_WIDTH_PERCENT * self.L
+        vertices = np.stack([xs[:, None] + ARROW_SHAPE[:, 1] * width,
+                             ys[:, None] + ARROW_SHAPE[:, 0] * dys[:, None]], axis=-1)
+
+        return PolyCollection(vertices, color=ARROW_COLOR)
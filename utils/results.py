@@ -0,0 +1,230 @@
+import os
+
+import numpy as np
+
+from . import numeric, continuous
+from .events import phase
+from .stress import StressField, N_DEPTH, CHUNK_SIZE
+
+
+class ModelResults:
+    """
+    Outcome of `Model.solve`. Diagrams are evaluated on first access and the
+    report/plots only rendered when asked for. Unpacks as `x, V, M`.
+
+    `to_arrays` exports the solution as plain NumPy arrays, `save`/`save_npz`
+    write them and `load` reads them back (memory-mapped) as results without a
+    model: everything but the report, plots, deflection and stresses.
+    """
+
+    def __init__(self, model, constants, function_v_x=None, function_m_x=None, piecewise=None):
+        self.model = model
+        self.constants = {str(name): float(value) for name, value in constants.items()}
+        self.function_v_x = function_v_x
+        self.function_m_x = function_m_x
+        self._piecewise = piecewise
+        self._reactions = None
+        self._deflection = None
+        self._diagrams = None
+        self._report = None
+
+    @property
+    def beam(self):
+        assert self.model is not None, "Results loaded from disk have no beam."
+        return self.model.beam
+
+    @property
+    def observer(self):
+        return None if self.model is None else self.model.observer
+
+    @property
+    def piecewise(self):
+        """
+        V(x) and M(x) as `numeric.PiecewisePolynomial` (built from the loads and
+        the constants when the model was solved symbolically or in closed form).
+        """
+        if self._piecewise is None:
+            shear, bending, _ = numeric.build_diagrams(self.beam, constants=self.constants)
+            self._piecewise = (shear, bending)
+
+        return self._piecewise
+
+    @property
+    def reactions(self):
+        """
+        `{"positions", "V", "M"}`: force (and moment, at fixed supports) of every support.
+        """
+        if self._reactions is None:
+            shear, bending = self.piecewise
+            self._reactions = continuous.get_reactions(self.beam, shear, bending)
+
+        return self._reactions
+
+    @property
+    def breaks(self):
+        return self.piecewise[0].breaks
+
+    @property
+    def coefficients(self):
+        """
+        Coefficients of V and M on each segment of `breaks`, shape
+        `(len(breaks) - 1, 4)` (see `numeric.PiecewisePolynomial`).
+        """
+        shear, bending = self.piecewise
+        return shear.coefs, bending.coefs
+
+    @property
+    def deflection_polynomials(self):
+        """
+        Slope and deflection as `numeric.PiecewisePolynomial` (needs `beam.E` and `beam.I`).
+        """
+        if self._deflection is None:
+            self._deflection = continuous.build_deflection(self.beam, self.piecewise[1])
+
+        return self._deflection
+
+    @property
+    def slope(self):
+        return self.deflection_polynomials[0](self.x)
+
+    @property
+    def deflection(self):
+        return self.deflection_polynomials[1](self.x)
+
+    def stress(self, n_points=None, n_depth=N_DEPTH, chunk_size=CHUNK_SIZE):
+        """
+        `StressField` of the bending moment over span x depth (needs `beam.h` and `beam.I`).
+        """
+        return StressField(self.beam, self.piecewise[1], n_points, n_depth, chunk_size)
+
+    def sample(self, tolerance=1e-3):
+        """
+        `(x, V, M)` on a grid that contains every load and support position twice
+        (values on both sides of each jump) and is refined only where the
+        diagrams curve; see `numeric.get_adaptive_grid`.
+        """
+        shear, bending = self.piecewise
+        with phase(self.observer, "evaluate", grid="adaptive") as event:
+            x, index = numeric.get_adaptive_grid([shear, bending], tolerance)
+            samples = (x, shear.evaluate(x, index), bending.evaluate(x, index))
+            event["n_points"] = len(x)
+
+        return samples
+
+    def extrema(self):
+        """
+        Exact extrema of V and M without dense evaluation:
+        `{"V": {"max", "max_position", "min", ..., "abs_max_position"}, "M": {...}}`.
+        """
+        shear, bending = self.piecewise
+        return {"V": shear.extrema(), "M": bending.extrema()}
+
+    def diagrams(self):
+        if self._diagrams is None:
+            x_points = np.linspace(0, self.beam.L, int(self.beam.L * 100))
+            functions = self.piecewise if self.function_v_x is None else (self.function_v_x, self.function_m_x)
+            with phase(self.observer, "evaluate", grid="uniform", n_points=len(x_points)):
+                shear = np.broadcast_to(functions[0](x_points), x_points.shape).astype(float)
+                bending = np.broadcast_to(functions[1](x_points), x_points.shape).astype(float)
+            self._diagrams = (x_points, shear, bending)
+
+        return self._diagrams
+
+    @property
+    def x(self):
+        return self.diagrams()[0]
+
+    @property
+    def V(self):
+        return self.diagrams()[1]
+
+    @property
+    def M(self):
+        return self.diagrams()[2]
+
+    def __iter__(self):
+        return iter(self.diagrams())
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return self.diagrams()[index]
+
+    def to_arrays(self, diagrams=True):
+        """
+        The solution as C-contiguous arrays (not copied when they already are), for
+        `memoryview`, `np.savez` or other tools: breaks, shear_coefs, bending_coefs,
+        constant_names, constant_values, reaction_positions, reaction_V,
+        reaction_M and, with `diagrams`, the uniform-grid x, V and M.
+        """
+        shear_coefs, bending_coefs = self.coefficients
+        reactions = self.reactions
+        arrays = {
+            "breaks": self.breaks,
+            "shear_coefs": shear_coefs,
+            "bending_coefs": bending_coefs,
+            "constant_names": np.array(list(self.constants.keys()), dtype=str),
+            "constant_values": np.array(list(self.constants.values()), dtype=float),
+            "reaction_positions": reactions["positions"],
+            "reaction_V": reactions["V"],
+            "reaction_M": reactions["M"]
+        }
+        if diagrams:
+            arrays.update(zip(("x", "V", "M"), self.diagrams()))
+
+        return {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    def save_npz(self, file, diagrams=True, compressed=False):
+        (np.savez_compressed if compressed else np.savez)(file, **self.to_arrays(diagrams))
+
+    def save(self, directory, diagrams=True):
+        """
+        One `.npy` file per array of `to_arrays`, so `load` can memory-map them.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name, array in self.to_arrays(diagrams).items():
+            np.save(os.path.join(directory, f"{name}.npy"), array)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Results written by `save` (a directory, memory-mapped with `mmap_mode`) or
+        by `save_npz` (read into memory).
+        """
+        if os.path.isdir(path):
+            arrays = {name[:-len(".npy")]: np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+                      for name in os.listdir(path) if name.endswith(".npy")}
+        else:
+            with np.load(path) as archive:
+                arrays = dict(archive)
+
+        shear = numeric.PiecewisePolynomial(arrays["breaks"], arrays["shear_coefs"])
+        bending = numeric.PiecewisePolynomial(arrays["breaks"], arrays["bending_coefs"])
+        results = cls(None, dict(zip(arrays["constant_names"].tolist(), arrays["constant_values"].tolist())),
+                      shear, bending, piecewise=(shear, bending))
+        results._reactions = {"positions": arrays["reaction_positions"], "V": arrays["reaction_V"],
+                              "M": arrays["reaction_M"]}
+        if "x" in arrays:
+            results._diagrams = (arrays["x"], arrays["V"], arrays["M"])
+
+        return results
+
+    def report(self):
+        """
+        Writes the report through the model's writer (once) and returns its content.
+        """
+        assert self.model is not None, "Results loaded from disk have no model to report."
+        if self._report is None:
+            self._report = self.model.write_report()
+
+        return self._report
+
+    def plot(self, save=True):
+        assert self.model is not None, "Results loaded from disk have no model to plot."
+        with phase(self.model.observer, "plot", figure="beam"):
+            self.model.plotter.plot_model(save=save)
+
+        samples = self.sample()
+        with phase(self.model.observer, "plot", figure="diagrams", n_points=len(samples[0])):
+            self.model.plotter.plot_model(samples, save=save)
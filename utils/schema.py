@@ -0,0 +1,49 @@
+from .beam import Beam
+from .load import Load, LoadTypes
+from .support import Support, SupportTypes
+from .boundary import BOUNDARY_CONDITIONS
+
+
+def beam_from_dict(definition: dict) -> Beam:
+    """
+    {"L": 4.0, "h": 0.2, "I": 1e-4, "E": 2e11,
+     "supports": [{"position": 0.0, "type": "fixed"}, ...],
+     "loads": [{"magnitude": -10.0, "type": "centered", "start": 2.0, "end": None}, ...]}
+
+    `h`, `I`, `E`, `supports`, `loads` and a load's `end` are optional.
+    """
+    beam = Beam(definition.get("h", 0.0), definition["L"], definition.get("I", 0.0), definition.get("E", 0.0))
+
+    for support in definition.get("supports", []):
+        beam.add_support(Support(support["position"], SupportTypes(support["type"])))
+
+    for load in definition.get("loads", []):
+        beam.add_load(Load(load["magnitude"], LoadTypes(load["type"]), load["start"], load.get("end")))
+
+    return beam
+
+
+def beam_to_dict(beam: Beam) -> dict:
+    return {
+        "L": beam.L,
+        "h": beam.h,
+        "I": beam.I,
+        "E": beam.E,
+        "supports": [{"position": support.position, "type": support.category.value}
+                     for support in beam.supports.values()],
+        "loads": [{"magnitude": load.magnitude, "type": load.category.value, "start": load.start,
+                   "end": None if load.category == LoadTypes.centered else load.end}
+                  for load in beam.loads]
+    }
+
+
+def bound_conds_from_dict(conditions: dict) -> dict:
+    """
+    {"roller": {"M": 80.0, "V": "?"}, "free": {...}}; support types left out keep
+    their `BOUNDARY_CONDITIONS`.
+    """
+    bound_conds = dict(BOUNDARY_CONDITIONS)
+    for name, values in conditions.items():
+        bound_conds[name if name == "free" else SupportTypes(name)] = dict(values)
+
+    return bound_conds
@@ -0,0 +1,250 @@
+import os
+import json
+import time
+import queue
+import threading
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .jobs import get_layout_key, solve_definition, solve_group
+
+MAX_BATCH = 64  # requests taken from the queue at once
+MAX_WAIT = 0.002  # seconds a batch waits for more requests after the first one
+LATENCY_WINDOW = 1024  # latest requests kept for the latency percentiles
+
+# a cantilever solved by every worker at start, so imports and first calls are paid up front
+WARM_UP = {"h": 1.0, "L": 1.0, "I": 1.0, "E": 1.0,
+           "loads": [{"type": "centered", "magnitude": -1.0, "start": 1.0}],
+           "supports": [{"type": "fixed", "position": 0.0}]}
+
+
+def _warm_up():
+    solve_definition(WARM_UP)
+
+
+class _Request:
+    def __init__(self, definition):
+        self.definition = definition
+        self.future = Future()
+        self.received = time.perf_counter()
+        self.dispatched = None
+
+
+class SolveServer:
+    """
+    Local HTTP solve service. `POST /solve` takes one definition (or a list) in
+    the `schema.beam_from_dict` format, with the optional "bound_conds",
+    "diagrams" and "report" entries, and answers with the `jobs.solve_definition`
+    result plus its "metrics" (milliseconds queued, solving, in total, and the
+    size of the batch it was solved in). `GET /metrics` gives the totals.
+
+    Requests are queued; a batcher thread takes whatever arrived within
+    `max_wait` of the first one (up to `max_batch`), groups it by
+    `jobs.get_layout_key` and sends each group to a warm worker process as one
+    `jobs.solve_group` call. `workers=0` solves in the batcher thread.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, workers=None, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.workers = os.cpu_count() if workers is None else workers
+        self.executor = ProcessPoolExecutor(self.workers, initializer=_warm_up) if self.workers else None
+        self.requests = queue.Queue()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.solver = self
+        self.threads = []
+
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "failed": 0, "batches": 0, "groups": 0, "in_flight": 0}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.grouped = 0  # requests that reached a group
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        if self.executor is not None:
+            # start every worker now rather than on the first requests
+            list(self.executor.map(time.sleep, [0.0] * self.workers))
+
+        self.threads = [threading.Thread(target=self._batch_loop, daemon=True),
+                        threading.Thread(target=self.httpd.serve_forever, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.requests.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def submit(self, definition):
+        """
+        Queues a definition; the future gives its result with "metrics".
+        """
+        request = _Request(definition)
+        with self.lock:
+            self.counts["requests"] += 1
+            self.counts["in_flight"] += 1
+        self.requests.put(request)
+        return request.future
+
+    def _next_batch(self):
+        first = self.requests.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            try:
+                request = self.requests.get(timeout=max(deadline - time.perf_counter(), 0.0))
+            except queue.Empty:
+                break
+            if request is None:
+                self.requests.put(None)
+                break
+            batch.append(request)
+
+        return batch
+
+    def _batch_loop(self):
+        while (batch := self._next_batch()) is not None:
+            groups = defaultdict(list)
+            for request in batch:
+                try:
+                    key = get_layout_key(request.definition), bool(request.definition.get("diagrams"))
+                except Exception as error:
+                    self._finish([request], [{"error": f"{type(error).__name__}: {error}"}])
+                    continue
+                groups[key].append(request)
+
+            with self.lock:
+                self.counts["batches"] += 1
+                self.counts["groups"] += len(groups)
+                self.grouped += sum(map(len, groups.values()))
+
+            for (_, diagrams), group in groups.items():
+                dispatched = time.perf_counter()
+                for request in group:
+                    request.dispatched = dispatched
+
+                definitions = [request.definition for request in group]
+                if self.executor is None:
+                    self._finish(group, solve_group(definitions, diagrams))
+                else:
+                    future = self.executor.submit(solve_group, definitions, diagrams)
+                    future.add_done_callback(lambda future, group=group: self._collect(group, future))
+
+    def _collect(self, group, future):
+        try:
+            results = future.result()
+        except Exception as error:  # e.g. a worker that died
+            results = [{"error": f"{type(error).__name__}: {error}"} for _ in group]
+        self._finish(group, results)
+
+    def _finish(self, group, results):
+        done = time.perf_counter()
+        for request, result in zip(group, results):
+            dispatched = request.dispatched or done
+            result["metrics"] = {"queue_ms": 1e3 * (dispatched - request.received),
+                                 "solve_ms": 1e3 * (done - dispatched),
+                                 "latency_ms": 1e3 * (done - request.received),
+                                 "batch_size": len(group)}
+            with self.lock:
+                self.counts["in_flight"] -= 1
+                self.counts["failed"] += "error" in result
+                self.latencies.append(result["metrics"]["latency_ms"])
+            request.future.set_result(result)
+
+    def metrics(self):
+        """
+        Totals since start, the queue depth and latency percentiles (ms) over
+        the latest `LATENCY_WINDOW` requests.
+        """
+        with self.lock:
+            counts = dict(self.counts)
+            counts["mean_group_size"] = self.grouped / max(counts["groups"], 1)
+            latencies = sorted(self.latencies)
+
+        counts["queued"] = self.requests.qsize()
+        if latencies:
+            counts["latency_ms"] = {name: latencies[min(int(q * len(latencies)), len(latencies) - 1)]
+                                    for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))}
+        return counts
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._reply(200, self.server.solver.metrics())
+        else:
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            definitions = body if isinstance(body, list) else [body]
+            assert all(isinstance(definition, dict) for definition in definitions), "Definitions must be objects."
+        except Exception as error:
+            self._reply(400, {"error": f"{type(error).__name__}: {error}"})
+            return
+
+        futures = [self.server.solver.submit(definition) for definition in definitions]
+        results = [future.result() for future in futures]
+        self._reply(200, results if isinstance(body, list) else results[0])
+
+
+class SolveClient:
+    """
+    Minimal client of a `SolveServer`, e.g. on the loopback interface.
+    """
+
+    def __init__(self, url):
+        self.url = url.rstrip("/")
+
+    def _request(self, path, body=None):
+        data = None if body is None else json.dumps(body).encode()
+        request = urllib.request.Request(self.url + path, data, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def solve(self, definition):
+        """
+        Result of one definition, or a list of results for a list.
+        """
+        return self._request("/solve", definition)
+
+    def metrics(self):
+        return self._request("/metrics")
@@ -0,0 +1,109 @@
+import numpy as np
+
+from .load import LoadTypes
+from .support import SupportTypes
+from .boundary import BOUNDARY_CONDITIONS
+from .columnar import BeamArrays
+from .continuous import get_supports
+
+# Resultant force of a load and its position; the arguments broadcast, so one
+# call covers all the loads of a category of a `BeamArrays`
+LOAD_RESULTANTS = {
+    LoadTypes.centered: lambda p, a, e: (p, a),
+    LoadTypes.uniformlyDistributed: lambda p, a, e: (p * (e - a), (a + e) / 2),
+    LoadTypes.uniformlyVarying: lambda p, a, e: (p * (e - a) / 2, a + 2 * (e - a) / 3)
+}
+
+
+def _cantilever_start(L, shear_end, bending_end):
+    # free end at L: V(L) = M(L) = 0
+    return -shear_end, shear_end * L - bending_end
+
+
+def _cantilever_end(L, shear_end, bending_end):
+    # free end at 0: V(0) = M(0) = 0
+    return 0.0, 0.0
+
+
+def _simply_supported(L, shear_end, bending_end):
+    # M(0) = M(L) = 0
+    return -bending_end / L, 0.0
+
+
+# C1, C2 of V = C1 + V_loads and M = C1 x + C2 + M_loads from the load resultants at L
+CLOSED_FORM_CONSTANTS = {
+    "cantilever_start": _cantilever_start,
+    "cantilever_end": _cantilever_end,
+    "simply_supported": _simply_supported
+}
+
+
+def get_topology(beam, bound_conds=None):
+    """
+    Name of the standard layout of `beam` in `CLOSED_FORM_CONSTANTS`: a single
+    fixed support at 0 or L, or pinned/roller supports at both ends. None for
+    any other layout or when `bound_conds` differs from `BOUNDARY_CONDITIONS`.
+    """
+    if bound_conds is not None and bound_conds != BOUNDARY_CONDITIONS:
+        return None
+
+    if isinstance(beam, BeamArrays):
+        positions, fixed = get_supports(beam)
+        supports = list(zip(positions.tolist(), fixed.tolist()))
+    else:
+        supports = sorted((position, support.category == SupportTypes.fixed)
+                          for position, support in beam.supports.items())
+
+    if len(supports) == 1 and supports[0][1]:
+        if supports[0][0] == 0.0:
+            return "cantilever_start"
+        if supports[0][0] == beam.L:
+            return "cantilever_end"
+    elif len(supports) == 2 and not (supports[0][1] or supports[1][1]) and \
+            supports[0][0] == 0.0 and supports[1][0] == beam.L:
+        return "simply_supported"
+
+    return None
+
+
+def get_resultants(beam):
+    """
+    V_loads(L) and M_loads(L): the sum of the loads and their moment about L.
+    """
+    shear, bending = 0.0, 0.0
+    if isinstance(beam, BeamArrays):
+        for category, rows in beam.load_categories():
+            loads = beam.loads[rows]
+            force, position = LOAD_RESULTANTS[category](loads["magnitude"], loads["start"], loads["end"])
+            shear += float(np.sum(force))
+            bending += float(np.sum(force * (beam.L - position)))
+    else:
+        for load in beam.loads:
+            force, position = LOAD_RESULTANTS[load.category](load.magnitude, load.start, load.end)
+            shear += force
+            bending += force * (beam.L - position)
+
+    for load in beam.tabulated_loads:
+        (load_shear,), (load_bending,) = load.responses([beam.L])
+        shear += load_shear
+        bending += load_bending
+
+    return shear, bending
+
+
+def solve_standard(beam, topology):
+    """
+    Integration constants and reactions (as `continuous.get_reactions`) of a
+    beam with a standard layout, from the load resultants alone.
+    """
+    shear_end, bending_end = get_resultants(beam)
+    c1, c2 = CLOSED_FORM_CONSTANTS[topology](beam.L, shear_end, bending_end)
+
+    # jumps of V and M left by the supports at x = 0 and x = L
+    start = (0.0, c1, c2)
+    end = (beam.L, -shear_end - c1, -bending_end - c1 * beam.L - c2)
+    rows = {"cantilever_start": [start], "cantilever_end": [end],
+            "simply_supported": [start[:2] + (0.0,), end[:2] + (0.0,)]}[topology]
+    positions, shear, bending = zip(*rows)
+
+    return {"C1": c1, "C2": c2}, {"positions": np.array(positions), "V": np.array(shear), "M": np.array(bending)}
@@ -0,0 +1,69 @@
+import numpy as np
+
+CHUNK_SIZE = 2 ** 20  # stress values evaluated at once (8 MB of float64)
+N_DEPTH = 51
+
+
+class StressField:
+    """
+    Normal stress sigma(x, y) = M(x) * y / I over the span (x) and the depth of the
+    section (y from -h/2 to h/2), from the bending moment `bending` (a
+    `numeric.PiecewisePolynomial`). The grid is `n_points x n_depth` and is
+    evaluated in chunks of at most `chunk_size` values.
+    """
+
+    def __init__(self, beam, bending, n_points=None, n_depth=N_DEPTH, chunk_size=CHUNK_SIZE):
+        assert beam.h > 0 and beam.I > 0, "Stresses need the section height `h` and inertia `I` of the beam."
+        if n_points is None:
+            n_points = int(beam.L * 100)
+
+        self.beam = beam
+        self.bending = bending
+        self.x = np.linspace(0, beam.L, n_points)
+        self.y = np.linspace(-beam.h / 2, beam.h / 2, n_depth)
+        self.rows_per_chunk = max(1, chunk_size // n_depth)
+
+    @property
+    def shape(self):
+        return len(self.x), len(self.y)
+
+    def chunks(self):
+        """
+        Yields `(rows, sigma)` with `sigma = stress[rows]`, one block of rows at a time.
+        """
+        for start in range(0, len(self.x), self.rows_per_chunk):
+            rows = slice(start, min(start + self.rows_per_chunk, len(self.x)))
+            moments = self.bending(self.x[rows])
+            yield rows, moments[:, None] * self.y / self.beam.I
+
+    def compute(self, out=None, filename=None):
+        """
+        Whole field of shape `(n_points, n_depth)`. Written into `out` when given,
+        into a memory-mapped `.npy` file when `filename` is given (read it back
+        with `np.load(filename, mmap_mode="r")`), in memory otherwise.
+        """
+        if filename is not None:
+            out = np.lib.format.open_memmap(filename, mode="w+", dtype=float, shape=self.shape)
+        elif out is None:
+            out = np.empty(self.shape)
+        assert out.shape == self.shape, f"`out` must have shape {self.shape}."
+
+        for rows, sigma in self.chunks():
+            out[rows] = sigma
+
+        if isinstance(out, np.memmap):
+            out.flush()
+
+        return out
+
+    def envelope(self):
+        """
+        Stress at the extreme fibers along the span, and the exact maximum
+        `|M| * h / (2 I)` with its position (not limited to the grid).
+        """
+        fiber = self.beam.h / 2 / self.beam.I
+        moments = self.bending(self.x)
+        extrema = self.bending.extrema()
+
+        return {"x": self.x, "top": moments * fiber, "bottom": -moments * fiber,
+                "abs_max": extrema["abs_max"] * fiber, "abs_max_position": extrema["abs_max_position"]}
@@ -14,6 +14,8 @@ class Support:
     """
     """
 
+    __slots__ = ("position", "category")
+
     def __init__(self, position: float, category: SupportTypes) -> None:
         self.position = float(position)
         self.category = SupportTypes(category)
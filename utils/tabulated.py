@@ -0,0 +1,146 @@
+import hashlib
+
+import numpy as np
+
+CHUNK_SIZE = 2 ** 18  # samples read and integrated at once
+MAX_SEGMENTS = 4096  # knots of a load in the diagrams, whatever its number of samples
+
+
+class TabulatedLoad:
+    """
+    Distributed load given by samples: q(x) is linear between `(x[i], q[i])`
+    and zero outside `[x[0], x[-1]]`. `x` must be increasing. Both may be
+    memory-mapped arrays (see `from_files`); they are only read `chunk_size`
+    samples at a time, carrying V and M from one chunk to the next.
+
+    Unlike `Load`, it does not take a position on the beam: it is superposed on
+    the discrete loads and only solved by the numeric engine.
+
+    In the diagrams, the load only adds its `knots` (at most `max_segments`
+    segments) to the breakpoints, so their size does not grow with the samples.
+    V and M are exact at every breakpoint (supports included) and cubic
+    Hermite interpolants in between, which is exact wherever q is linear
+    between two breakpoints, e.g. on every segment when the load has no more
+    than `max_segments` of them.
+    """
+
+    def __init__(self, x, q, chunk_size=CHUNK_SIZE, max_segments=MAX_SEGMENTS):
+        assert len(x) == len(q) and len(x) > 1, "`x` and `q` must have the same length, at least 2."
+        self.x = x
+        self.q = q
+        self.chunk_size = int(chunk_size)
+        self.max_segments = int(max_segments)
+
+    @classmethod
+    def from_files(cls, x_filename, q_filename, chunk_size=CHUNK_SIZE, max_segments=MAX_SEGMENTS):
+        """
+        Samples from two `.npy` files, memory-mapped read-only.
+        """
+        return cls(np.load(x_filename, mmap_mode="r"), np.load(q_filename, mmap_mode="r"), chunk_size, max_segments)
+
+    @property
+    def start(self):
+        return float(self.x[0])
+
+    @property
+    def end(self):
+        return float(self.x[-1])
+
+    def __len__(self):
+        return len(self.x)
+
+    def __repr__(self):
+        return f"TabulatedLoad([{self.start}:{self.end}], {len(self)} samples)"
+
+    def chunks(self):
+        """
+        Yields `(x, q)` of consecutive blocks of samples; each block starts with
+        the last sample of the previous one, so its segments are complete.
+        """
+        for first in range(0, len(self.x) - 1, self.chunk_size):
+            last = min(first + self.chunk_size, len(self.x) - 1)
+            yield np.asarray(self.x[first:last + 1], dtype=float), np.asarray(self.q[first:last + 1], dtype=float)
+
+    def integrate(self, points):
+        """
+        q, dq/dx, V and M (V' = q, M' = V, both zero before `x[0]`) at `points`,
+        as right limits. One pass over the samples; besides the outputs, memory
+        is bounded by the chunk size.
+        """
+        points = np.asarray(points, dtype=float)
+        order = np.argsort(points.ravel(), kind="stable")
+        ordered = points.ravel()[order]
+        values = np.zeros((4, ordered.size))  # q, slope, V, M
+
+        shear, bending = 0.0, 0.0  # V and M at the start of the chunk
+        for x, q in self.chunks():
+            lengths = np.diff(x)
+            assert np.all(lengths > 0), "Sample positions must be strictly increasing."
+            slopes = np.diff(q) / lengths
+
+            increments = (q[:-1] + q[1:]) / 2 * lengths
+            shear_starts = shear + np.cumsum(increments) - increments
+            moments = shear_starts * lengths + lengths ** 2 * (2 * q[:-1] + q[1:]) / 6
+            bending_starts = bending + np.cumsum(moments) - moments
+
+            inside = slice(*np.searchsorted(ordered, [x[0], x[-1]], side="left"))
+            segment = np.searchsorted(x, ordered[inside], side="right") - 1
+            t = ordered[inside] - x[segment]
+            q_start, slope = q[segment], slopes[segment]
+            values[:, inside] = (q_start + slope * t, slope,
+                                 shear_starts[segment] + (q_start + slope * t / 2) * t,
+                                 bending_starts[segment] + (shear_starts[segment] + (q_start / 2 + slope * t / 6) * t) * t)
+
+            shear, bending = shear_starts[-1] + increments[-1], bending_starts[-1] + moments[-1]
+
+        beyond = ordered >= self.end
+        values[2, beyond] = shear
+        values[3, beyond] = bending + shear * (ordered[beyond] - self.end)
+
+        result = np.empty_like(values)
+        result[:, order] = values
+        return result.reshape((4,) + points.shape)
+
+    def responses(self, x):
+        """
+        Contribution of the load to V(x) and M(x).
+        """
+        _, _, shear, bending = self.integrate(x)
+        return shear, bending
+
+    def knots(self):
+        """
+        Every `step`-th sample position (and the last one), with `step` the
+        smallest giving at most `max_segments` segments.
+        """
+        step = -(-(len(self.x) - 1) // self.max_segments)
+        return np.unique(np.concatenate([np.asarray(self.x[::step], dtype=float), [self.end]]))
+
+    def coefs(self, breaks, order=4):
+        """
+        Coefficients of V and M on the segments of `breaks`: M is the cubic
+        matching M and V = M' at both ends of the segment (exact values from
+        `integrate`), V its derivative.
+        """
+        _, _, shear, bending = self.integrate(breaks)
+        lengths = np.diff(breaks)
+        secants = np.diff(bending) / lengths
+
+        shear_coefs, bending_coefs = np.zeros((len(lengths), order)), np.zeros((len(lengths), order))
+        bending_coefs[:, 0], bending_coefs[:, 1] = bending[:-1], shear[:-1]
+        bending_coefs[:, 2] = (3 * secants - 2 * shear[:-1] - shear[1:]) / lengths
+        bending_coefs[:, 3] = (shear[:-1] + shear[1:] - 2 * secants) / lengths ** 2
+        shear_coefs[:, :3] = bending_coefs[:, 1:4] * [1, 2, 3]
+
+        return shear_coefs, bending_coefs
+
+    def digest(self):
+        """
+        SHA-256 of the samples, read chunk by chunk (used in cache keys).
+        """
+        digest = hashlib.sha256()
+        for x, q in self.chunks():
+            digest.update(x.tobytes())
+            digest.update(q.tobytes())
+
+        return digest.hexdigest()
@@ -1,16 +1,78 @@
-import sympy as sym
+import os
+import uuid
 from datetime import datetime
 from os import linesep
 
+from .lazy import LazyModule
+
+sym = LazyModule("sympy")
+
+
+class MemorySink:
+    """
+    Keeps the flushed report in `content`.
+    """
 
-class Writer:
     def __init__(self):
-        self.file = f"reports/report_{datetime.now().strftime('%Y%d%d%H%M')}.md"
+        self.file = None
+        self.content = ""
+
+    def write(self, content: str):
+        self.content = content
+
+
+class FileSink:
+    """
+    Writes the report to a new file in `directory`; the name carries a timestamp
+    and a random suffix, so concurrent reports never share a file.
+    """
+
+    def __init__(self, directory: str = "reports"):
+        self.directory = directory
+        self.file = os.path.join(directory, f"report_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}.md")
+
+    def write(self, content: str):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.file, "w") as report:
+            report.write(content)
+
+
+class NullSink:
+    """
+    Discards the report.
+    """
+
+    file = None
+
+    def write(self, content: str):
+        pass
+
+
+class Writer:
+    """
+    Builds the report in memory; nothing reaches the sink until `flush`.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = FileSink() if sink is None else sink
+        self._buffer = []
         self._write_header()
 
+    @property
+    def file(self):
+        return self.sink.file
+
+    def _write(self, content: str):
+        self._buffer.append(content)
+
+    def getvalue(self) -> str:
+        return "".join(self._buffer)
+
+    def flush(self):
+        self.sink.write(self.getvalue())
+
     def _write_header(self):
-        with open(self.file, 'w') as report:
-            report.write("<h1 align='center'>Report: Structural Modeling by Descontinuous Functions</h1>" + linesep + "---" + linesep)
+        self._write("<h1 align='center'>Report: Structural Modeling by Descontinuous Functions</h1>" + linesep + "---" + linesep)
 
     def write_eq_equations(self):
         x = sym.Symbol("x")
@@ -24,12 +86,10 @@ class Writer:
 
     def add_section(self, name: str, level: int = 1):
         marker = "#" * level + " "
-        with open(self.file, "a") as report:
-            report.write(marker + "**" + name + "**" + linesep)
+        self._write(marker + "**" + name + "**" + linesep)
 
     def write_content(self, content):
-        with open(self.file, "a") as report:
-            report.write(content + linesep)
+        self._write(content + linesep)
             
     def _format_equation(self, equation: str, box: bool = False, center: bool = True):
         sign = "$$" if center else "$"
@@ -39,13 +99,11 @@ class Writer:
         return f"{sign}{equation}{sign}" + linesep
 
     def write_equation(self, equation: list, box: bool = False, center: bool = True):
-        with open(self.file, "a") as report:
-            for eq in equation:
-                report.write(self._format_equation(eq, box, center))
+        for eq in equation:
+            self._write(self._format_equation(eq, box, center))
 
     def add_image(self, dir: str, scale_width: str = "100%"):
-        with open(self.file, 'a') as report:
-            report.write(f'<p align="center"><img src={str(dir)} width={str(scale_width)}/></p>')
+        self._write(f'<p align="center"><img src={str(dir)} width={str(scale_width)}/></p>')
 
     def write_dict_boundaries(self, dict_boundaries: dict, x: float):
         self.write_equation([f'x \longrightarrow {x}'], box=True, center=False)